@@ -0,0 +1,199 @@
+import asyncio
+import threading
+import time
+
+from collections import deque
+from enum import Enum
+from typing import Callable, Deque, List, Optional
+
+
+class BalanceEvent:
+    """
+    Compact record of one balance change, published to the BalanceEventBus
+    """
+    __slots__ = ("key", "change", "new_balance", "reason", "timestamp")
+
+    def __init__(self, key: str, change: float, new_balance: float, reason=None, timestamp: float = None) -> None:
+        """
+        @param key: the player key whose balance changed
+        @param change: the signed change
+        @param new_balance: the balance right after the change
+        @param reason: the BalanceChangeReason, if any
+        @param timestamp: when the change happened (defaults to now)
+        """
+        self.key = key
+        self.change = change
+        self.new_balance = new_balance
+        self.reason = reason
+        self.timestamp = time.time() if timestamp is None else timestamp
+
+    def __repr__(self) -> str:
+        return f"BalanceEvent({self.key!r}, {self.change}, {self.new_balance}, {self.reason})"
+
+
+class BackpressurePolicy(Enum):
+    """What publish() does when the bus queue is full."""
+
+    BLOCK = "block"              # wait for room (up to block_timeout), then drop
+    DROP_NEWEST = "drop_newest"  # discard the event being published
+    DROP_OLDEST = "drop_oldest"  # discard the oldest queued event to make room
+
+
+class BalanceEventBus:
+    """
+    Bounded queue of BalanceEvents drained by background worker threads
+
+    Consumers that do not produce player messages (analytics, auditing, achievements...) subscribe
+    here instead of registering a BalanceObserver, so they run off the request path: publishing
+    is an O(1) append and the handlers are called later on a worker thread.
+    When the queue is full the backpressure policy decides whether the publisher waits or an
+    event is dropped; dropped events are counted.
+    """
+
+    def __init__(self, maxsize: int = 10000, policy: BackpressurePolicy = BackpressurePolicy.DROP_NEWEST, block_timeout: Optional[float] = None) -> None:
+        """
+        @param maxsize: maximum number of queued events
+        @param policy: what to do when the queue is full
+        @param block_timeout: with BLOCK, seconds to wait for room before dropping (None = wait forever)
+
+        @Preconditions:
+            - maxsize >= 1
+        """
+        assert maxsize >= 1, "maxsize must be at least 1"
+        self.maxsize = maxsize
+        self.policy = policy
+        self.block_timeout = block_timeout
+        self.handlers: List[Callable[[BalanceEvent], None]] = []
+        self.published = 0
+        self.dropped = 0
+        self.errors = 0
+        self._queue: Deque[BalanceEvent] = deque()
+        self._cond = threading.Condition()
+        self._workers: List[threading.Thread] = []
+        self._running = False
+        self._busy = 0
+
+    def subscribe(self, handler: Callable[[BalanceEvent], None]) -> None:
+        """
+        Add a handler called (on a worker thread) with every event
+
+        @param handler: callable taking one BalanceEvent; exceptions are counted and ignored
+        """
+        self.handlers.append(handler)
+
+    def subscribe_async(self, loop: asyncio.AbstractEventLoop, handler: Callable) -> None:
+        """
+        Add a coroutine handler that runs as a task on the given asyncio event loop
+
+        @param loop: the running event loop the coroutine is scheduled on
+        @param handler: async callable taking one BalanceEvent
+        """
+        self.subscribe(lambda event: asyncio.run_coroutine_threadsafe(handler(event), loop))
+
+    def publish(self, event: BalanceEvent) -> bool:
+        """
+        Queue an event for the handlers
+
+        @Returns:
+            bool: False if the event was dropped because the queue was full
+        """
+        with self._cond:
+            if len(self._queue) >= self.maxsize:
+                if self.policy == BackpressurePolicy.DROP_OLDEST:
+                    self._queue.popleft()
+                    self.dropped += 1
+                elif self.policy == BackpressurePolicy.BLOCK and self._running:
+                    if not self._cond.wait_for(lambda: len(self._queue) < self.maxsize, self.block_timeout):
+                        self.dropped += 1
+                        return False
+                else:
+                    self.dropped += 1
+                    return False
+            self._queue.append(event)
+            self.published += 1
+            self._cond.notify_all()
+        return True
+
+    def start(self, workers: int = 1) -> None:
+        """
+        Start the worker threads that drain the queue
+
+        @param workers: number of threads (events may be handled out of order with more than one)
+        """
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+        for i in range(workers):
+            thread = threading.Thread(target=self._work, name=f"balance-events-{i}", daemon=True)
+            self._workers.append(thread)
+            thread.start()
+
+    def stop(self, drain: bool = True) -> None:
+        """
+        Stop the worker threads
+
+        @param drain: handle the events still queued before stopping (otherwise they are discarded);
+                      events no worker is left to handle, e.g. if start() was never called, are
+                      handled on the calling thread
+        """
+        with self._cond:
+            if drain:
+                self._cond.wait_for(lambda: (not self._queue and self._busy == 0)
+                                    or not any(thread.is_alive() for thread in self._workers))
+            else:
+                self._queue.clear()
+            self._running = False
+            self._cond.notify_all()
+        for thread in self._workers:
+            thread.join()
+        self._workers.clear()
+        while drain:
+            with self._cond:
+                if not self._queue:
+                    return
+                event = self._queue.popleft()
+                self._cond.notify_all()
+            failures = self._handle(event)
+            with self._cond:
+                self.errors += failures
+
+    def pending(self) -> int:
+        """
+        @Returns:
+            int: the number of events waiting to be handled
+        """
+        return len(self._queue)
+
+    def _work(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._queue or not self._running)
+                if not self._queue:
+                    return
+                event = self._queue.popleft()
+                self._busy += 1
+                self._cond.notify_all()
+            failures = 0
+            try:
+                failures = self._handle(event)
+            finally:
+                with self._cond:
+                    self.errors += failures
+                    self._busy -= 1
+                    self._cond.notify_all()
+
+    def _handle(self, event: BalanceEvent) -> int:
+        """
+        Call every handler with the event
+
+        @Returns:
+            int: the number of handlers that raised
+        """
+        failures = 0
+        for handler in self.handlers:
+            try:
+                handler(event)
+            except Exception:
+                failures += 1
+        return failures
@@ -0,0 +1,85 @@
+from array import array
+from typing import List, Tuple
+
+
+class BalanceHistory:
+    """
+    Bounded history of one player's balance changes with running statistics
+
+    The last `capacity` changes are kept in a ring buffer made of three parallel typed arrays
+    (amount in cents, reason code, timestamp), so memory per player is fixed no matter how
+    long they play. The statistics cover every change since the history was created and are
+    updated in O(1) per change:
+        - net: the session's net change
+        - max_drawdown: the largest drop of the running net from its previous peak
+        - wins / losses: count of positive / non-positive changes per reason code
+
+    Reason codes are small integers chosen by the caller (BalanceManager uses 0 for no reason).
+    """
+
+    def __init__(self, capacity: int = 64, reason_count: int = 8) -> None:
+        """
+        @param capacity: number of recent changes kept
+        @param reason_count: number of distinct reason codes (codes are 0 .. reason_count - 1)
+
+        @Preconditions:
+            - capacity >= 1 and reason_count >= 1
+        """
+        assert capacity >= 1, "capacity must be at least 1"
+        assert reason_count >= 1, "reason_count must be at least 1"
+        self.capacity = capacity
+        self._amounts = array('q', bytes(8 * capacity))
+        self._reasons = array('B', bytes(capacity))
+        self._times = array('d', bytes(8 * capacity))
+        self._next = 0    # ring position the next change is written to
+        self.count = 0    # changes recorded since creation
+
+        self.net = 0
+        self.peak = 0
+        self.max_drawdown = 0
+        self.wins = array('l', bytes(array('l').itemsize * reason_count))
+        self.losses = array('l', bytes(array('l').itemsize * reason_count))
+
+    def record(self, cents: int, reason_code: int, timestamp: float) -> None:
+        """
+        Add one change to the ring buffer and the running statistics
+
+        @param cents: signed change in cents
+        @param reason_code: the caller's code for the reason of the change
+        @param timestamp: when the change happened (seconds since the epoch)
+        """
+        position = self._next
+        self._amounts[position] = cents
+        self._reasons[position] = reason_code
+        self._times[position] = timestamp
+        self._next = (position + 1) % self.capacity
+        self.count += 1
+
+        self.net += cents
+        if self.net > self.peak:
+            self.peak = self.net
+        elif self.peak - self.net > self.max_drawdown:
+            self.max_drawdown = self.peak - self.net
+        if cents > 0:
+            self.wins[reason_code] += 1
+        else:
+            self.losses[reason_code] += 1
+
+    def recent(self, n: int = None) -> List[Tuple[int, int, float]]:
+        """
+        @param n: maximum number of changes to return (defaults to all that are kept)
+        @Returns:
+            List[Tuple[int, int, float]]: (cents, reason code, timestamp) tuples, newest first
+        """
+        kept = min(self.count, self.capacity)
+        if n is None or n > kept:
+            n = kept
+        result = []
+        position = self._next
+        for _ in range(n):
+            position = (position - 1) % self.capacity
+            result.append((self._amounts[position], self._reasons[position], self._times[position]))
+        return result
+
+    def __len__(self) -> int:
+        return min(self.count, self.capacity)
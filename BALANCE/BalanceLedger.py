@@ -0,0 +1,184 @@
+import atexit
+import json
+import os
+import threading
+import time
+
+from typing import Dict, List, Optional
+
+
+class BalanceLedger:
+    """
+    Append-only write-ahead log of balance mutations with periodic compact snapshots
+
+    Every increase/decrease is appended to an in-memory batch which is written and fsynced
+    as a whole once it holds flush_every records or flush_interval seconds have passed, so a
+    burst of mutations costs one disk write instead of one per call. A daemon thread writes
+    a batch that reaches flush_interval without any further record() calls.
+    A snapshot stores every balance together with the sequence number of the last record it
+    includes; startup loads the latest snapshot and only replays the log records after it.
+
+    Files (inside directory):
+        ledger.log     one JSON array per line: [seq, key, amount, reason, timestamp]
+        snapshot.json  {"seq": <last seq included>, "balances": {key: balance}}
+    """
+    LOG_NAME = "ledger.log"
+    SNAPSHOT_NAME = "snapshot.json"
+
+    def __init__(self, directory: str, flush_every: int = 256, flush_interval: float = 0.5, snapshot_every: int = 10000) -> None:
+        """
+        @param directory: folder holding the log and snapshot files (created if missing)
+        @param flush_every: number of buffered records that forces a write + fsync
+        @param flush_interval: maximum age in seconds of a buffered record before it is written
+        @param snapshot_every: number of records after which a new snapshot is due
+
+        @Preconditions:
+            - flush_every, snapshot_every >= 1 and flush_interval >= 0
+        """
+        assert flush_every >= 1, "flush_every must be at least 1"
+        assert snapshot_every >= 1, "snapshot_every must be at least 1"
+        assert flush_interval >= 0, "flush_interval must be non-negative"
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.log_path = os.path.join(directory, self.LOG_NAME)
+        self.snapshot_path = os.path.join(directory, self.SNAPSHOT_NAME)
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self.snapshot_every = snapshot_every
+
+        self.seq = 0
+        self._since_snapshot = 0
+        self._pending: List[str] = []
+        self._pending_since = 0.0  # monotonic time the oldest buffered record was added
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)  # signals the flusher thread
+        self._flusher: Optional[threading.Thread] = None  # started with the first buffered record
+        self._log = open(self.log_path, "a", encoding="utf-8")
+        atexit.register(self.close)
+
+    def load(self, default_balance: float = 1000.0) -> Dict[str, float]:
+        """
+        Rebuild the balances from the latest snapshot plus the log tail written after it
+
+        A torn last line (crash in the middle of a write) is ignored
+
+        @param default_balance: the balance a player starts with before their first logged change
+        @Returns:
+            Dict[str, float]: the recovered balance for every known player key
+        """
+        balances: Dict[str, float] = {}
+        snapshot_seq = 0
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, encoding="utf-8") as f:
+                snapshot = json.load(f)
+            snapshot_seq = snapshot["seq"]
+            balances.update(snapshot["balances"])
+
+        last_seq = snapshot_seq
+        replayed = 0
+        good_end = 0
+        with open(self.log_path, "rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    seq, key, amount, _reason, _ts = json.loads(line)
+                except ValueError:
+                    break
+                good_end += len(line)
+                if seq <= snapshot_seq:
+                    continue
+                balances[key] = balances.get(key, default_balance) + amount
+                last_seq = seq
+                replayed += 1
+
+        with self._lock:
+            # drop a torn tail so new records are not appended onto a partial line
+            if good_end < os.path.getsize(self.log_path):
+                self._log.truncate(good_end)
+            self.seq = last_seq
+            self._since_snapshot = replayed
+        return balances
+
+    def record(self, key: str, amount: float, reason: Optional[str] = None) -> bool:
+        """
+        Append one balance mutation to the log batch
+
+        @param key: the player key whose balance changed
+        @param amount: the signed change (negative for decreases)
+        @param reason: the BalanceChangeReason value, if any
+        @Returns:
+            bool: True if a snapshot is due (see snapshot())
+        """
+        with self._lock:
+            self.seq += 1
+            self._since_snapshot += 1
+            if not self._pending:
+                self._pending_since = time.monotonic()
+                self._wakeup.notify()
+            self._pending.append(json.dumps([self.seq, key, amount, reason, round(time.time(), 3)], separators=(",", ":")))
+            if len(self._pending) >= self.flush_every or time.monotonic() - self._pending_since >= self.flush_interval:
+                self._flush_locked()
+            elif self._flusher is None:
+                self._flusher = threading.Thread(target=self._run_flusher, name="BalanceLedger flusher", daemon=True)
+                self._flusher.start()
+            return self._since_snapshot >= self.snapshot_every
+
+    def flush(self) -> None:
+        """Write and fsync every buffered record"""
+        with self._lock:
+            self._flush_locked()
+
+    def _run_flusher(self) -> None:
+        """Flusher thread: write the batch once its oldest record is flush_interval old, until close()"""
+        with self._lock:
+            while not self._log.closed:
+                if not self._pending:
+                    self._wakeup.wait()
+                    continue
+                remaining = self._pending_since + self.flush_interval - time.monotonic()
+                if remaining > 0:
+                    self._wakeup.wait(remaining)
+                else:
+                    self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if not self._pending or self._log.closed:
+            return
+        self._log.write("\n".join(self._pending) + "\n")
+        self._pending.clear()
+        self._log.flush()
+        os.fsync(self._log.fileno())
+
+    def snapshot(self, balances: Dict[str, float]) -> None:
+        """
+        Atomically write a snapshot of all balances and compact the log
+
+        The snapshot is written to a temporary file and renamed over the old one, so a crash
+        leaves either the old or the new snapshot; records it already covers are skipped on load
+
+        @param balances: the current balance for every player key
+        """
+        with self._lock:
+            self._flush_locked()
+            tmp_path = self.snapshot_path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"seq": self.seq, "balances": dict(balances.items())}, f, separators=(",", ":"))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.snapshot_path)
+            # everything in the log is now covered by the snapshot
+            self._log.truncate(0)
+            self._since_snapshot = 0
+
+    def close(self) -> None:
+        """Flush pending records and close the log file"""
+        with self._lock:
+            if self._log.closed:
+                return
+            self._flush_locked()
+            self._log.close()
+            self._wakeup.notify()
+        if self._flusher is not None and self._flusher is not threading.current_thread():
+            self._flusher.join()
+        atexit.unregister(self.close)
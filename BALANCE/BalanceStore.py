@@ -0,0 +1,281 @@
+import json
+import mmap
+import os
+import threading
+
+from array import array
+from collections.abc import MutableMapping
+from typing import Dict, Iterator, List, Optional
+
+
+def to_cents(amount: float) -> int:
+    """
+    Convert a dollar amount to integer cents, rounding to the nearest cent
+
+    @param amount: the amount in dollars (e.g. 17.0)
+    @Returns:
+        int: the amount in cents (e.g. 1700)
+    """
+    return int(round(amount * 100))
+
+
+class BalanceStore(MutableMapping):
+    """
+    Fixed-point balance store: player key -> balance, kept as int64 cents in one dense buffer
+
+    Every player is given a slot index the first time they are stored; the balances themselves
+    live in an array('q') (or, if a path is given, a memory-mapped file of int64s), so there is
+    no float object per player and repeated debits never drift.
+    Removed players free their slot for reuse.
+
+    Reads and writes through the mapping interface use dollars (floats) so the store can stand in
+    for the plain dict BalanceManager used to keep; the *_cents methods skip the conversion.
+
+    Indexes (objects with update(key, cents), remove(key) and clear(), e.g. BalanceLeaderboard)
+    can be attached with add_index() and are told about every write.
+    """
+    ITEM_SIZE = 8
+
+    def __init__(self, path: Optional[str] = None, capacity: int = 1024) -> None:
+        """
+        @param path: optional file to memory-map the cents buffer to; the key index is kept
+                     next to it in <path>.keys (written by flush()) and every slot assigned or
+                     freed since is appended to <path>.keys.log as it happens
+        @param capacity: number of slots to preallocate (the buffer doubles when full)
+
+        @Preconditions:
+            - capacity >= 1
+        """
+        assert capacity >= 1, "capacity must be at least 1"
+        self.path = path
+        self._slots: Dict[str, int] = {}
+        self._keys: List[Optional[str]] = []  # slot index -> key (None when the slot is free)
+        self._free: List[int] = []
+        self._lock = threading.Lock()  # guards slot allocation, buffer growth and every write
+        self._mmap: Optional[mmap.mmap] = None
+        self._key_log = None  # append-only (slot, key) journal of a mapped store
+        self._retired: List[tuple] = []  # superseded (view, mapping) pairs of a grown mapped store
+        self._indexes: list = []
+        if path is None:
+            self._cents = array('q', bytes(self.ITEM_SIZE * capacity))
+        else:
+            self._open_mapped(capacity)
+
+    # MAPPING INTERFACE (DOLLARS)
+
+    def __getitem__(self, key: str) -> float:
+        return self._cents[self._slots[key]] / 100
+
+    def __setitem__(self, key: str, value: float) -> None:
+        self.set_cents(key, to_cents(value))
+
+    def __delitem__(self, key: str) -> None:
+        with self._lock:
+            slot = self._slots.pop(key)
+            self._keys[slot] = None
+            self._cents[slot] = 0
+            self._free.append(slot)
+            self._log_key(slot, None)
+        for index in self._indexes:
+            index.remove(key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._slots
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._slots))
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def clear(self) -> None:
+        """Remove every player and release all slots"""
+        with self._lock:
+            self._slots.clear()
+            self._keys.clear()
+            self._free.clear()
+            for slot in range(len(self._cents)):
+                self._cents[slot] = 0
+            if self._mmap is not None:
+                self._write_keys()
+        for index in self._indexes:
+            index.clear()
+
+    # FIXED-POINT ACCESS
+
+    def slot_of(self, key: str) -> int:
+        """
+        @Returns:
+            int: the dense slot index of the key, allocating one if the key is new
+        """
+        slot = self._slots.get(key)
+        if slot is None:
+            with self._lock:
+                slot = self._allocate(key)
+        return slot
+
+    def get_cents(self, key: str) -> int:
+        return self._cents[self._slots[key]]
+
+    def set_cents(self, key: str, cents: int) -> None:
+        with self._lock:
+            slot = self._allocate(key)  # may grow (and replace) the buffer
+            self._cents[slot] = cents
+        for index in self._indexes:
+            index.update(key, cents)
+
+    def add_cents(self, key: str, cents: int) -> int:
+        """
+        Add a signed number of cents to the key's balance
+
+        @Preconditions:
+            - key is already stored
+        @Returns:
+            int: the new balance in cents
+        """
+        with self._lock:
+            slot = self._slots[key]
+            new_cents = self._cents[slot] + cents
+            self._cents[slot] = new_cents
+        for index in self._indexes:
+            index.update(key, new_cents)
+        return new_cents
+
+    def add_index(self, index) -> None:
+        """
+        Attach an index that is kept up to date with every write; it is filled with the current entries
+
+        @param index: object with update(key, cents), remove(key) and clear() methods
+        """
+        for key, slot in list(self._slots.items()):
+            index.update(key, self._cents[slot])
+        self._indexes.append(index)
+
+    # BULK OPERATIONS
+
+    def total_cents(self) -> int:
+        """
+        @Returns:
+            int: the sum of every stored balance in cents (free slots hold 0)
+        """
+        return sum(self._cents)
+
+    def credit_all(self, cents: int) -> None:
+        """
+        Add the same number of cents to every stored balance (e.g. a promotion)
+
+        @param cents: the signed amount to add to each player
+        """
+        with self._lock:
+            for slot in self._slots.values():
+                self._cents[slot] += cents
+            updated = [(key, self._cents[slot]) for key, slot in self._slots.items()]
+        for key, new_cents in updated:
+            for index in self._indexes:
+                index.update(key, new_cents)
+
+    def as_numpy(self):
+        """
+        Zero-copy NumPy view of the cents buffer, indexed by slot_of(); free slots hold 0
+
+        Requires NumPy, which is optional for the rest of the store
+        """
+        import numpy as np
+        return np.frombuffer(self._cents, dtype=np.int64)
+
+    def flush(self) -> None:
+        """Persist a memory-mapped store (buffer and key index); a no-op for in-memory stores"""
+        if self._mmap is None:
+            return
+        with self._lock:
+            self._mmap.flush()
+            self._write_keys()
+
+    def close(self) -> None:
+        """Flush and unmap a memory-mapped store"""
+        if self._mmap is None:
+            return
+        self.flush()
+        with self._lock:
+            for view, mapping in self._retired + [(self._cents, self._mmap)]:
+                view.release()
+                mapping.close()
+            self._retired.clear()
+            self._mmap = None
+            self._key_log.close()
+            self._key_log = None
+
+    # INTERNALS
+
+    def _allocate(self, key: str) -> int:
+        """Return the key's slot, assigning a free one if the key is new (caller holds _lock)"""
+        slot = self._slots.get(key)
+        if slot is not None:
+            return slot
+        if self._free:
+            slot = self._free.pop()
+            self._keys[slot] = key
+        else:
+            slot = len(self._keys)
+            if slot >= len(self._cents):
+                self._grow(2 * len(self._cents))
+            self._keys.append(key)
+        self._cents[slot] = 0
+        self._slots[key] = slot
+        self._log_key(slot, key)
+        return slot
+
+    def _grow(self, capacity: int) -> None:
+        if self._mmap is None:
+            self._cents.extend(array('q', bytes(self.ITEM_SIZE * (capacity - len(self._cents)))))
+            return
+        # A thread may still be reading through the old view without holding the lock; it is kept
+        # open until close() and, being a shared mapping of the same file, it sees the same data.
+        self._retired.append((self._cents, self._mmap))
+        self._map_file(capacity)
+
+    def _open_mapped(self, capacity: int) -> None:
+        keys_path = self.path + ".keys"
+        if os.path.exists(keys_path):
+            with open(keys_path, encoding="utf-8") as f:
+                self._keys = json.load(f)
+        # slots assigned or freed after the last flush()
+        log_path = self.path + ".keys.log"
+        if os.path.exists(log_path):
+            with open(log_path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        slot, key = json.loads(line)
+                    except ValueError:
+                        break  # a line cut short by a crash ends the log
+                    self._keys.extend([None] * (slot + 1 - len(self._keys)))
+                    self._keys[slot] = key
+        for slot, key in enumerate(self._keys):
+            if key is None:
+                self._free.append(slot)
+            else:
+                self._slots[key] = slot
+        existing = os.path.getsize(self.path) // self.ITEM_SIZE if os.path.exists(self.path) else 0
+        self._map_file(max(capacity, existing, len(self._keys)))
+        self._key_log = open(log_path, "a", encoding="utf-8")
+
+    def _log_key(self, slot: int, key: Optional[str]) -> None:
+        """Append a slot assignment (or, with key None, a freed slot) to the key log of a mapped store"""
+        if self._key_log is not None:
+            self._key_log.write(json.dumps([slot, key]) + "\n")
+            self._key_log.flush()
+
+    def _write_keys(self) -> None:
+        """Replace <path>.keys with the current key index and empty the key log (caller holds _lock)"""
+        tmp_path = self.path + ".keys.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._keys, f)
+        os.replace(tmp_path, self.path + ".keys")
+        self._key_log.truncate(0)
+
+    def _map_file(self, capacity: int) -> None:
+        with open(self.path, "a+b") as f:
+            if os.path.getsize(self.path) < capacity * self.ITEM_SIZE:
+                f.truncate(capacity * self.ITEM_SIZE)
+            self._mmap = mmap.mmap(f.fileno(), capacity * self.ITEM_SIZE)
+        self._cents = memoryview(self._mmap).cast('q')
@@ -0,0 +1,146 @@
+import random
+import threading
+
+from typing import Dict, List, Optional, Tuple
+
+
+class _Infinity:
+    """Sentinel value of the skiplist's tail node, greater than every entry"""
+    def __lt__(self, other) -> bool:
+        return False
+
+    def __le__(self, other) -> bool:
+        return False
+
+
+class _Node:
+    __slots__ = ("value", "next", "width")
+
+    def __init__(self, value, next_nodes: list, widths: list) -> None:
+        self.value = value
+        self.next = next_nodes
+        self.width = widths  # width[level] = positions skipped by following next[level]
+
+
+class BalanceLeaderboard:
+    """
+    Incrementally maintained ranking of balances, richest first
+
+    Entries are kept in an indexable skiplist ordered by (-cents, key), so every balance
+    change is an O(log n) remove + insert, the top K are read in O(K) and a player's rank
+    is found in O(log n) without ever sorting all balances.
+
+    It is attached to a BalanceStore as an index and updated by the store on every write.
+    """
+    MAX_LEVELS = 32
+
+    def __init__(self) -> None:
+        self._nil = _Node(_Infinity(), [], [])
+        self._head = _Node(None, [self._nil] * self.MAX_LEVELS, [1] * self.MAX_LEVELS)
+        self._entries: Dict[str, Tuple[int, str]] = {}
+        self._lock = threading.Lock()
+        self._rng = random.Random()  # level coin flips, kept off the games' shared RNG
+
+    # INDEX INTERFACE (called by BalanceStore)
+
+    def update(self, key: str, cents: int) -> None:
+        """Move the key to its position for the given balance in cents"""
+        value = (-cents, key)
+        with self._lock:
+            old = self._entries.get(key)
+            if old == value:
+                return
+            if old is not None:
+                self._remove(old)
+            self._insert(value)
+            self._entries[key] = value
+
+    def remove(self, key: str) -> None:
+        """Drop the key from the ranking"""
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._remove(old)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._head = _Node(None, [self._nil] * self.MAX_LEVELS, [1] * self.MAX_LEVELS)
+            self._entries.clear()
+
+    # QUERIES
+
+    def top(self, k: int) -> List[Tuple[str, int]]:
+        """
+        @param k: number of entries to return
+        @Returns:
+            List[Tuple[str, int]]: up to k (key, cents) pairs, richest first
+        """
+        result = []
+        with self._lock:
+            node = self._head.next[0]
+            while node is not self._nil and len(result) < k:
+                result.append((node.value[1], -node.value[0]))
+                node = node.next[0]
+        return result
+
+    def rank_of(self, key: str) -> Optional[int]:
+        """
+        @Returns:
+            Optional[int]: the 1-based rank of the key (1 = richest), or None if it is not ranked
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                return None
+            position = 0
+            node = self._head
+            for level in reversed(range(self.MAX_LEVELS)):
+                while node.next[level].value < value:
+                    position += node.width[level]
+                    node = node.next[level]
+            return position + 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # SKIPLIST
+
+    def _insert(self, value: Tuple[int, str]) -> None:
+        chain = [None] * self.MAX_LEVELS
+        steps_at_level = [0] * self.MAX_LEVELS
+        node = self._head
+        for level in reversed(range(self.MAX_LEVELS)):
+            while node.next[level].value < value:
+                steps_at_level[level] += node.width[level]
+                node = node.next[level]
+            chain[level] = node
+
+        levels = 1
+        while levels < self.MAX_LEVELS and self._rng.random() < 0.5:
+            levels += 1
+        new_node = _Node(value, [None] * levels, [0] * levels)
+        steps = 0
+        for level in range(levels):
+            prev = chain[level]
+            new_node.next[level] = prev.next[level]
+            prev.next[level] = new_node
+            new_node.width[level] = prev.width[level] - steps
+            prev.width[level] = steps + 1
+            steps += steps_at_level[level]
+        for level in range(levels, self.MAX_LEVELS):
+            chain[level].width[level] += 1
+
+    def _remove(self, value: Tuple[int, str]) -> None:
+        chain = [None] * self.MAX_LEVELS
+        node = self._head
+        for level in reversed(range(self.MAX_LEVELS)):
+            while node.next[level].value < value:
+                node = node.next[level]
+            chain[level] = node
+        target = chain[0].next[0]
+        for level in range(len(target.next)):
+            prev = chain[level]
+            prev.width[level] += target.width[level] - 1
+            prev.next[level] = target.next[level]
+        for level in range(len(target.next), self.MAX_LEVELS):
+            chain[level].width[level] -= 1
@@ -10,7 +10,18 @@ if TYPE_CHECKING:
     from tiles.map_objects import *
 
 from enum import Enum
-from typing import Optional, List, Dict
+from collections import OrderedDict
+from typing import Optional, List, Dict, Tuple, Union
+
+import threading
+import time
+
+from .BalanceEventBus import BalanceEvent, BalanceEventBus
+from .BalanceHistory import BalanceHistory
+from .BalanceLedger import BalanceLedger
+from .BalanceStore import BalanceStore, to_cents
+from .Leaderboard import BalanceLeaderboard
+from .TieredBalanceStore import TieredBalanceStore
 
 
 #DETERMINES THE CAUSE OF BALANCE CHANGES
@@ -26,6 +37,10 @@ class BalanceChangeReason(Enum):
     TIE = "tie"
 
 
+class InsufficientFundsError(Exception):
+    """Raised when a balance transaction would take a player's balance below zero"""
+
+
 #OBSERVER - EVERY OBSERVER WILL HAVE TO HAVE AN update_balance METHOD
 class BalanceObserver(ABC):
     """Observer interface for receiving balance change notifications."""
@@ -46,6 +61,13 @@ class BalanceManager:
     Singleton manager for per-player balances and observer notifications.
     """
     __instance = None
+    DEFAULT_BALANCE = 1000.0
+    LOCK_STRIPES = 64
+    HISTORY_SIZE = 64
+    OBSERVER_POOL_SIZE = 4096
+    # compact reason codes used by BalanceHistory (0 = no reason given)
+    REASON_CODES: Dict[Optional[BalanceChangeReason], int] = {None: 0, **{reason: code for code, reason in enumerate(BalanceChangeReason, start=1)}}
+    REASONS_BY_CODE: List[Optional[BalanceChangeReason]] = [None] + list(BalanceChangeReason)
 
     def __new__(cls):
         if cls.__instance is None:
@@ -55,33 +77,227 @@ class BalanceManager:
     def __init__(self):
         if not hasattr(self, 'initialized'):
             #self.balance = 1000.0
-            self.balances: Dict[str, float] = {}
-            self.observers: List[BalanceObserver] = []  # List of BalanceObserver objects
+            # player key -> balance, stored as integer cents in a dense buffer
+            self.balances: BalanceStore = BalanceStore()
+            # ranking of every balance, updated by the store on each write (the store itself
+            # when it is a TieredBalanceStore, see use_store)
+            self.leaderboard: Union[BalanceLeaderboard, TieredBalanceStore] = BalanceLeaderboard()
+            self.balances.add_index(self.leaderboard)
+            # bounded per-player history of recent changes with running statistics
+            self.histories: Dict[str, BalanceHistory] = {}
+            # cached (SoundEffectObserver, BalanceEffectObserver) pairs keyed by (player key, id(sender)),
+            # least recently used first, and the number of open subscriptions using each pair
+            self._observer_pool: "OrderedDict[Tuple[str, int], Tuple[SoundEffectObserver, BalanceEffectObserver]]" = OrderedDict()
+            self._subscriptions: Dict[Tuple[str, int], int] = {}
+            # the pool is shared by every player, so it and _subscriptions have their own lock
+            # (taken inside the player's stripe lock, never the other way around)
+            self._observer_lock = threading.Lock()
+            # Global observers are notified for every player; an insertion-ordered dict acts as an O(1) set
+            self.observers: Dict[BalanceObserver, None] = {}
+            # Per-player observers, keyed by player key and then by reason (None = every reason)
+            self.player_observers: Dict[str, Dict[Optional[BalanceChangeReason], Dict[BalanceObserver, None]]] = {}
+            # Optional write-ahead log every mutation is recorded to (see attach_ledger)
+            self.ledger: Optional[BalanceLedger] = None
+            # Optional asynchronous bus every change is published to (see attach_event_bus)
+            self.event_bus: Optional[BalanceEventBus] = None
+            # Balance updates are serialised per player key through a fixed set of striped locks,
+            # so commands for different players can run on separate threads without a global lock
+            self._locks: List[threading.RLock] = [threading.RLock() for _ in range(self.LOCK_STRIPES)]
             self.initialized = True
 
+    def attach_ledger(self, ledger: BalanceLedger) -> None:
+        """
+        Restore the balances persisted by the ledger and record every following mutation to it
+
+        @param ledger: the BalanceLedger to recover from and append to
+        """
+        self.balances.update(ledger.load(default_balance=self.DEFAULT_BALANCE))
+        self.ledger = ledger
+
+    def detach_ledger(self) -> None:
+        """Write a final snapshot, close the attached ledger and stop recording mutations"""
+        if self.ledger is not None:
+            self._snapshot()
+            self.ledger.close()
+            self.ledger = None
+
+    def use_store(self, store) -> None:
+        """
+        Swap the storage backing the balances, e.g. for a TieredBalanceStore in a long-running world
+
+        Players held by the current store are copied into the new one and the leaderboard is rebuilt
+        from it. A TieredBalanceStore answers the leaderboard queries itself from SQLite, and the
+        history of a player moved to its cold tier is dropped, so per-player memory is bounded by
+        the hot tier.
+
+        @param store: a BalanceStore or TieredBalanceStore
+        """
+        for lock in self._locks:
+            lock.acquire()
+        try:
+            for key, balance in self.balances.items():
+                store[key] = balance
+            if isinstance(store, TieredBalanceStore):
+                self.leaderboard = store
+                store.add_evict_listener(lambda key: self.histories.pop(key, None))
+            else:
+                self.leaderboard = BalanceLeaderboard()
+                store.add_index(self.leaderboard)
+            self.balances = store
+        finally:
+            for lock in reversed(self._locks):
+                lock.release()
+
+    def attach_event_bus(self, bus: BalanceEventBus) -> None:
+        """
+        Publish a BalanceEvent to the bus after every balance change
+
+        Consumers that do not produce player messages should subscribe to the bus instead of
+        registering an observer, so they run on the bus's worker threads and not in the command.
+
+        @param bus: the BalanceEventBus to publish to (started by the caller)
+        """
+        self.event_bus = bus
+
+    def detach_event_bus(self) -> None:
+        """Stop publishing balance changes"""
+        self.event_bus = None
+
+    def _record(self, key: str, amount: float, reason: Optional[BalanceChangeReason]) -> bool:
+        """
+        Append a mutation to the ledger (if any)
+
+        @Returns:
+            bool: True if a snapshot is due; the caller takes it once it has released its stripe lock
+        """
+        return self.ledger is not None and self.ledger.record(key, amount, reason.value if reason else None)
+
+    def _snapshot(self) -> None:
+        """Write a ledger snapshot while holding every stripe, so it matches the ledger sequence exactly"""
+        for lock in self._locks:
+            lock.acquire()
+        try:
+            if self.ledger is not None:
+                self.ledger.snapshot(self.balances)
+        finally:
+            for lock in reversed(self._locks):
+                lock.release()
+
+    def _lock_for(self, key: str) -> threading.RLock:
+        """
+        @Returns:
+            threading.RLock: the stripe lock guarding the given player key
+        """
+        return self._locks[hash(key) % len(self._locks)]
+
+
+    def observing(self, player: "HumanPlayer", sender: object = None) -> "ObserverSubscription":
+        """
+        Scoped subscription of the standard sound and dialogue observers for one player
+
+        The observer pair for a (player, sender) combination is built once and reused by every
+        later interaction; it is registered when the scope is entered and unregistered when it
+        is left, including on early returns and exceptions. Nested scopes for the same pair
+        share one registration.
+
+        Usage:
+            with BalanceManager().observing(player, sender=self):
+                messages.extend(bm.decrease_balance(...))
+
+        @param player: The player whose balance changes produce the messages
+        @param sender: The sender of the BalanceEffectObserver's dialogue messages
+        @Returns:
+            ObserverSubscription: the context manager holding the subscription
+        """
+        return ObserverSubscription(self, player, sender)
+
+    def _acquire_observers(self, player: "HumanPlayer", sender: object) -> Tuple[str, int]:
+        """Register the pooled observer pair for a new subscription and return its pool key"""
+        pool_key = (self._get_key(player), id(sender))
+        with self._lock_for(pool_key[0]), self._observer_lock:
+            pair = self._observer_pool.get(pool_key)
+            # a pair built without a sender is its own sender; otherwise id(sender) may have been reused
+            if pair is None or (sender is not None and pair[1].sender is not sender):
+                pair = (SoundEffectObserver(player), BalanceEffectObserver(sender, player))
+                self._observer_pool[pool_key] = pair
+            self._observer_pool.move_to_end(pool_key)
+            # the same player may reconnect as a new object
+            pair[0].player = pair[1].player = player
+            count = self._subscriptions.get(pool_key, 0)
+            if count == 0:
+                for observer in pair:
+                    self.register_observer(observer, player=player)
+            self._subscriptions[pool_key] = count + 1
+            self._trim_observer_pool()
+        return pool_key
+
+    def _release_observers(self, pool_key: Tuple[str, int], player: "HumanPlayer") -> None:
+        """Close one subscription; the pair is unregistered (but kept cached) when none remain"""
+        with self._lock_for(pool_key[0]), self._observer_lock:
+            count = self._subscriptions.get(pool_key, 0) - 1
+            if count > 0:
+                self._subscriptions[pool_key] = count
+                return
+            self._subscriptions.pop(pool_key, None)
+            pair = self._observer_pool.get(pool_key)
+            if pair is not None:
+                for observer in pair:
+                    self.unregister_observer(observer, player=player)
+
+    def _trim_observer_pool(self) -> None:
+        """Evict least recently used pairs that are not in use once the pool is over its size (caller holds _observer_lock)"""
+        while len(self._observer_pool) > self.OBSERVER_POOL_SIZE:
+            for pool_key in self._observer_pool:
+                if pool_key not in self._subscriptions:
+                    del self._observer_pool[pool_key]
+                    break
+            else:
+                return
 
-    def register_observer(self, observer: BalanceObserver) -> None:
+    def register_observer(self, observer: BalanceObserver, player: Optional["HumanPlayer"] = None, reason: Optional[BalanceChangeReason] = None) -> None:
         """
         Register an observer to be notified on balance changes
 
+        If a player is given the observer only hears about that player's balance changes
+        (optionally only those with the given reason), otherwise it hears about every player
+
         :param observer: The observer to register
+        :param player: The player whose balance changes the observer is interested in
+        :param reason: Only notify the observer for this reason (requires a player)
 
         @Preconditions:
             - observer must implement BalanceObserver
+            - reason is only given together with a player
         """
         assert isinstance(observer, BalanceObserver), "observer must be BalanceObserver"
-        if observer not in self.observers:
-            self.observers.append(observer)
-
-    def unregister_observer(self, observer: BalanceObserver) -> None:
-        """Removes Observer from the list observers"""
-        if observer in self.observers:
-            self.observers.remove(observer)
+        if player is None:
+            assert reason is None, "reason filtering requires a player"
+            self.observers[observer] = None
+            return
+        by_reason = self.player_observers.setdefault(self._get_key(player), {})
+        by_reason.setdefault(reason, {})[observer] = None
+
+    def unregister_observer(self, observer: BalanceObserver, player: Optional["HumanPlayer"] = None, reason: Optional[BalanceChangeReason] = None) -> None:
+        """Removes Observer from the observers it was registered with (same player and reason)"""
+        if player is None:
+            self.observers.pop(observer, None)
+            return
+        key = self._get_key(player)
+        by_reason = self.player_observers.get(key)
+        if by_reason is None:
+            return
+        bucket = by_reason.get(reason)
+        if bucket is not None:
+            bucket.pop(observer, None)
+            if not bucket:
+                del by_reason[reason]
+        if not by_reason:
+            del self.player_observers[key]
 
     #USED TO NOTIFY THE OBSERVERS OF A CHANGE IN BALANCE
     def notify_observers(self, change: float, reason: BalanceChangeReason = None, player: Optional["HumanPlayer"] = None) -> List:
         """
-        Notify all registered observers of a balance change
+        Notify the global observers and the given player's observers of a balance change
 
         @param change (float): The change in balance.
         @param reason (BalanceChangeReason, optional): The reason for the change
@@ -91,14 +307,33 @@ class BalanceManager:
             List: A list of messages returned by the observers
         """
 
+        return self._notify(self.get_balance(player=player), change, reason, player)
+
+    def _notify(self, new_balance: float, change: float, reason: Optional[BalanceChangeReason], player: Optional["HumanPlayer"]) -> List:
+        """Notify observers with a balance captured while the player's stripe lock was held"""
         messages = []
-        new_balance = self.get_balance(player=player)
-        for observer in self.observers:
+        for observer in self._observers_for(self._get_key(player), reason):
             msgs = observer.update_balance(new_balance, change, reason)
             if msgs:
                 messages.extend(msgs)
         return messages
 
+    def _observers_for(self, key: str, reason: Optional[BalanceChangeReason]) -> List[BalanceObserver]:
+        """
+        Collect the observers interested in a change of the given player's balance
+        Only the player's own buckets are touched, so the cost does not grow with the number of players
+
+        @Returns:
+            List: global observers, then the player's catch-all observers, then the reason-specific ones
+        """
+        observers = list(self.observers)
+        by_reason = self.player_observers.get(key)
+        if by_reason:
+            observers.extend(by_reason.get(None, ()))
+            if reason is not None:
+                observers.extend(by_reason.get(reason, ()))
+        return observers
+
 
 
     def _get_key(self, player: Optional["HumanPlayer"]) -> str:
@@ -119,7 +354,7 @@ class BalanceManager:
     def get_balance(self, player: Optional["HumanPlayer"] = None) -> float:
         """
         Get the balance for the given player
-        If the player is not in the dictionary, initialize their balance to 1000.0
+        If the player is not in the store, initialize their balance to DEFAULT_BALANCE (1000.0)
 
         @Parameters:
             player (Optional[HumanPlayer]): The player whose balance is requested
@@ -129,9 +364,15 @@ class BalanceManager:
         """
         key = self._get_key(player)
         if key not in self.balances:
-            self.balances[key] = 1000.0
+            with self._lock_for(key):
+                self._ensure_account(key)
         return self.balances[key]
 
+    def _ensure_account(self, key: str) -> None:
+        """Open an account with the default balance for a key that has never been seen"""
+        if key not in self.balances:
+            self.balances[key] = self.DEFAULT_BALANCE
+
     def increase_balance(self, amount: float, reason: BalanceChangeReason = None, player: Optional["HumanPlayer"] = None) -> List:
         """
         Increase the balance for the given player by the specified amount and notify observers
@@ -149,11 +390,7 @@ class BalanceManager:
             - If player is provided, it must have a get_name() method
         """
         assert amount >= 0, "Amount to increase must be non-negative."
-        key = self._get_key(player)
-        if key not in self.balances:
-            self.balances[key] = 1000.0
-        self.balances[key] += amount
-        return self.notify_observers(amount, reason, player=player)
+        return self._apply(self._get_key(player), to_cents(amount), reason, player)
 
     def decrease_balance(self, amount: float, reason: BalanceChangeReason = None, player: Optional["HumanPlayer"] = None) -> List:
         """
@@ -172,11 +409,271 @@ class BalanceManager:
             - If player is provided, it must have a get_name() method
         """
         assert amount >= 0, "Amount to decrease must be non-negative"
+        return self._apply(self._get_key(player), -to_cents(amount), reason, player)
+
+    def try_decrease_balance(self, amount: float, reason: BalanceChangeReason = None, player: Optional["HumanPlayer"] = None) -> Optional[List]:
+        """
+        Compare-and-set style debit: decrease the balance only if it covers the amount
+
+        The check and the debit happen under the player's stripe lock, so two concurrent
+        debits can never both pass the check and overdraw the balance
+
+        @Parameters:
+            amount (float): The amount to decrease the balance
+            reason (BalanceChangeReason, optional): The reason for the change
+            player (Optional[HumanPlayer]): The player whose balance is to be decreased
+
+        @Returns:
+            Optional[List]: the observer messages, or None if the balance was too low (nothing changed)
+
+        @Preconditions:
+            - amount must be non-negative.
+        """
+        assert amount >= 0, "Amount to decrease must be non-negative"
         key = self._get_key(player)
-        if key not in self.balances:
-            self.balances[key] = 1000.0
-        self.balances[key] -= amount
-        return self.notify_observers(-amount, reason, player=player)
+        cents = to_cents(amount)
+        with self._lock_for(key):
+            self._ensure_account(key)
+            if self.balances.get_cents(key) < cents:
+                return None
+            new_cents, snapshot_due = self._apply_locked(key, -cents, reason)
+        return self._after_apply(new_cents, -cents, reason, player, snapshot_due)
+
+    def _apply(self, key: str, cents: int, reason: Optional[BalanceChangeReason], player: Optional["HumanPlayer"]) -> List:
+        """
+        Add a signed number of cents to a balance under its stripe lock, log it and notify observers
+        """
+        with self._lock_for(key):
+            new_cents, snapshot_due = self._apply_locked(key, cents, reason)
+        return self._after_apply(new_cents, cents, reason, player, snapshot_due)
+
+    def _apply_locked(self, key: str, cents: int, reason: Optional[BalanceChangeReason]) -> tuple:
+        """
+        Mutate and log a balance; the caller must hold the key's stripe lock
+
+        @Returns:
+            tuple: (new balance in cents, whether a ledger snapshot is due)
+        """
+        self._ensure_account(key)
+        new_cents = self.balances.add_cents(key, cents)
+        self._remember(key, cents, reason)
+        return new_cents, self._record(key, cents / 100, reason)
+
+    def _remember(self, key: str, cents: int, reason: Optional[BalanceChangeReason]) -> None:
+        """Add a change to the player's history; the caller must hold the key's stripe lock"""
+        history = self.histories.get(key)
+        if history is None:
+            history = self.histories[key] = BalanceHistory(self.HISTORY_SIZE, len(self.REASONS_BY_CODE))
+        history.record(cents, self.REASON_CODES[reason], time.time())
+
+    def _after_apply(self, new_cents: int, cents: int, reason: Optional[BalanceChangeReason], player: Optional["HumanPlayer"], snapshot_due: bool) -> List:
+        """
+        Work done once the stripe lock is released: the due snapshot (which takes every stripe),
+        the event bus publication and the observer notification, using the balance as it was right after the change
+        """
+        if snapshot_due:
+            self._snapshot()
+        bus = self.event_bus
+        if bus is not None:
+            bus.publish(BalanceEvent(self._get_key(player), cents / 100, new_cents / 100, reason))
+        return self._notify(new_cents / 100, cents / 100, reason, player)
+
+    def get_top_balances(self, k: int = 10) -> List[tuple]:
+        """
+        @param k: number of players to return
+        @Returns:
+            List[tuple]: up to k (player key, balance) pairs, richest first
+        """
+        return [(key, cents / 100) for key, cents in self.leaderboard.top(k)]
+
+    def get_rank(self, player: Optional["HumanPlayer"] = None) -> Optional[int]:
+        """
+        @param player: The player whose rank is requested
+        @Returns:
+            Optional[int]: the player's 1-based rank by balance, or None if they have no balance yet
+        """
+        return self.leaderboard.rank_of(self._get_key(player))
+
+    def get_recent_changes(self, player: Optional["HumanPlayer"] = None, n: int = 10) -> List[tuple]:
+        """
+        @param player: The player whose history is requested
+        @param n: maximum number of changes to return
+        @Returns:
+            List[tuple]: (amount, BalanceChangeReason or None, timestamp) tuples, newest first
+        """
+        history = self.histories.get(self._get_key(player))
+        if history is None:
+            return []
+        return [(cents / 100, self.REASONS_BY_CODE[code], ts) for cents, code, ts in history.recent(n)]
+
+    def get_session_stats(self, player: Optional["HumanPlayer"] = None) -> Dict:
+        """
+        @param player: The player whose statistics are requested
+        @Returns:
+            Dict: net change, max drawdown, number of changes and win/loss counts per reason
+                  since the player's first balance change
+        """
+        history = self.histories.get(self._get_key(player))
+        if history is None:
+            return {"net": 0.0, "max_drawdown": 0.0, "changes": 0, "wins": {}, "losses": {}}
+        return {
+            "net": history.net / 100,
+            "max_drawdown": history.max_drawdown / 100,
+            "changes": history.count,
+            "wins": {self.REASONS_BY_CODE[code]: n for code, n in enumerate(history.wins) if n},
+            "losses": {self.REASONS_BY_CODE[code]: n for code, n in enumerate(history.losses) if n},
+        }
+
+    def transaction(self, player: Optional["HumanPlayer"] = None, reason: Optional[BalanceChangeReason] = None) -> "BalanceTransaction":
+        """
+        Start a multi-leg transaction on the given player's balance
+
+        Usage:
+            with BalanceManager().transaction(player) as txn:
+                txn.debit(10, BalanceChangeReason.BET)
+                txn.credit(40, BalanceChangeReason.WIN)
+            messages.extend(txn.messages)
+
+        @param player: The player whose balance the legs apply to
+        @param reason: The reason reported in the coalesced notification (defaults to the last leg's when
+                       all legs have the same sign, else WIN or LOSE by the sign of the net change)
+        @Returns:
+            BalanceTransaction: the pending transaction
+        """
+        return BalanceTransaction(self, player, reason)
+
+    def _commit(self, txn: "BalanceTransaction") -> List:
+        """
+        Apply every leg of a transaction at once and notify observers a single time
+
+        @Raises:
+            InsufficientFundsError: if the running balance would drop below zero after any leg
+        """
+        if not txn.legs:
+            return []
+        key = self._get_key(txn.player)
+        snapshot_due = False
+        with self._lock_for(key):
+            self._ensure_account(key)
+            start_cents = cents = self.balances.get_cents(key)
+            for leg_cents, _ in txn.legs:
+                cents += leg_cents
+                if cents < 0:
+                    raise InsufficientFundsError(f"Insufficient funds for {key}")
+            self.balances.add_cents(key, cents - start_cents)
+            for leg_cents, leg_reason in txn.legs:
+                self._remember(key, leg_cents, leg_reason)
+                snapshot_due = self._record(key, leg_cents / 100, leg_reason) or snapshot_due
+        reason = txn.reason if txn.reason is not None else self._net_reason(txn.legs, cents - start_cents)
+        return self._after_apply(cents, cents - start_cents, reason, txn.player, snapshot_due)
+
+    @staticmethod
+    def _net_reason(legs: List[tuple], net_cents: int) -> Optional[BalanceChangeReason]:
+        """
+        Default reason of a transaction: the last leg's if every leg moves the balance the same way,
+        otherwise WIN or LOSE by the sign of the net change, so the reason never contradicts it
+        """
+        if all(leg_cents > 0 for leg_cents, _ in legs) or all(leg_cents <= 0 for leg_cents, _ in legs):
+            return legs[-1][1]
+        return BalanceChangeReason.WIN if net_cents > 0 else BalanceChangeReason.LOSE
+
+
+class BalanceTransaction:
+    """
+    A batch of credits and debits on one player's balance, applied atomically on commit
+
+    The legs are validated against the balance in order (no leg may take it below zero) and
+    applied together; observers receive one notification carrying the net change, so a round
+    of several bets and payouts produces one set of messages instead of one per leg.
+    Used as a context manager it commits on a clean exit and discards the legs on an exception.
+    """
+    def __init__(self, manager: BalanceManager, player: Optional["HumanPlayer"] = None, reason: Optional[BalanceChangeReason] = None) -> None:
+        self.manager = manager
+        self.player = player
+        self.reason = reason
+        self.legs: List[tuple] = []  # (signed cents, reason)
+        self.messages: List = []
+        self.committed = False
+
+    def credit(self, amount: float, reason: Optional[BalanceChangeReason] = None) -> "BalanceTransaction":
+        """
+        Add an increase of amount to the transaction
+
+        @Preconditions:
+            - amount must be non-negative
+        """
+        assert amount >= 0, "Amount to increase must be non-negative."
+        self.legs.append((to_cents(amount), reason))
+        return self
+
+    def debit(self, amount: float, reason: Optional[BalanceChangeReason] = None) -> "BalanceTransaction":
+        """
+        Add a decrease of amount to the transaction
+
+        @Preconditions:
+            - amount must be non-negative
+        """
+        assert amount >= 0, "Amount to decrease must be non-negative"
+        self.legs.append((-to_cents(amount), reason))
+        return self
+
+    def net(self) -> float:
+        """
+        @Returns:
+            float: the net change the transaction will apply
+        """
+        return sum(cents for cents, _ in self.legs) / 100
+
+    def commit(self) -> List:
+        """
+        Apply the transaction
+
+        @Returns:
+            List: the messages from the single coalesced observer notification
+        @Raises:
+            InsufficientFundsError: if the player cannot cover the legs (nothing is applied)
+        """
+        assert not self.committed, "transaction already committed"
+        self.messages = self.manager._commit(self)
+        self.committed = True
+        return self.messages
+
+    def __enter__(self) -> "BalanceTransaction":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        if exc_type is None and not self.committed:
+            self.commit()
+        return False
+
+
+class ObserverSubscription:
+    """
+    Context manager for BalanceManager.observing(): holds one subscription of a pooled observer pair
+    """
+    def __init__(self, manager: BalanceManager, player: "HumanPlayer", sender: object = None) -> None:
+        self.manager = manager
+        self.player = player
+        self.sender = sender
+        self._pool_key: Optional[Tuple[str, int]] = None
+
+    def open(self) -> "ObserverSubscription":
+        if self._pool_key is None:
+            self._pool_key = self.manager._acquire_observers(self.player, self.sender)
+        return self
+
+    def close(self) -> None:
+        """Release the subscription; calling it more than once has no effect"""
+        if self._pool_key is not None:
+            self.manager._release_observers(self._pool_key, self.player)
+            self._pool_key = None
+
+    def __enter__(self) -> "ObserverSubscription":
+        return self.open()
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.close()
+        return False
 
 
 #BALANCE NOTIFIER
@@ -192,6 +689,7 @@ class BalanceEffectObserver(BalanceObserver):
     def update_balance(self, new_balance: float, change: float, reason: BalanceChangeReason = None) -> List:
 
         messages = []
+        message = None  # reasons without a message of their own (e.g. a JACKPOT that nets a loss) stay silent
         if change > 0:
                 message = DialogueMessage(self.sender, self.player, f"After winning ${change:.2f}, your new balance is ${new_balance:.2f} ", self.sender.get_image_name())
 
@@ -222,6 +720,7 @@ class SoundEffectObserver(BalanceObserver):
     def update_balance(self, new_balance: float, change: float, reason: BalanceChangeReason = None) -> list:
         # Here, we'll return a list of SoundMessage objects.
         messages = []
+        message = None
         if change > 0:
             if reason == BalanceChangeReason.JACKPOT:
                 message = SoundMessage(self.player, 'jackpot', repeat=False)
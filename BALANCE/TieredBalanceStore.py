@@ -0,0 +1,264 @@
+import sqlite3
+import threading
+
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from typing import Callable, Iterator, List, Optional, Tuple
+
+from .BalanceStore import BalanceStore, to_cents
+
+
+class TieredBalanceStore(MutableMapping):
+    """
+    Balance store that keeps recently active players in memory and spills the rest to SQLite
+
+    The hot tier is a BalanceStore bounded to `hot_capacity` players in least recently used
+    order; touching a player moves them to the back and, once the bound is exceeded, the
+    least recently used player is written to the cold tier (a SQLite table) and dropped from
+    memory. Accessing a cold player reloads them transparently, so memory stays flat however
+    many players the world has seen.
+
+    Every key has a row in the SQLite table (created when the player is first stored); the rows
+    of hot players are brought up to date when they are evicted and on flush().
+    It offers the same interface as BalanceStore (mapping in dollars, *_cents methods, indexes),
+    and can be swapped in with BalanceManager.use_store().
+
+    It also answers leaderboard queries (top() and rank_of()) from an index on the SQLite table,
+    so it can stand in for a BalanceLeaderboard without keeping an entry per player in memory.
+    """
+    COMMIT_EVERY = 256
+
+    def __init__(self, path: str, hot_capacity: int = 4096) -> None:
+        """
+        @param path: the SQLite database file of the cold tier
+        @param hot_capacity: maximum number of players kept in memory
+
+        @Preconditions:
+            - hot_capacity >= 1
+        """
+        assert hot_capacity >= 1, "hot_capacity must be at least 1"
+        self.path = path
+        self.hot_capacity = hot_capacity
+        self.hot = BalanceStore(capacity=min(hot_capacity, 1024))
+        # hot keys, least recently used first -> whether the SQLite row is out of date
+        self._recent: "OrderedDict[str, bool]" = OrderedDict()
+        self._indexes: list = []
+        self._evict_listeners: List[Callable[[str], None]] = []
+        self._lock = threading.RLock()
+        self._uncommitted = 0
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("CREATE TABLE IF NOT EXISTS balances (key TEXT PRIMARY KEY, cents INTEGER NOT NULL)")
+        self._db.execute("CREATE INDEX IF NOT EXISTS balances_by_rank ON balances (cents DESC, key)")
+        self._db.commit()
+
+    # MAPPING INTERFACE (DOLLARS)
+
+    def __getitem__(self, key: str) -> float:
+        return self.get_cents(key) / 100
+
+    def __setitem__(self, key: str, value: float) -> None:
+        self.set_cents(key, to_cents(value))
+
+    def __delitem__(self, key: str) -> None:
+        with self._lock:
+            in_hot = self._recent.pop(key, None) is not None
+            if in_hot:
+                del self.hot[key]
+            deleted = self._db.execute("DELETE FROM balances WHERE key = ?", (key,)).rowcount
+            self._wrote()
+            if not (in_hot or deleted):
+                raise KeyError(key)
+        for index in self._indexes:
+            index.remove(key)
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._load(key) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            return iter([row[0] for row in self._db.execute("SELECT key FROM balances")])
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM balances").fetchone()[0]
+
+    def items(self) -> List[Tuple[str, float]]:
+        """
+        @Returns:
+            List[Tuple[str, float]]: every (key, balance) pair, read without reloading cold players
+        """
+        return [(key, cents / 100) for key, cents in self._all_cents()]
+
+    def clear(self) -> None:
+        """Remove every player from both tiers"""
+        with self._lock:
+            self.hot.clear()
+            self._recent.clear()
+            self._db.execute("DELETE FROM balances")
+            self._db.commit()
+            self._uncommitted = 0
+        for index in self._indexes:
+            index.clear()
+
+    # FIXED-POINT ACCESS
+
+    def get_cents(self, key: str) -> int:
+        cents = self._load(key)
+        if cents is None:
+            raise KeyError(key)
+        return cents
+
+    def set_cents(self, key: str, cents: int) -> None:
+        with self._lock:
+            if self._load(key) is None:
+                # new player: create the row now so the key is known to the cold tier
+                self._db.execute("INSERT INTO balances (key, cents) VALUES (?, ?)", (key, cents))
+                self._wrote()
+                self._recent[key] = False
+            else:
+                self._recent[key] = True
+            self.hot.set_cents(key, cents)
+            self._evict()
+        for index in self._indexes:
+            index.update(key, cents)
+
+    def add_cents(self, key: str, cents: int) -> int:
+        """
+        Add a signed number of cents to the key's balance, reloading the player if they are cold
+
+        @Preconditions:
+            - key is already stored
+        @Returns:
+            int: the new balance in cents
+        """
+        with self._lock:
+            self.get_cents(key)
+            new_cents = self.hot.add_cents(key, cents)
+            self._recent[key] = True
+        for index in self._indexes:
+            index.update(key, new_cents)
+        return new_cents
+
+    def add_index(self, index) -> None:
+        """
+        Attach an index that is kept up to date with every write; it is filled with every player of both tiers
+
+        @param index: object with update(key, cents), remove(key) and clear() methods
+        """
+        for key, cents in self._all_cents():
+            index.update(key, cents)
+        self._indexes.append(index)
+
+    def add_evict_listener(self, listener: Callable[[str], None]) -> None:
+        """
+        @param listener: called with the key of every player moved to the cold tier
+        """
+        self._evict_listeners.append(listener)
+
+    # BULK OPERATIONS
+
+    def total_cents(self) -> int:
+        with self._lock:
+            self._write_dirty()
+            return self._db.execute("SELECT COALESCE(SUM(cents), 0) FROM balances").fetchone()[0]
+
+    def credit_all(self, cents: int) -> None:
+        """
+        Add the same number of cents to every balance in both tiers
+
+        @param cents: the signed amount to add to each player
+        """
+        with self._lock:
+            self._write_dirty()
+            self._db.execute("UPDATE balances SET cents = cents + ?", (cents,))
+            self._db.commit()
+            self._uncommitted = 0
+            self.hot.credit_all(cents)
+        if self._indexes:
+            for key, new_cents in self._all_cents():
+                for index in self._indexes:
+                    index.update(key, new_cents)
+
+    # RANKING (same queries as BalanceLeaderboard)
+
+    def top(self, k: int) -> List[Tuple[str, int]]:
+        """
+        @param k: number of entries to return
+        @Returns:
+            List[Tuple[str, int]]: up to k (key, cents) pairs, richest first
+        """
+        with self._lock:
+            self._write_dirty()
+            return list(self._db.execute("SELECT key, cents FROM balances ORDER BY cents DESC, key LIMIT ?", (k,)))
+
+    def rank_of(self, key: str) -> Optional[int]:
+        """
+        @Returns:
+            Optional[int]: the 1-based rank of the key (1 = richest), or None if it is not stored
+        """
+        with self._lock:
+            cents = self._load(key)
+            if cents is None:
+                return None
+            self._write_dirty()
+            ahead = self._db.execute("SELECT COUNT(*) FROM balances WHERE cents > ? OR (cents = ? AND key < ?)",
+                                     (cents, cents, key)).fetchone()[0]
+            return ahead + 1
+
+    def flush(self) -> None:
+        """Write every changed hot player to SQLite and commit"""
+        with self._lock:
+            self._write_dirty()
+            self._db.commit()
+            self._uncommitted = 0
+
+    def close(self) -> None:
+        """Flush and close the SQLite database"""
+        with self._lock:
+            self.flush()
+            self._db.close()
+
+    # INTERNALS
+
+    def _load(self, key: str) -> Optional[int]:
+        """Return the key's cents, moving it to the hot tier (most recently used), or None if unknown"""
+        with self._lock:
+            if key in self._recent:
+                self._recent.move_to_end(key)
+                return self.hot.get_cents(key)
+            row = self._db.execute("SELECT cents FROM balances WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            self._recent[key] = False
+            self.hot.set_cents(key, row[0])
+            self._evict()
+            return row[0]
+
+    def _evict(self) -> None:
+        while len(self._recent) > self.hot_capacity:
+            key, dirty = self._recent.popitem(last=False)
+            if dirty:
+                self._db.execute("UPDATE balances SET cents = ? WHERE key = ?", (self.hot.get_cents(key), key))
+                self._wrote()
+            del self.hot[key]
+            for listener in self._evict_listeners:
+                listener(key)
+
+    def _write_dirty(self) -> None:
+        rows = [(self.hot.get_cents(key), key) for key, dirty in self._recent.items() if dirty]
+        if rows:
+            self._db.executemany("UPDATE balances SET cents = ? WHERE key = ?", rows)
+            for _, key in rows:
+                self._recent[key] = False
+
+    def _all_cents(self) -> List[Tuple[str, int]]:
+        with self._lock:
+            self._write_dirty()
+            return list(self._db.execute("SELECT key, cents FROM balances"))
+
+    def _wrote(self) -> None:
+        """Count a write and commit them in batches"""
+        self._uncommitted += 1
+        if self._uncommitted >= self.COMMIT_EVERY:
+            self._db.commit()
+            self._uncommitted = 0
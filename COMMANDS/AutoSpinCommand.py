@@ -0,0 +1,78 @@
+from typing import TYPE_CHECKING
+from ..BALANCE.PlayerBalance import *
+from ..GAME.ProgressiveJackpot import JackpotMeter, ProgressiveJackpot
+from ..GAME.SlotMachine import SlotMachine
+from ..imports import *
+
+if TYPE_CHECKING:
+    from coord import Coord
+    from maps.base import Map
+    from ..tiles.base import MapObject
+    from ..tiles.map_objects import *
+    from message import ServerMessage
+    from command import ChatCommand
+
+
+class AutoSpinCommand(ChatCommand):
+    name = 'autospin'
+    desc = 'Plays several slot machine spins at once; the command is /autospin/<spins> or /autospin/<spins>/<loss_limit>'
+    MAX_SPINS = 500
+    _jackpot_meter: Optional[JackpotMeter] = None  # autospins' share of the progressive jackpot
+
+    @classmethod
+    def jackpot_meter(cls) -> JackpotMeter:
+        if cls._jackpot_meter is None or cls._jackpot_meter.pool is not ProgressiveJackpot():
+            cls._jackpot_meter = ProgressiveJackpot().meter()
+        return cls._jackpot_meter
+
+    @classmethod
+    def matches(cls, command_text: str) -> bool:
+        """
+        This method checks if the command text matches the expected format for the autospin command
+
+        @param command_text (str): The full text of the command entered by the player
+        @return (bool): True if command_text is 'autospin/<number>' or 'autospin/<number>/<number>' and False otherwise
+        """
+        parts = command_text.strip().lower().split("/")
+        return parts[0] == "autospin" and len(parts) in (2, 3) and all(part.isdigit() for part in parts[1:])
+
+
+    # METHOD PLAYS THE SPINS AS ONE BALANCE TRANSACTION AND RETURNS A SUMMARY INSTEAD OF EVERY SPIN'S MESSAGES
+    def execute(self, command_text: str, context: "Map", player: "HumanPlayer") -> list:
+        """
+        Executes the autospin command by running the spins on the SlotMachine and summarising them
+
+        Preconditions:
+            - command_text must satisfy matches()
+
+        @param command_text (str): The command text entered by the player
+        @param context (Map): The current game map
+        @param player (HumanPlayer): The player issuing the command
+        @return (list): The balance observers' messages followed by a ServerMessage with the summary
+        """
+        parts = command_text.strip().lower().split("/")
+        spins = int(parts[1])
+        loss_limit = int(parts[2]) if len(parts) == 3 else None
+        if not 1 <= spins <= self.MAX_SPINS:
+            return [ServerMessage(player, f"You can autospin between 1 and {self.MAX_SPINS} times.")]
+        if loss_limit == 0:
+            return [ServerMessage(player, "The loss limit must be more than $0.")]
+
+        bm = BalanceManager()
+        try:
+            with bm.observing(player, sender=player):
+                result, messages = SlotMachine().auto_spin(player, spins, loss_limit, meter=self.jackpot_meter())
+        except InsufficientFundsError:
+            return [ServerMessage(player, "Your balance changed during the autospin, no spins were charged. Try again!")]
+
+        lines = [
+            f"Autospin: {result.spins} spins, {result.wins} wins, {result.jackpots} jackpots",
+            f"Paid ${result.wagered:.2f}, won ${result.won:.2f}, net {'+' if result.net >= 0 else '-'}${abs(result.net):.2f}",
+        ]
+        if result.jackpots:
+            lines.append(f"JACKPOT HIT!! (won ${result.won:.2f} in total)")
+        if result.stop_reason is not None:
+            lines.append(f"Stopped early: {result.stop_reason}")
+        lines.append(f"Current balance: ${bm.get_balance(player=player):.2f}")
+        messages.append(ServerMessage(player, "\n".join(lines)))
+        return messages
@@ -43,25 +43,15 @@ class BarCommand(MenuCommand):
         balance = BalanceManager()
 
 
-        # Create observers for this interaction
-        se_observer = SoundEffectObserver(player)
-        be_observer = BalanceEffectObserver(player, player)
-        balance.register_observer(se_observer)
-        balance.register_observer(be_observer)
-
-
-        msg = balance.decrease_balance(self.price, BalanceChangeReason.DRINK, player=player)
+        # Use the player's pooled observers for this interaction; they are unregistered when the block ends
+        with balance.observing(player, sender=player):
+            msg = balance.decrease_balance(self.price, BalanceChangeReason.DRINK, player=player)
         messages.append(
             EmoteMessage(sender = player, recipient = player, emote = "yellow_drink", emote_pos = Coord(8, 5))
         )
         messages.extend(msg)
 
 
-        # Unregister observers after use to avoid duplication on future interactions
-        balance.unregister_observer(se_observer)
-        balance.unregister_observer(be_observer)
-
-
         #return [f"Enjoy your drink! You have {player.balance} left"]
         return messages if messages is not None else []
 
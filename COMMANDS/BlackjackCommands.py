@@ -10,7 +10,9 @@ if TYPE_CHECKING:
 
 from enum import Enum
 
-from ..BALANCE.PlayerBalance import BalanceManager, BalanceChangeReason, BalanceEffectObserver, SoundEffectObserver
+from ..BALANCE.PlayerBalance import BalanceManager, BalanceChangeReason
+from ..Cards.BasicStrategy import HIT
+from ..Cards.DealerOdds import BUST, OUTCOMES, dealer_odds
 
 
 class BlackjackDealCommand(MenuCommand):
@@ -43,21 +45,15 @@ class BlackjackDealCommand(MenuCommand):
         game.start_new_round()
 
         bm = BalanceManager()
-        se_observer = SoundEffectObserver(player)
-        be_observer = BalanceEffectObserver(self.blackjack_computer, player)
-        bm.register_observer(se_observer)
-        bm.register_observer(be_observer)
-
         current_balance = bm.get_balance(player=player)
 
         # check if the player can afford the ante
         if current_balance < game.ante:
             messages.append(ServerMessage(player, f"You need at least ${game.ante:.2f} to ante up!"))
-            bm.unregister_observer(se_observer)
-            bm.unregister_observer(be_observer)
             return messages
 
-        cost_msgs = bm.decrease_balance(game.ante, reason=BalanceChangeReason.COST, player=player)
+        with bm.observing(player, sender=self.blackjack_computer):
+            cost_msgs = bm.decrease_balance(game.ante, reason=BalanceChangeReason.COST, player=player)
         messages.extend(cost_msgs)
 
         game.pot = game.ante * 2.0
@@ -68,9 +64,6 @@ class BlackjackDealCommand(MenuCommand):
         text = f"New round started!\nYour hand: {', '.join(cards)} (Total: {total})"
         messages.append(DialogueMessage(self.blackjack_computer, player, text, image=self.blackjack_computer.get_image_name()))
 
-        bm.unregister_observer(se_observer)
-        bm.unregister_observer(be_observer)
-
         # re-show the menu so they can choose hit, stand, or quit
         messages.append(MenuMessage(
             sender=self.blackjack_computer,
@@ -155,12 +148,6 @@ class BlackjackStandCommand(MenuCommand):
             return messages
 
         bm = BalanceManager()
-        se_observer = SoundEffectObserver(player)
-        be_observer = BalanceEffectObserver(self.blackjack_computer, player)
-        bm.register_observer(se_observer)
-        bm.register_observer(be_observer)
-
-        current_balance = bm.get_balance(player=player)
 
         # dealer turn
         dealer_busted = game.dealer_turn()
@@ -176,12 +163,10 @@ class BlackjackStandCommand(MenuCommand):
         messages.append(DialogueMessage(self.blackjack_computer, player, f"Result: {winner} wins!", image=self.blackjack_computer.get_image_name()))
 
         if winner == "Player":
-            observer_msgs = bm.increase_balance(game.pot, reason=BalanceChangeReason.WIN, player=player)
+            with bm.observing(player, sender=self.blackjack_computer):
+                observer_msgs = bm.increase_balance(game.pot, reason=BalanceChangeReason.WIN, player=player)
             messages.extend(observer_msgs)
 
-        bm.unregister_observer(se_observer)
-        bm.unregister_observer(be_observer)
-
         self.blackjack_computer.remove_game(player)
 
         # show menu again (they can choose to 'deal' for a new round, or quit)
@@ -194,6 +179,40 @@ class BlackjackStandCommand(MenuCommand):
         return messages
 
 
+class BlackjackHintCommand(MenuCommand):
+    """
+    menu choice that tells the player what basic strategy does with their hand
+    """
+    name = "Hint"
+
+    def __init__(self, blackjack_computer: "BlackjackComputer"):
+        self.blackjack_computer = blackjack_computer
+
+    def execute(self, context: "Map", player: "HumanPlayer") -> list[Message]:
+        messages: list[Message] = []
+        game = self.blackjack_computer.get_or_create_game(player)
+
+        if len(game.player_hand.cards) == 0:
+            messages.append(DialogueMessage(self.blackjack_computer, player, "No active round. Choose 'Deal' first.", image=self.blackjack_computer.get_image_name()))
+        else:
+            upcard = game.dealer_hand.cards[1]
+            action = self.blackjack_computer.strategy.action_for(game.player_hand, upcard)
+            bust = dealer_odds(game)[OUTCOMES.index(BUST)]
+            text = (
+                f"Hint: {'Hit' if action == HIT else 'Stand'} on {game.get_player_total()} against the dealer's {upcard}.\n"
+                f"The dealer busts {bust:.0%} of the time from here."
+            )
+            messages.append(DialogueMessage(self.blackjack_computer, player, text, image=self.blackjack_computer.get_image_name()))
+
+        messages.append(MenuMessage(
+            self.blackjack_computer,
+            player,
+            "Blackjack Menu",
+            list(self.blackjack_computer.get_menu_options())
+        ))
+        return messages
+
+
 class BlackjackQuitCommand(MenuCommand):
     """
     menu choice that lets the user quit the menu and poker session
@@ -0,0 +1,71 @@
+from typing import TYPE_CHECKING
+from ..BALANCE.PlayerBalance import *
+from ..imports import *
+
+if TYPE_CHECKING:
+    from coord import Coord
+    from maps.base import Map
+    from ..tiles.base import MapObject
+    from ..tiles.map_objects import *
+    from message import ServerMessage
+    from command import ChatCommand
+
+
+def leaderboard_text(k: int = 5, player: Optional["HumanPlayer"] = None) -> str:
+    """
+    Builds the text of the balance leaderboard
+
+    @param k (int): The number of top players to list
+    @param player (Optional[HumanPlayer]): If given, their own rank is added at the end
+    @return (str): The leaderboard, one player per line
+    """
+    bm = BalanceManager()
+    top = bm.get_top_balances(k)
+    if not top:
+        return "Nobody has played yet!"
+    lines = ["Richest players:"]
+    lines.extend(f"{rank}. {name}: ${balance:.2f}" for rank, (name, balance) in enumerate(top, start=1))
+    if player is not None:
+        rank = bm.get_rank(player=player)
+        if rank is not None:
+            lines.append(f"You are #{rank} of {len(bm.leaderboard)}")
+    return "\n".join(lines)
+
+
+class LeaderboardCommand(ChatCommand):
+    name = 'leaderboard'
+    desc = 'Shows the richest players and your rank; the command is /leaderboard or /leaderboard/<how_many>'
+    MAX_ENTRIES = 20
+
+    @classmethod
+    def matches(cls, command_text: str) -> bool:
+        """
+        This method checks if the command text matches the expected format for the leaderboard command
+
+        @param command_text (str): The full text of the command entered by the player
+        @return (bool): True if command_text is 'leaderboard' or 'leaderboard/<number>' and False otherwise
+        """
+        text = command_text.strip().lower()
+        if text == "leaderboard":
+            return True
+        return text.startswith("leaderboard/") and text[len("leaderboard/"):].isdigit()
+
+
+    # METHOD RETURNS A SERVER MESSAGE WITH THE TOP PLAYERS AND THE PLAYER'S OWN RANK
+    def execute(self, command_text: str, context: "Map", player: "HumanPlayer") -> list:
+        """
+        Executes the leaderboard command by reading the top balances from the BalanceManager's leaderboard
+
+        Preconditions:
+            - command_text must satisfy matches()
+
+        @param command_text (str): The command text entered by the player
+        @param context (Map): The current game map
+        @param player (HumanPlayer): The player issuing the command
+        @return (list): A list containing a single ServerMessage with the leaderboard
+        """
+        text = command_text.strip().lower()
+        k = 5
+        if "/" in text:
+            k = max(1, min(self.MAX_ENTRIES, int(text.split("/", 1)[1])))
+        return [ServerMessage(player, leaderboard_text(k, player))]
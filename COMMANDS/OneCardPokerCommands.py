@@ -19,7 +19,7 @@ from enum import Enum
 
 import random
 
-from ..BALANCE.PlayerBalance import BalanceManager, BalanceChangeReason, BalanceEffectObserver, SoundEffectObserver
+from ..BALANCE.PlayerBalance import BalanceManager, BalanceChangeReason
 
 class OneCardDealCommand(MenuCommand):
     """
@@ -53,21 +53,15 @@ class OneCardDealCommand(MenuCommand):
         game.start_new_round()
 
         bm = BalanceManager()
-        se_observer = SoundEffectObserver(player)
-        be_observer = BalanceEffectObserver(self.poker_computer, player)
-        bm.register_observer(se_observer)
-        bm.register_observer(be_observer)
-
         current_balance = bm.get_balance(player=player)
 
         # check if the player can afford the ante
         if current_balance < game.ante:
             messages.append(ServerMessage(player, f"You need at least ${game.ante:.2f} to ante up!"))
-            bm.unregister_observer(se_observer)
-            bm.unregister_observer(be_observer)
             return messages
 
-        cost_msgs = bm.decrease_balance(game.ante, reason=BalanceChangeReason.COST, player=player)
+        with bm.observing(player, sender=self.poker_computer):
+            cost_msgs = bm.decrease_balance(game.ante, reason=BalanceChangeReason.COST, player=player)
         messages.extend(cost_msgs)
 
         game.pot = game.ante * 2.0
@@ -88,9 +82,6 @@ class OneCardDealCommand(MenuCommand):
                 image=self.poker_computer.get_image_name()
             ))
 
-        bm.unregister_observer(se_observer)
-        bm.unregister_observer(be_observer)
-
         messages.append(MenuMessage(
             self.poker_computer,
             player,
@@ -134,22 +125,14 @@ class OneCardBetCommand(MenuCommand):
         assert game.ai_card is not None
 
         bm = BalanceManager()
-        se_observer = SoundEffectObserver(player)
-        be_observer = BalanceEffectObserver(self.poker_computer, player)
-        bm.register_observer(se_observer)
-        bm.register_observer(be_observer)
-
-        current_balance = bm.get_balance(player=player)
 
-        # Check if the player can afford the bet
-        if current_balance < game.bet_amount:
+        # take the bet before anything about the round changes; a balance that cannot cover it leaves the round as it was
+        with bm.observing(player, sender=self.poker_computer):
+            bet_msgs = bm.try_decrease_balance(game.bet_amount, reason=BalanceChangeReason.BET, player=player)
+        if bet_msgs is None:
             messages.append(ServerMessage(player, f"You need at least ${game.bet_amount:.2f} to bet!"))
-            bm.unregister_observer(se_observer)
-            bm.unregister_observer(be_observer)
             return messages
-
-        cost_msgs = bm.decrease_balance(game.bet_amount, reason=BalanceChangeReason.BET, player=player)
-        messages.extend(cost_msgs)
+        messages.extend(bet_msgs)
 
         game.pot += game.bet_amount
 
@@ -161,6 +144,7 @@ class OneCardBetCommand(MenuCommand):
         # AI decides to call or fold based on strategy
         ai_calls = game.ai_decides_call()
 
+        payout_reason = None
         if ai_calls:
             game.pot += game.bet_amount
 
@@ -174,13 +158,11 @@ class OneCardBetCommand(MenuCommand):
             winner = game.showdown()
             if winner == "Player":
                 messages.append(DialogueMessage(self.poker_computer, player, f"You won the showdown! AI had a{add_n_before_rank} {ai_card_rank.value}", image=self.poker_computer.get_image_name()))
-                observer_msgs = bm.increase_balance(game.pot, reason=BalanceChangeReason.WIN, player=player)
-                messages.extend(observer_msgs)
+                payout_reason = BalanceChangeReason.WIN
             elif winner == "AI":
                 messages.append(DialogueMessage(self.poker_computer, player, f"AI wins the showdown with a{add_n_before_rank} {ai_card_rank.value}", image=self.poker_computer.get_image_name()))
             else:
-                observer_msgs = bm.increase_balance(game.pot, reason=BalanceChangeReason.TIE, player=player)
-                messages.extend(observer_msgs)
+                payout_reason = BalanceChangeReason.TIE
                 messages.append(DialogueMessage(self.poker_computer, player, "It's a tie. You get your pot back!", image=self.poker_computer.get_image_name()))
 
             game.active_round = False
@@ -191,12 +173,12 @@ class OneCardBetCommand(MenuCommand):
                 f"AI folds a{add_n_before_rank} {ai_card_rank.value}! You take the pot.",
                 image=self.poker_computer.get_image_name()
             ))
-            observer_msgs = bm.increase_balance(game.pot, reason=BalanceChangeReason.WIN, player=player)
-            messages.extend(observer_msgs)
+            payout_reason = BalanceChangeReason.WIN
             game.active_round = False
 
-        bm.unregister_observer(se_observer)
-        bm.unregister_observer(be_observer)
+        if payout_reason is not None:
+            with bm.observing(player, sender=self.poker_computer):
+                messages.extend(bm.increase_balance(game.pot, reason=payout_reason, player=player))
 
         messages.append(MenuMessage(
             self.poker_computer, player,
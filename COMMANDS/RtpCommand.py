@@ -0,0 +1,61 @@
+from typing import TYPE_CHECKING
+from ..GAME.RtpMonitor import RtpMonitors
+from ..imports import *
+
+if TYPE_CHECKING:
+    from coord import Coord
+    from maps.base import Map
+    from ..tiles.base import MapObject
+    from ..tiles.map_objects import *
+    from message import ServerMessage
+    from command import ChatCommand
+
+
+class RtpCommand(ChatCommand):
+    name = 'rtp'
+    desc = 'Admin only: shows every slot machine\'s observed RTP against its theoretical value; the command is /rtp'
+    # the command is only allowed to players holding this role in their persistent "roles" state;
+    # roles are granted by server code (e.g. player.set_state("roles", ["casino_admin"])), never from chat
+    ROLE_STATE = "roles"
+    REQUIRED_ROLE = "casino_admin"
+
+    @classmethod
+    def matches(cls, command_text: str) -> bool:
+        """
+        This method checks if the command text matches the expected format for the rtp command
+
+        @param command_text (str): The full text of the command entered by the player
+        @return (bool): True if command_text is exactly 'rtp' and False otherwise
+        """
+        return command_text.strip().lower() == "rtp"
+
+
+    @classmethod
+    def is_allowed(cls, player: "HumanPlayer") -> bool:
+        """
+        This method checks the player's roles, not their display name, which any player can choose
+
+        @param player (HumanPlayer): The player issuing the command
+        @return (bool): True if the player holds the casino admin role
+        """
+        return cls.REQUIRED_ROLE in (player.get_state(cls.ROLE_STATE) or ())
+
+
+    # METHOD LISTS THE MACHINES' RTP MONITORS AND THEIR RECENT DRIFT ALERTS
+    def execute(self, command_text: str, context: "Map", player: "HumanPlayer") -> list:
+        """
+        Executes the rtp command by summarising every machine's RTP monitor
+
+        @param command_text (str): The command text entered by the player (expected to be 'rtp')
+        @param context (Map): The current game map
+        @param player (HumanPlayer): The player issuing the command
+        @return (list): A list containing a single ServerMessage with the report, or a refusal for non admins
+        """
+        if not self.is_allowed(player):
+            return [ServerMessage(player, "Only admins can use /rtp.")]
+        registry = RtpMonitors()
+        lines = [monitor.summary() for monitor in list(registry.monitors.values())] or ["No slot machine has been played yet."]
+        for alert in list(registry.alerts):
+            lines.append(f"ALERT {alert.machine}: RTP {alert.observed_rtp:.4f} after {alert.spins} spins, "
+                         f"expected {alert.expected_rtp:.4f} +/- {alert.bound:.4f}")
+        return [ServerMessage(player, "\n".join(lines))]
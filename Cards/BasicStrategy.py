@@ -0,0 +1,195 @@
+from ..imports import *
+
+from .Card import Card
+from .DealerOdds import OUTCOMES, BUST, dealer_distribution
+from .Hand import Hand
+
+from typing import TYPE_CHECKING, Dict, Optional
+if TYPE_CHECKING:
+    from coord import Coord
+    from maps.base import Map
+    from tiles.base import MapObject
+    from tiles.map_objects import *
+
+import json
+import os
+
+
+# tables shipped with the package, one per shoe size (1-8 decks); read only at run time
+STRATEGY_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "strategy")
+# where tables missing from STRATEGY_DIR (or outdated) are written once generated
+CACHE_DIR = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+                         "casino", "strategy")
+HIT = "H"
+STAND = "S"
+UPCARDS = "A 2 3 4 5 6 7 8 9 10"   # column order of the table rows
+
+
+class BasicStrategy:
+    """
+    hit/stand decision for every player total and dealer upcard, for the rules BlackjackGame plays:
+    the dealer draws to 17 (standing on soft 17), a player bust loses at once, the player wins
+    the pot (ante back plus one ante) by beating the dealer and loses the ante otherwise, pushes
+    included. the best decision is so the one most likely to win outright
+
+    the table is computed by dynamic programming over card probabilities: for each upcard the
+    dealer's final total comes from DealerOdds, the player's draws use the shoe's card
+    probabilities (without the upcard), and the value of hitting is the best of standing or
+    hitting again on every possible next card. it depends only on the totals, like the usual
+    printed basic strategy charts, so it ignores which exact cards were dealt
+
+    the tables for every shoe size are shipped in Cards/strategy/ as JSON files (rebuild them with
+    generate(decks).save(...) when the rules change) and kept in memory once loaded; a lookup is
+    a single string index
+    """
+    VERSION = 1
+    _loaded: Dict[int, "BasicStrategy"] = {}
+
+    def __init__(self, decks: int, hard: Dict[int, str], soft: Dict[int, str]):
+        """
+        @parameters:
+            decks: number of decks the table was computed for
+            hard: row of decisions per hard total, one "H" or "S" per upcard (ace first)
+            soft: the same for soft totals (an ace counted as 11)
+        """
+        self.decks = decks
+        self.hard = dict(hard)
+        self.soft = dict(soft)
+        # flat table, (soft * 22 + total) * 10 + upcard - 1 -> "H" or "S"; totals not listed stand
+        table = [STAND] * (2 * 22 * 10)
+        for is_soft, rows in ((0, self.hard), (1, self.soft)):
+            for total, row in rows.items():
+                assert len(row) == 10, "a row has one decision per upcard"
+                start = (is_soft * 22 + total) * 10
+                table[start:start + 10] = row
+        self._table = "".join(table)
+
+    def action(self, total: int, soft: bool, upcard: int) -> str:
+        """
+        @parameters:
+            total: the player's blackjack total
+            soft: whether an ace counts as 11 in that total
+            upcard: the dealer's upcard value (1 for an ace, 2-10)
+
+        @returns:
+            "H" to hit or "S" to stand
+        """
+        if total > 21:
+            return STAND
+        return self._table[(soft * 22 + total) * 10 + upcard - 1]
+
+    def action_for(self, hand: Hand, upcard: Card) -> str:
+        """
+        @returns:
+            "H" or "S", the decision for a Hand against the dealer's upcard
+        """
+        return self.action(hand.blackjack_total, hand.soft, upcard.blackjack_value)
+
+    # GENERATION AND CACHING
+
+    @classmethod
+    def generate(cls, decks: int = 1) -> "BasicStrategy":
+        """
+        compute the table by dynamic programming
+
+        @parameters:
+            decks: number of decks in the shoe
+
+        @returns:
+            BasicStrategy for that shoe
+        """
+        hard: Dict[int, list] = {total: [] for total in range(4, 21)}
+        soft: Dict[int, list] = {total: [] for total in range(12, 21)}
+        for upcard in range(1, 11):
+            counts = [4 * decks] * 9 + [16 * decks]
+            counts[upcard - 1] -= 1
+            cards_left = sum(counts)
+            draws = [(value, counts[value - 1] / cards_left) for value in range(1, 11)]
+            dealer = dealer_distribution(upcard, counts)
+            # chance of winning by standing on each total (ties lose the ante)
+            stand = {total: dealer[OUTCOMES.index(BUST)] + sum(p for outcome, p in zip(OUTCOMES, dealer) if outcome < total)
+                     for total in range(2, 22)}
+            best: Dict[tuple, float] = {}
+
+            def value(hard_total: int, has_ace: bool) -> float:
+                if hard_total > 21:
+                    return 0.0
+                key = (hard_total, has_ace)
+                if key not in best:
+                    total = hard_total + 10 if has_ace and hard_total <= 11 else hard_total
+                    hit = sum(p * value(hard_total + card, has_ace or card == 1) for card, p in draws)
+                    best[key] = max(stand[total], hit)
+                    decisions[key] = HIT if hit > stand[total] else STAND
+                return best[key]
+
+            decisions: Dict[tuple, str] = {}
+            for hard_total in range(2, 22):
+                for has_ace in (False, True):
+                    value(hard_total, has_ace)
+            for total in hard:
+                hard[total].append(decisions[(total, False)])
+            for total in soft:
+                soft[total].append(decisions[(total - 10, True)])
+        return cls(decks, {t: "".join(row) for t, row in hard.items()}, {t: "".join(row) for t, row in soft.items()})
+
+    @classmethod
+    def load(cls, decks: int = 1, path: Optional[str] = None) -> "BasicStrategy":
+        """
+        the table for a shoe: from memory, else from the shipped table, else from the user's
+        cache directory, else generated and written to that cache. tables of the default
+        locations are kept in memory; callers should load the table when a table is set up,
+        not in the middle of a game command
+
+        @parameters:
+            decks: number of decks in the shoe
+            path: optional table file to read, or to generate and write; it is not kept in memory
+
+        @returns:
+            BasicStrategy for that shoe
+        """
+        if path is not None:
+            return cls._read(decks, path) or cls._generate_and_save(decks, path)
+        if decks not in cls._loaded:
+            file_name = f"basic_strategy_{decks}.json"
+            cls._loaded[decks] = (cls._read(decks, os.path.join(STRATEGY_DIR, file_name))
+                                  or cls._read(decks, os.path.join(CACHE_DIR, file_name))
+                                  or cls._generate_and_save(decks, os.path.join(CACHE_DIR, file_name)))
+        return cls._loaded[decks]
+
+    @classmethod
+    def _read(cls, decks: int, path: str) -> Optional["BasicStrategy"]:
+        """the table stored at path, or None if there is none for this version and shoe"""
+        if not os.path.exists(path):
+            return None
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != cls.VERSION or data.get("decks") != decks:
+            return None
+        return cls.from_dict(data)
+
+    @classmethod
+    def _generate_and_save(cls, decks: int, path: str) -> "BasicStrategy":
+        strategy = cls.generate(decks)
+        try:
+            strategy.save(path)
+        except OSError:
+            pass    # an unwritable cache still works, it just regenerates next time
+        return strategy
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "BasicStrategy":
+        return cls(data["decks"], {int(t): row for t, row in data["hard"].items()},
+                   {int(t): row for t, row in data["soft"].items()})
+
+    def to_dict(self) -> dict:
+        return {"version": self.VERSION, "decks": self.decks, "upcards": UPCARDS,
+                "hard": {str(t): row for t, row in self.hard.items()},
+                "soft": {str(t): row for t, row in self.soft.items()}}
+
+    def save(self, path: str) -> None:
+        """write the table to a JSON file, atomically"""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+        os.replace(tmp_path, path)
@@ -1,9 +1,9 @@
 from ..imports import *
 
 from .Hand import Hand
-from .Deck import Deck
+from .Shoe import Shoe
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 if TYPE_CHECKING:
     from coord import Coord
     from maps.base import Map
@@ -11,6 +11,7 @@ if TYPE_CHECKING:
     from tiles.map_objects import *
 
 from enum import Enum
+import random
 
 
 class BlackjackGame:
@@ -22,17 +23,23 @@ class BlackjackGame:
     whether to call or fold (via its PokerStrategy)
     """
 
-    def __init__(self, ante: float = 10.0, bet_amount: float = 10.0):
+    def __init__(self, ante: float = 10.0, bet_amount: float = 10.0, decks: int = 1, penetration: float = 0.75,
+                 shoe: Optional[Shoe] = None, rng: Optional[random.Random] = None):
         """
         @parameters:
             ante: the amount each side pays to form the pot.
             bet_amount: the fixed bet the player will place if they choose to bet.
+            decks: number of decks in the shoe (1-8).
+            penetration: fraction of the shoe dealt before it is reshuffled.
+            shoe: optional existing Shoe to deal from, e.g. the one of the table; decks,
+                  penetration and rng are then ignored.
+            rng: optional random number generator for a new shoe, for reproducible games.
 
         @preconditions:
             - ante >= 0
         """
 
-        self.deck = Deck()
+        self.deck = shoe if shoe is not None else Shoe(decks, penetration, rng)
         self.player_hand = Hand()
         self.dealer_hand = Hand()
 
@@ -43,24 +50,23 @@ class BlackjackGame:
 
     def start_new_round(self):
         """
-        reset deck, then shuffle, and deal 2 cards to player and dealer
+        reshuffle the shoe if the cut card came out, and deal 2 cards to player and dealer
 
         @postcoditions:
             - active_round is True
             - pot is 0
             - both hands (player and dealer) contain 2 cards
         """
-        self.deck = Deck()
-        self.deck.shuffle()
+        self.deck.start_round(self)
 
         self.player_hand.clear_hand()
         self.dealer_hand.clear_hand()
 
-        self.player_hand.add_card(self.deck.deal_card())
-        self.player_hand.add_card(self.deck.deal_card())
+        self.player_hand.add_card(self.deck.deal_card(self))
+        self.player_hand.add_card(self.deck.deal_card(self))
 
-        self.dealer_hand.add_card(self.deck.deal_card())
-        self.dealer_hand.add_card(self.deck.deal_card())
+        self.dealer_hand.add_card(self.deck.deal_card(self))
+        self.dealer_hand.add_card(self.deck.deal_card(self))
 
         self.pot = 0.0
 
@@ -68,17 +74,17 @@ class BlackjackGame:
 
     def player_hit(self):
         """
-        deals one card to player and returns a copy
+        deals one card to player and returns it
 
         @returns:
-            copy of Card dealt
+            Card dealt (cards are immutable, so it can be shared)
 
         @preconditions:
             - Deck must contain at least one card
         """
-        card = self.deck.deal_card()
+        card = self.deck.deal_card(self)
         self.player_hand.add_card(card)
-        return card.copy(card)
+        return card
 
     def is_busted(self):
         """
@@ -96,8 +102,8 @@ class BlackjackGame:
             Bool, true if dealer busts, false dealer stands
         """
         # return True if dealer bust, else False.
-        while self.dealer_hand.total_blackjack() < 17:
-            self.dealer_hand.add_card(self.deck.deal_card())
+        while self.dealer_hand.blackjack_total < 17:
+            self.dealer_hand.add_card(self.deck.deal_card(self))
         return self.dealer_hand.is_busted_blackjack()
 
     def determine_winner(self):
@@ -107,8 +113,8 @@ class BlackjackGame:
         @returns:
             'Player', 'Dealer', or 'Push'
         """
-        p_total = self.player_hand.total_blackjack()
-        d_total = self.dealer_hand.total_blackjack()
+        p_total = self.player_hand.blackjack_total
+        d_total = self.dealer_hand.blackjack_total
 
         if p_total > 21:
             return "Dealer"
@@ -144,11 +150,11 @@ class BlackjackGame:
         @returns:
             int of blackjack total of player hand
         """
-        return self.player_hand.total_blackjack()
+        return self.player_hand.blackjack_total
 
     def get_dealer_total(self):
         """
         @returns:
             int of blackjack total of dealers hand
         """
-        return self.dealer_hand.total_blackjack()
+        return self.dealer_hand.blackjack_total
@@ -0,0 +1,81 @@
+from ..imports import *
+
+from .Blackjack import BlackjackGame
+from .BasicStrategy import BasicStrategy, HIT
+
+from typing import TYPE_CHECKING, NamedTuple, Optional
+if TYPE_CHECKING:
+    from coord import Coord
+    from maps.base import Map
+    from tiles.base import MapObject
+    from tiles.map_objects import *
+
+
+class BotResults(NamedTuple):
+    """
+    tally of the rounds a BlackjackBot played
+
+    @attributes:
+        rounds: number of rounds played
+        wins: rounds the bot won
+        pushes: rounds that tied (the ante is lost)
+        losses: rounds the dealer won
+    """
+    rounds: int
+    wins: int
+    pushes: int
+    losses: int
+
+    @property
+    def net_antes(self) -> int:
+        """the bot's net result in antes: a win pays one ante, anything else loses one"""
+        return self.wins - self.pushes - self.losses
+
+
+class BlackjackBot:
+    """
+    a player that plays BlackjackGame rounds by basic strategy, without menus or balances,
+    e.g. to load test the game or measure the house edge of its rules
+    """
+    def __init__(self, game: Optional[BlackjackGame] = None):
+        """
+        @parameters:
+            game: the game to play (a new single deck game by default)
+        """
+        self.game = game if game is not None else BlackjackGame()
+        self.strategy = BasicStrategy.load(self.game.deck.decks)
+
+    def play_round(self) -> str:
+        """
+        deal a round, hit or stand by the strategy and let the dealer finish
+
+        @returns:
+            'Player', 'Dealer', or 'Push'
+        """
+        game = self.game
+        game.start_new_round()
+        upcard = game.dealer_hand.cards[1]
+        while self.strategy.action_for(game.player_hand, upcard) == HIT:
+            game.player_hit()
+        if not game.is_busted():
+            game.dealer_turn()
+        return game.determine_winner()
+
+    def play(self, rounds: int) -> BotResults:
+        """
+        @parameters:
+            rounds: number of rounds to play
+
+        @returns:
+            BotResults of those rounds
+        """
+        wins = pushes = losses = 0
+        for _ in range(rounds):
+            winner = self.play_round()
+            if winner == "Player":
+                wins += 1
+            elif winner == "Push":
+                pushes += 1
+            else:
+                losses += 1
+        return BotResults(rounds, wins, pushes, losses)
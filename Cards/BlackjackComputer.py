@@ -3,6 +3,8 @@ from ..imports import *
 from .Hand import Hand
 from .Deck import Deck
 from .Blackjack import BlackjackGame
+from .Shoe import Shoe
+from .BasicStrategy import BasicStrategy
 from ..COMMANDS.BlackjackCommands import *
 
 from typing import TYPE_CHECKING
@@ -16,15 +18,26 @@ if TYPE_CHECKING:
 from enum import Enum
 import copy
 
-from ..BALANCE.PlayerBalance import BalanceManager, BalanceChangeReason, BalanceEffectObserver, SoundEffectObserver
-
 
 class BlackjackComputer(Computer):
     """
     offers Blackjack via menu commands
-    players can see options like [Deal, Hit, Stand, Quit]
+    players can see options like [Deal, Hit, Stand, Hint, Quit]
+
+    the table owns one Shoe that every player's game deals from, so it is only reshuffled
+    when its cut card comes out, not whenever a round ends; the cards still in play in any
+    player's round are kept out of every reshuffle
     """
-    def __init__(self, image_name: str = 'casino_table4'):
+    def __init__(self, image_name: str = 'casino_table4', decks: int = 1, penetration: float = 0.75):
+        """
+        @parameters:
+            image_name: image of the table
+            decks: number of decks in the table's shoe (1-8)
+            penetration: fraction of the shoe dealt before it is reshuffled
+        """
+        self.shoe = Shoe(decks, penetration)
+        # load the Hint table now, so the command itself never reads or generates it
+        self.strategy = BasicStrategy.load(decks)
         # We'll build a dictionary of menu commands
         # and pass them to the parent Computer constructor.
         self.player_games: dict["HumanPlayer", BlackjackGame] = {}
@@ -33,6 +46,7 @@ class BlackjackComputer(Computer):
             "Deal": BlackjackDealCommand(self),
             "Hit": BlackjackHitCommand(self),
             "Stand": BlackjackStandCommand(self),
+            "Hint": BlackjackHintCommand(self),
             "Quit": BlackjackQuitCommand(self),
         }
 
@@ -51,19 +65,19 @@ class BlackjackComputer(Computer):
 
     def get_or_create_game(self, player: "HumanPlayer") -> BlackjackGame:
         """
-        each player can have a separate game instance
+        each player can have a separate game instance, dealt from the table's shoe
 
         @returns:
             The BlackjackGame instance for the given player
         """
         if player not in self.player_games:
-            self.player_games[player] = BlackjackGame()
+            self.player_games[player] = BlackjackGame(shoe=self.shoe)
         return self.player_games[player]
 
     def remove_game(self, player: "HumanPlayer") -> None:
-        # remove the player's blackjackGame (e.g. after round ends or they quit)
+        # remove the player's blackjackGame (e.g. after round ends or they quit); the shoe stays with the table
         if player in self.player_games:
-            del self.player_games[player]
+            self.shoe.end_round(self.player_games.pop(player))
 
     #PROTOTYPE --------
     def clone(self):
@@ -13,34 +13,77 @@ if TYPE_CHECKING:
 from enum import Enum
 
 
+SUITS = tuple(Suit)
+RANKS = tuple(Rank)
+
+# tables indexed by card index (suit position * 13 + rank position, in enum order)
+RANK_VALUES = tuple(rank.numeric_value() for suit in SUITS for rank in RANKS)
+BLACKJACK_VALUES = tuple(1 if rank == Rank.ACE else min(10, rank.numeric_value()) for suit in SUITS for rank in RANKS)
+LONG_NAMES = tuple(f"{rank.value} of {suit}" for suit in SUITS for rank in RANKS)
+SHORT_NAMES = tuple(f"{rank.short_str()}{suit.short_str()}" for suit in SUITS for rank in RANKS)
+
+
 class Card:
     """
     immutable data object representing a single card with a suit and a rank
+
+    there are only 52 Card instances (flyweights): Card(suit, rank) returns the shared instance
+    for that suit and rank, so dealing and copying cards never allocates. every card also has
+    a small integer index (0-51) into the precomputed value and name tables above
     """
-    def __init__(self, suit: Suit, rank: Rank):
+    __slots__ = ("index", "suit", "rank", "value", "blackjack_value")
+    _cards: tuple = ()
+
+    def __new__(cls, suit: Suit, rank: Rank) -> 'Card':
         """
-        constructs a card from a given suit and rank
+        returns the card of a given suit and rank
 
         @parameters:
             suit: one of the four Suit enum values
             rank: one of the valid Rank enum values
         """
-        self.suit = suit
-        self.rank = rank
+        return cls._cards[SUITS.index(suit) * len(RANKS) + RANKS.index(rank)]
+
+    @classmethod
+    def from_index(cls, index: int) -> 'Card':
+        """
+        @parameters:
+            index: card index from 0 to 51
+
+        @returns:
+            Card with that index
+        """
+        return cls._cards[index]
+
+    @classmethod
+    def _intern(cls, index: int) -> 'Card':
+        card = object.__new__(cls)
+        object.__setattr__(card, "index", index)
+        object.__setattr__(card, "suit", SUITS[index // len(RANKS)])
+        object.__setattr__(card, "rank", RANKS[index % len(RANKS)])
+        object.__setattr__(card, "value", RANK_VALUES[index])
+        object.__setattr__(card, "blackjack_value", BLACKJACK_VALUES[index])
+        return card
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Cards are immutable")
 
     def __str__(self):
         """
         @returns:
             str: long human-readable name for a card (e.g. Ace of Hearts)
         """
-        return f"{self.rank.value} of {self.suit}"
+        return LONG_NAMES[self.index]
+
+    def __repr__(self):
+        return f"Card({SHORT_NAMES[self.index]})"
 
     def short_str(self):
         """
         @returns:
             str: short representation for a card (e.g. 7H for Seven of Hearts)
         """
-        return f"{self.rank.short_str()}{self.suit.short_str()}"
+        return SHORT_NAMES[self.index]
 
     def base_value(self) -> int:
         """
@@ -48,7 +91,7 @@ class Card:
         @returns:
             int from 2-14
         """
-        return self.rank.numeric_value()
+        return self.value
 
     def get_suit(self) -> 'Suit':
         return self.suit
@@ -56,16 +99,28 @@ class Card:
     def get_rank(self) -> 'Rank':
         return self.rank
 
+    def __copy__(self) -> 'Card':
+        return self
+
+    def __deepcopy__(self, memo) -> 'Card':
+        return self
+
+    def __reduce__(self):
+        return (Card.from_index, (self.index,))
+
     @classmethod
     def copy(cls, card : 'Card') -> 'Card':
         """
-        class method that copies an instance of a card
+        class method kept for older callers: cards are immutable flyweights, so the copy is the card itself
 
         @parameters:
             card: Card ojbect to copy
 
         @returns:
-            Card, a new card object with identical values
+            Card, the same card object
         """
-        return cls(card.get_suit(), card.get_rank())
+        return card
+
 
+Card._cards = tuple(Card._intern(index) for index in range(len(SUITS) * len(RANKS)))
+CARDS = Card._cards
@@ -0,0 +1,125 @@
+from ..imports import *
+
+from .Card import Card, BLACKJACK_VALUES, RANKS
+
+from typing import TYPE_CHECKING, Sequence, Tuple, Union
+if TYPE_CHECKING:
+    from coord import Coord
+    from maps.base import Map
+    from tiles.base import MapObject
+    from tiles.map_objects import *
+    from .Blackjack import BlackjackGame
+
+from functools import lru_cache
+
+
+# the dealer's possible final totals; 22 stands for any bust
+OUTCOMES = (17, 18, 19, 20, 21, 22)
+BUST = 22
+
+_BITS = 8   # bits per card value in a packed composition (at most 8 decks * 16 tens = 128 cards)
+_MASK = (1 << _BITS) - 1
+_FRESH_DECK = (4, 4, 4, 4, 4, 4, 4, 4, 4, 16)
+
+
+def value_counts(counts: Sequence[int]) -> Tuple[int, ...]:
+    """
+    collapse a composition to blackjack values
+
+    @parameters:
+        counts: cards left per Rank (13 entries, in enum order TWO ... ACE, e.g. Shoe.rank_counts)
+                or per blackjack value (10 entries, aces first, then 2 ... 9, then ten-valued cards)
+
+    @returns:
+        tuple of 10 counts, for the values 1 (ace) to 10
+    """
+    if len(counts) == 10:
+        return tuple(counts)
+    assert len(counts) == len(RANKS), "a composition has 10 or 13 counts"
+    by_value = [0] * 10
+    for rank_number, count in enumerate(counts):
+        by_value[BLACKJACK_VALUES[rank_number] - 1] += count
+    return tuple(by_value)
+
+
+def pack(counts: Sequence[int]) -> int:
+    """
+    @parameters:
+        counts: 10 counts per blackjack value, as returned by value_counts
+
+    @returns:
+        int holding the counts in 8 bits each, the compact memoization key of a composition
+    """
+    key = 0
+    for value in range(10):
+        assert 0 <= counts[value] <= _MASK, "too many cards of one value"
+        key |= counts[value] << (_BITS * value)
+    return key
+
+
+def dealer_distribution(upcard: Union[Card, int], counts: Sequence[int]) -> Tuple[float, ...]:
+    """
+    exact distribution of the dealer's final total, for BlackjackGame.dealer_turn's rule:
+    the dealer draws until the total is at least 17 (and so stands on soft 17)
+
+    the dealer's other cards are drawn from the composition, without replacement; results are
+    memoized on the packed composition, so repeated queries only cost a cache lookup
+
+    @parameters:
+        upcard: the dealer's visible card, or its blackjack value (1 for an ace, 2-10)
+        counts: the cards the dealer may still draw, per Rank or per value (see value_counts);
+                it must not include the upcard itself
+
+    @returns:
+        tuple of probabilities of the final totals in OUTCOMES (17, 18, 19, 20, 21, bust)
+    """
+    value = upcard.blackjack_value if isinstance(upcard, Card) else upcard
+    assert 1 <= value <= 10, "the upcard value is 1 to 10"
+    by_value = value_counts(counts)
+    return _distribution(value, value == 1, pack(by_value), sum(by_value))
+
+
+def dealer_odds(game: 'BlackjackGame') -> Tuple[float, ...]:
+    """
+    the dealer's final total distribution as the player sees it: the shown card is the upcard
+    and the hidden card is just another unknown card of the shoe
+
+    @parameters:
+        game: a BlackjackGame with an active round
+
+    @returns:
+        tuple of probabilities of the final totals in OUTCOMES
+    """
+    hole, upcard = game.dealer_hand.cards[0], game.dealer_hand.cards[1]
+    counts = list(game.deck.rank_counts)
+    counts[hole.index % len(RANKS)] += 1
+    return dealer_distribution(upcard, counts)
+
+
+def clear_cache() -> None:
+    """forget memoized compositions"""
+    _distribution.cache_clear()
+
+
+@lru_cache(maxsize=1 << 16)
+def _distribution(hard: int, has_ace: bool, packed: int, cards_left: int) -> Tuple[float, ...]:
+    if hard > 21:
+        return (0.0, 0.0, 0.0, 0.0, 0.0, 1.0)
+    total = hard + 10 if has_ace and hard <= 11 else hard
+    if total >= 17:
+        result = [0.0] * len(OUTCOMES)
+        result[total - 17] = 1.0
+        return tuple(result)
+    if cards_left == 0:
+        # the game reshuffles an empty shoe: carry on as with a fresh deck
+        packed, cards_left = pack(_FRESH_DECK), sum(_FRESH_DECK)
+    result = [0.0] * len(OUTCOMES)
+    for value in range(1, 11):
+        count = (packed >> (_BITS * (value - 1))) & _MASK
+        if not count:
+            continue
+        p = count / cards_left
+        sub = _distribution(hard + value, has_ace or value == 1, packed - (1 << (_BITS * (value - 1))), cards_left - 1)
+        for i in range(len(OUTCOMES)):
+            result[i] += p * sub[i]
+    return tuple(result)
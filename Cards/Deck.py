@@ -1,6 +1,6 @@
 from ..imports import *
 
-from .Card import Card, Suit, Rank
+from .Card import Card, Suit, Rank, CARDS
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
@@ -30,8 +30,8 @@ class Deck:
             - self.cards is initialised and may be shuffled / dealt
         """
         if custom_cards is None:
-            # standard ordered 52 card deck
-            self.cards = [Card(suit, rank) for suit in Suit for rank in Rank]
+            # standard ordered 52 card deck, made of the shared Card instances
+            self.cards = list(CARDS)
         else:
             self.cards = []
             for item in custom_cards:
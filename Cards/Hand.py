@@ -23,59 +23,71 @@ class Hand:
     def __init__(self):
         """
         initializes an empty hand
+
+        the blackjack total is kept up to date as cards are added, so reading it is O(1):
+            hard_total: sum of the blackjack values with every ace counted as 1
+            aces: number of aces in the hand
+            blackjack_total: the best total (one ace counted as 11 if that stays <= 21)
+            soft: True if an ace is counted as 11 in blackjack_total
         """
         self.cards: list[Card] = []
+        self.hard_total = 0
+        self.aces = 0
+        self.blackjack_total = 0
+        self.soft = False
 
     def add_card(self, card: Card):
         """
-        appends a card to the hand
+        appends a card to the hand and updates the blackjack totals
 
         @preconditions:
             - card is not None
         """
         if card:
             self.cards.append(card)
+            self.hard_total += card.blackjack_value
+            if card.blackjack_value == 1:
+                self.aces += 1
+            # only one ace can ever count as 11: two would add 22
+            self.soft = self.aces > 0 and self.hard_total <= 11
+            self.blackjack_total = self.hard_total + 10 if self.soft else self.hard_total
 
     def clear_hand(self):
         """
         removes all cards from hand
         """
         self.cards = []
+        self.hard_total = 0
+        self.aces = 0
+        self.blackjack_total = 0
+        self.soft = False
 
     def total_blackjack(self):
         """
-        calculates optimal blackjack total (ace = 1 or 11)
+        optimal blackjack total (ace = 1 or 11), maintained by add_card
 
         for blackjack:
-         - each card's base_value() (with aces = 1, face cards = 10)
-         - upgrade Aces from 1 to 11 if it keeps total <= 21.
+         - each card's blackjack value (with aces = 1, face cards = 10)
+         - upgrade an Ace from 1 to 11 if it keeps total <= 21.
 
          @returns:
             int representing the total value of hand
         """
-        base_sum = 0
-        for card in self.cards:
-            card_value = card.base_value()
-
-            if card.rank == Rank.ACE:
-                card_value = 1
-
-            card_value = min(10, card_value)
-            base_sum += card_value
-
-        ace_count = sum(1 for card in self.cards if card.rank == Rank.ACE)
+        return self.blackjack_total
 
-        for _ in range(ace_count):
-            if base_sum + 10 <= 21:
-                base_sum += 10
-        return base_sum
+    def is_soft_blackjack(self):
+        """
+        @returns:
+            Bool representing whether an ace currently counts as 11
+        """
+        return self.soft
 
     def is_busted_blackjack(self):
         """
         @returns:
             Bool representing whether the current value of hand is more than 21
         """
-        return self.total_blackjack() > 21
+        return self.hard_total > 21
 
     def __str__(self):
         """
@@ -24,6 +24,7 @@ class OneCardPokerGame:
     Then the player can bet or fold, and the AI decides
     whether to call or fold (via its PokerStrategy).
     """
+    DECK_CARDS = (Card(Suit.SPADES, Rank.QUEEN), Card(Suit.SPADES, Rank.KING), Card(Suit.SPADES, Rank.ACE))
 
     def __init__(self, strategy: PokerStrategy, ante: float = 10.0, bet_amount: float = 10.0):
         """
@@ -41,11 +42,7 @@ class OneCardPokerGame:
         self.ante = ante
         self.bet_amount = bet_amount
 
-        self.deck = Deck(custom_cards=[
-            Card(Suit.SPADES, Rank.QUEEN),
-            Card(Suit.SPADES, Rank.KING),
-            Card(Suit.SPADES, Rank.ACE)
-        ])
+        self.deck = Deck(custom_cards=self.DECK_CARDS)
 
         self.player_card: list[Card] = []
         self.ai_card: Optional[Card] = None
@@ -61,11 +58,7 @@ class OneCardPokerGame:
             - pot is 0
             - both hands are empty, and 3-card deck is shuffled
         """
-        self.deck = Deck(custom_cards=[
-            Card(Suit.SPADES, Rank.QUEEN),
-            Card(Suit.SPADES, Rank.KING),
-            Card(Suit.SPADES, Rank.ACE)
-        ])
+        self.deck = Deck(custom_cards=self.DECK_CARDS)
 
         self.deck.shuffle()
 
@@ -107,8 +100,8 @@ class OneCardPokerGame:
         if not self.ai_card or len(self.player_card) == 0:
             return "Tie"
 
-        ai_val = self.ai_card.rank.numeric_value()
-        player_val = self.player_card[0].rank.numeric_value()
+        ai_val = self.ai_card.value
+        player_val = self.player_card[0].value
 
         if player_val > ai_val:
             return "Player"
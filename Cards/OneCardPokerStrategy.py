@@ -59,7 +59,7 @@ class EasyPokerStrategy(PokerStrategy):
         if ai_card is None:
             return False
 
-        card_val = ai_card.rank.numeric_value() # Q=12, K=13, A=14
+        card_val = ai_card.value # Q=12, K=13, A=14
         if card_val == 14:
             # always call aces
             return True
@@ -77,7 +77,7 @@ class MediumPokerStrategy(PokerStrategy):
         if ai_card is None:
             return False
 
-        card_val = ai_card.rank.numeric_value()
+        card_val = ai_card.value
         if card_val == 14:
             # always call aces
             return True
@@ -97,7 +97,7 @@ class HardPokerStrategy(PokerStrategy):
         if ai_card is None:
             return False
 
-        card_val = ai_card.rank.numeric_value()
+        card_val = ai_card.value
 
         total_actions = self.num_bets + self.num_folds
         if total_actions == 0:
@@ -36,22 +36,7 @@ class Rank(Enum):
         @returns:
             int (from 2-14, where Ace is 14)
         """
-        order = {
-            Rank.TWO: 2,
-            Rank.THREE: 3,
-            Rank.FOUR: 4,
-            Rank.FIVE: 5,
-            Rank.SIX: 6,
-            Rank.SEVEN: 7,
-            Rank.EIGHT: 8,
-            Rank.NINE: 9,
-            Rank.TEN: 10,
-            Rank.JACK: 11,
-            Rank.QUEEN: 12,
-            Rank.KING: 13,
-            Rank.ACE: 14
-        }
-        return order[self]
+        return _NUMERIC_VALUES[self]
 
     def short_str(self):
         """
@@ -73,3 +58,7 @@ class Rank(Enum):
             Bool for if first character of self.value is a vowel (A E I O U)
         """
         return self.name[0].lower() in {'a', 'e', 'i', 'o', 'u'}
+
+
+# built once rather than on every numeric_value() call
+_NUMERIC_VALUES = {rank: value for value, rank in enumerate(Rank, start=2)}
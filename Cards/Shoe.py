@@ -0,0 +1,155 @@
+from ..imports import *
+
+from .Card import Card, CARDS, RANKS
+
+from typing import TYPE_CHECKING, Optional
+if TYPE_CHECKING:
+    from coord import Coord
+    from maps.base import Map
+    from tiles.base import MapObject
+    from tiles.map_objects import *
+
+from array import array
+import random
+
+
+class Shoe:
+    """
+    a dealing shoe holding 1 to 8 standard decks, as used at casino blackjack tables
+
+    the cards are a preallocated array of card indices dealt from the front; nothing is
+    allocated per card or per round. a cut card is placed after `penetration` of the shoe:
+    once it has come out, the next round starts with an in-place reshuffle of the shoe.
+    if a round runs the shoe dry anyway, the discards are reshuffled to finish it.
+
+    several games can deal from one shoe (e.g. every player at a table): each passes itself
+    as the owner of its rounds, and a reshuffle never puts back a card that is still in play
+    in any owner's round.
+
+    the shoe also keeps the number of cards left of each rank, e.g. for exact odds
+    """
+    MAX_DECKS = 8
+
+    def __init__(self, decks: int = 1, penetration: float = 0.75, rng: Optional[random.Random] = None):
+        """
+        @parameters:
+            decks: number of 52 card decks in the shoe (1-8)
+            penetration: fraction of the shoe dealt before the cut card comes out
+            rng: optional random number generator, for reproducible shuffles
+
+        @preconditions:
+            - 1 <= decks <= 8
+            - 0 < penetration <= 1
+        """
+        assert 1 <= decks <= self.MAX_DECKS, "a shoe holds 1 to 8 decks"
+        assert 0 < penetration <= 1, "penetration must be in (0, 1]"
+        self.decks = decks
+        self.penetration = penetration
+        self._rng = rng if rng is not None else random.Random()
+        self._indices = array('B', range(len(CARDS))) * decks
+        self.cut = max(1, round(len(self._indices) * penetration))
+        self._position = 0
+        self._in_play: dict = {}    # owner -> card indices dealt in its current round
+        self._rank_counts = [0] * len(RANKS)
+        self.shuffle()
+
+    def shuffle(self):
+        """
+        put every card that is not in play back and shuffle them in place
+
+        the cards in play are moved to the front of the shoe, as if already dealt
+        """
+        in_play = array('B')
+        for cards in self._in_play.values():
+            in_play.extend(cards)
+        copies = [self.decks] * len(CARDS)
+        for index in in_play:
+            copies[index] -= 1
+        assert len(in_play) < len(self._indices), "the shoe has no cards left to deal"
+        self._indices[:len(in_play)] = in_play
+        position = len(in_play)
+        for index, count in enumerate(copies):
+            self._indices[position:position + count] = array('B', [index]) * count
+            position += count
+        self._shuffle_from(len(in_play))
+        self._position = len(in_play)
+        self._rank_counts = [0] * len(RANKS)
+        for index, count in enumerate(copies):
+            self._rank_counts[index % len(RANKS)] += count
+
+    def start_round(self, owner=None) -> bool:
+        """
+        called before dealing a round: the owner's previous cards become discards, and the
+        shoe is reshuffled if the cut card has come out
+
+        @parameters:
+            owner: the game dealing the round, if several games share the shoe
+
+        @returns:
+            Bool, true if the shoe was reshuffled
+        """
+        self.end_round(owner)
+        self._in_play[owner] = array('B')
+        reshuffled = self._position >= self.cut
+        if reshuffled:
+            self.shuffle()
+        return reshuffled
+
+    def end_round(self, owner=None):
+        """
+        put the owner's cards in play to the discards, e.g. when its game leaves the table
+
+        @parameters:
+            owner: the game that dealt the round
+        """
+        self._in_play.pop(owner, None)
+
+    def deal_card(self, owner=None) -> Card:
+        """
+        deal the next card
+
+        @parameters:
+            owner: the game the card is dealt to, if several games share the shoe
+
+        @returns:
+            Card from the shoe
+        """
+        if self._position == len(self._indices):
+            self.shuffle()
+        index = self._indices[self._position]
+        self._position += 1
+        self._rank_counts[index % len(RANKS)] -= 1
+        self._in_play.setdefault(owner, array('B')).append(index)
+        return CARDS[index]
+
+    @property
+    def cards(self) -> list:
+        """
+        @returns:
+            list of the Cards left in the shoe, in dealing order
+        """
+        return [CARDS[index] for index in self._indices[self._position:]]
+
+    @property
+    def rank_counts(self) -> tuple:
+        """
+        @returns:
+            tuple with the number of cards left of each Rank, in enum order (TWO ... ACE);
+            cards in play in any round are not counted
+        """
+        return tuple(self._rank_counts)
+
+    def __len__(self):
+        """
+        @returns:
+            int representing the number of cards left in the shoe
+        """
+        return len(self._indices) - self._position
+
+    def _shuffle_from(self, start: int):
+        """Fisher-Yates shuffle of self._indices[start:], in place."""
+        indices = self._indices
+        randrange = self._rng.randrange
+        for i in range(len(indices) - 1, start, -1):
+            j = start + randrange(i - start + 1)
+            indices[i], indices[j] = indices[j], indices[i]
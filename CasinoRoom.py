@@ -2,6 +2,7 @@ from .imports import *
 from .NPCs.NPCClone import *
 #from CasinoRoyale.BALANCE.PlayerBalance import *
 from .GAME.SlotMachine import *
+from .GAME.MultiLineSlotMachine import MultiLineSlotMachineUtility
 from .Cards.BlackjackComputer import BlackjackComputer
 from .Cards.OneCardPokerComputer import OneCardPokerComputer
 from .Cards.OneCardPokerStrategy import EasyPokerStrategy, MediumPokerStrategy, HardPokerStrategy
@@ -10,6 +11,9 @@ from .Cards.OneCardPokerStrategy import EasyPokerStrategy, MediumPokerStrategy,
 from typing import TYPE_CHECKING
 
 from .COMMANDS.BalanceCommand import BalanceCommand
+from .COMMANDS.LeaderboardCommand import LeaderboardCommand, leaderboard_text
+from .COMMANDS.AutoSpinCommand import AutoSpinCommand
+from .COMMANDS.RtpCommand import RtpCommand
 
 if TYPE_CHECKING:
     from coord import Coord
@@ -31,7 +35,7 @@ class CasinoRoom(Map):
             entry_point=Coord(14, 7),
             background_tile_image='blue_tile',
             background_music='casino_bg',
-            chat_commands = [BalanceCommand],
+            chat_commands = [BalanceCommand, LeaderboardCommand, AutoSpinCommand, RtpCommand],
         )
 
 
@@ -71,6 +75,10 @@ class CasinoRoom(Map):
         slotmachine = SlotMachineUtility()
         objects.append((slotmachine, Coord(6,6)))
 
+        # 5-reel, 20-line slot machine
+        multiline_slotmachine = MultiLineSlotMachineUtility()
+        objects.append((multiline_slotmachine, Coord(6,8)))
+
         # blackjack
         blackjack_table = BlackjackComputer()
         objects.append((blackjack_table, Coord(9, 2)))
@@ -94,6 +102,10 @@ class CasinoRoom(Map):
         objects.append((h_poker_table, Coord(7, 1)))
 
 
+        # sign showing the richest players
+        leaderboard_sign = LeaderboardSign('signpost')
+        objects.append((leaderboard_sign, Coord(12, 13)))
+
         slotmachine2 = SlotMachineUtility(image_name ="slot_machine2")
 
         for x in range(0, 15):
@@ -104,3 +116,21 @@ class CasinoRoom(Map):
 
         return objects
 
+
+class LeaderboardSign(Sign):
+    """
+    A signpost that, when interacted with, displays the richest players from the balance leaderboard.
+    @param top (int): The number of players listed on the sign.
+    """
+    def __init__(self, image_name: str = 'signpost', top: int = 5) -> None:
+        super().__init__(image_name)
+        self._top: int = top
+
+    def player_interacted(self, player: "HumanPlayer") -> list[Message]:
+        """
+        Handle player interaction by showing the leaderboard and the player's own rank.
+
+        @param player: The HumanPlayer who interacted
+        @returns: A list with one DialogueMessage showing the leaderboard
+        """
+        return [DialogueMessage(self, player, leaderboard_text(self._top, player), 'sign')]
@@ -0,0 +1,171 @@
+import json
+import os
+
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from .Paytable import PAYTABLE_DIR
+
+
+class LineEvaluation(NamedTuple):
+    """
+    Outcome of one window of a multi-line machine.
+
+    Attributes:
+        line_pay (int): Sum of the winning lines' pays, in line bets.
+        winning_lines (int): Number of paylines that paid.
+        scatters (int): Number of scatter symbols anywhere in the window.
+        scatter_pay (int): The scatter pay, in total bets.
+        jackpot (bool): True if a line shows the jackpot symbol on every reel (wilds only
+            count when the paytable's jackpot_wilds is set).
+        jackpot_pay (int): The jackpot symbol's full-line pay on each such line, in line bets.
+    """
+    line_pay: int
+    winning_lines: int
+    scatters: int
+    scatter_pay: int
+    jackpot: bool
+    jackpot_pay: int = 0
+
+
+class MultiLinePaytable:
+    """
+    Configuration of a multi-reel, multi-payline slot machine with wild and scatter symbols.
+
+    The window is `reels` columns of `rows` symbols each, stored reel by reel. A line pays when
+    its symbols match from the leftmost reel for at least 3 reels; the wild substitutes for any
+    paying symbol, scatters pay on their count anywhere in the window.
+
+    Paylines are evaluated all at once with bitmasks: bit i of a mask stands for line i, and
+    every window cell is precompiled to the mask of the lines running through it. For a spin,
+    each symbol gets one mask per reel (the lines on which that reel shows the symbol or a wild);
+    AND-ing them from the left leaves the lines that still match after each reel. The cost
+    depends on the number of symbols and reels, not on the number of lines.
+
+    Attributes:
+        symbols (List[str]): The symbols, in stop order.
+        weights (List[float]): The weight of each symbol on every cell.
+        lines (List[Tuple[int, ...]]): The row of each payline on every reel.
+        pays (Dict[str, Tuple[int, ...]]): Line pays in line bets for 3, 4, ... reels matched.
+        scatter_pays (Dict[int, int]): Scatter pays in total bets by scatter count.
+        jackpot_wilds (bool): Whether wilds complete a jackpot line (by default only the
+            jackpot symbol itself does, so a line of wilds pays as wilds).
+    """
+    DEFAULT_FILE = "multiline.json"
+    MIN_MATCH = 3
+
+    def __init__(self, symbols: Sequence[str], weights: Sequence[float], lines: Sequence[Sequence[int]],
+                 pays: Dict[str, Sequence[int]], reels: int = 5, rows: int = 3, wild: Optional[str] = None,
+                 scatter: Optional[str] = None, scatter_pays: Optional[Dict[int, int]] = None,
+                 jackpot: Optional[str] = None, name: str = "", jackpot_wilds: bool = False) -> None:
+        """
+        Preconditions:
+            - symbols are unique with one non-negative weight each.
+            - every line gives a row in range(rows) for each of the reels.
+            - pays give one multiplier for each match length from 3 to reels.
+        """
+        assert len(set(symbols)) == len(symbols), "Symbols must be unique."
+        assert len(symbols) == len(weights) and all(w >= 0 for w in weights) and sum(weights) > 0, "Every symbol needs a non-negative weight."
+        assert reels >= self.MIN_MATCH and rows >= 1, "The window is too small."
+        assert lines, "A machine needs at least one payline."
+        self.name = name
+        self.reels = reels
+        self.rows = rows
+        self.symbols: List[str] = list(symbols)
+        self.weights: List[float] = [float(w) for w in weights]
+        self.index: Dict[str, int] = {symbol: i for i, symbol in enumerate(self.symbols)}
+        self.lines: List[Tuple[int, ...]] = [tuple(line) for line in lines]
+        for line in self.lines:
+            assert len(line) == reels and all(0 <= row < rows for row in line), f"Invalid payline {line}."
+        self.pays: Dict[str, Tuple[int, ...]] = {symbol: tuple(p) for symbol, p in pays.items()}
+        for symbol, p in self.pays.items():
+            assert symbol in self.index and symbol != scatter, f"Invalid paying symbol {symbol}."
+            assert len(p) == reels - self.MIN_MATCH + 1, f"{symbol} needs a pay for 3 to {reels} reels."
+        self.wild = self.index[wild] if wild is not None else -1
+        self.scatter = self.index[scatter] if scatter is not None else -1
+        self.scatter_pays: Dict[int, int] = {int(k): int(v) for k, v in (scatter_pays or {}).items()}
+        self.jackpot = self.index[jackpot] if jackpot is not None else -1
+        self.jackpot_wilds = jackpot_wilds
+
+        self.all_lines = (1 << len(self.lines)) - 1
+        # cell_lines[reel * rows + row] = mask of the lines running through that cell
+        self.cell_lines: List[int] = [0] * (reels * rows)
+        for number, line in enumerate(self.lines):
+            for reel, row in enumerate(line):
+                self.cell_lines[reel * rows + row] |= 1 << number
+        # (pay, symbol index, reels matched), best first: each line is paid its best combination only
+        self.combos: List[Tuple[int, int, int]] = sorted(
+            ((pay, self.index[symbol], self.MIN_MATCH + i) for symbol, p in self.pays.items() for i, pay in enumerate(p) if pay > 0),
+            reverse=True)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "MultiLinePaytable":
+        return cls(data["symbols"], data["weights"], data["lines"], data["pays"], reels=data.get("reels", 5),
+                   rows=data.get("rows", 3), wild=data.get("wild"), scatter=data.get("scatter"),
+                   scatter_pays=data.get("scatter_pays"), jackpot=data.get("jackpot"), name=data.get("name", ""),
+                   jackpot_wilds=data.get("jackpot_wilds", False))
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_FILE) -> "MultiLinePaytable":
+        """
+        Load a multi-line paytable from a JSON file; a bare file name is looked up in the paytables directory.
+        """
+        if not os.path.dirname(path):
+            path = os.path.join(PAYTABLE_DIR, path)
+        with open(path, encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+    def evaluate(self, window: Sequence[int]) -> LineEvaluation:
+        """
+        Pay every line of a window at once.
+
+        Parameters:
+            window (Sequence[int]): Symbol indices, reel by reel (window[reel * rows + row]).
+
+        Returns:
+            LineEvaluation: The line and scatter pays.
+        """
+        reels, rows, wild, scatter = self.reels, self.rows, self.wild, self.scatter
+        # masks[symbol][reel] = lines on which the reel shows the symbol
+        masks = [[0] * reels for _ in self.symbols]
+        scatters = 0
+        for cell, symbol in enumerate(window):
+            if symbol == scatter:
+                scatters += 1
+            else:
+                masks[symbol][cell // rows] |= self.cell_lines[cell]
+        wilds = masks[wild] if wild >= 0 else [0] * reels
+
+        # matched[symbol][k] = lines matching the symbol on exactly the first k reels (k >= 3)
+        matched: Dict[int, Dict[int, int]] = {}
+        for _, symbol, _ in self.combos:
+            if symbol in matched:
+                continue
+            symbol_masks = masks[symbol]
+            running = self.all_lines
+            prefixes = []
+            for reel in range(reels):
+                running &= symbol_masks[reel] | wilds[reel]
+                if not running:
+                    break
+                prefixes.append(running)
+            exact = {}
+            for k in range(self.MIN_MATCH, len(prefixes) + 1):
+                exact[k] = prefixes[k - 1] & ~prefixes[k] if k < len(prefixes) else prefixes[k - 1]
+            matched[symbol] = exact
+
+        paid = 0
+        line_pay = 0
+        for pay, symbol, k in self.combos:
+            lines = matched[symbol].get(k, 0) & ~paid
+            if lines:
+                line_pay += pay * bin(lines).count("1")
+                paid |= lines
+        # jackpot lines show the jackpot symbol itself on every reel
+        jackpot_lines = jackpot_pay = 0
+        if self.jackpot >= 0:
+            jackpot_lines = self.all_lines
+            for reel in range(reels):
+                jackpot_lines &= masks[self.jackpot][reel] | (wilds[reel] if self.jackpot_wilds else 0)
+            jackpot_pay = bin(jackpot_lines).count("1") * self.pays.get(self.symbols[self.jackpot], (0,))[-1]
+        return LineEvaluation(line_pay, bin(paid).count("1"), scatters, self.scatter_pays.get(scatters, 0),
+                              bool(jackpot_lines), jackpot_pay)
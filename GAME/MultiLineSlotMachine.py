@@ -0,0 +1,151 @@
+from ..imports import *
+import itertools
+
+from typing import TYPE_CHECKING, List, Optional, Tuple
+if TYPE_CHECKING:
+    from coord import Coord
+    from maps.base import Map
+    from tiles.base import MapObject
+    from tiles.map_objects import *
+
+from ..BALANCE.PlayerBalance import *
+from .MultiLinePaytable import MultiLinePaytable
+from .ProgressiveJackpot import JackpotMeter, ProgressiveJackpot
+from .ReelSampler import ReelSampler
+from .RtpMonitor import RtpMonitor, RtpMonitors
+from .SlotMachine import SlotMachine, SlotMachineStrategy, SlotMachineUtility, SpinResult
+
+
+class MultiLineStrategy(SlotMachineStrategy):
+    """
+    Pays a multi-line window from a MultiLinePaytable.
+
+    The spin cost is the total bet, spread evenly over the paylines; line pays are multiples
+    of the line bet and scatter pays multiples of the total bet.
+    """
+    def __init__(self, paytable: MultiLinePaytable) -> None:
+        self.paytable = paytable
+
+    def calculate_payout(self, spin_cost: int, reels: List[str]) -> Tuple[int, str]:
+        return self.spin_outcome(spin_cost, reels)[:2]
+
+    def spin_outcome(self, spin_cost: int, reels: List[str]) -> Tuple[int, str, BalanceChangeReason, Optional[str]]:
+        """
+        Parameters:
+            spin_cost (int): The total bet.
+            reels (List[str]): The window's symbols, reel by reel.
+        """
+        paytable = self.paytable
+        result = paytable.evaluate([paytable.index[symbol] for symbol in reels])
+        total_win = round(spin_cost * (result.line_pay / len(paytable.lines) + result.scatter_pay), 2)
+        assert total_win >= 0, "Calculated win amount must be non-negative."
+        if total_win == 0:
+            return (0, "No win, better luck next time.", BalanceChangeReason.LOSE, None)
+        parts = []
+        if result.winning_lines:
+            parts.append(f"{result.winning_lines} winning line{'s' if result.winning_lines > 1 else ''}")
+        if result.scatter_pay:
+            parts.append(f"{result.scatters} scatters")
+        if result.jackpot:
+            return (total_win, f"JACKPOT HIT!! {', '.join(parts)}", BalanceChangeReason.JACKPOT, None)
+        return (total_win, f"{', '.join(parts)}! YOU WIN ${total_win:.2f}!!", BalanceChangeReason.WIN, 'wheel')
+
+    def cache_key(self) -> tuple:
+        return (MultiLineStrategy, id(self.paytable))
+
+
+class MultiLineSlotMachine(SlotMachine):
+    """
+    A 5-reel, multi-payline slot machine (multiline.json by default).
+
+    Unlike the classic SlotMachine it is not a singleton: each utility holds its own machine.
+    It reuses the classic machine's round logic (charging, payouts, progressive jackpot,
+    autospin) and only changes how the window is spun, paid and shown.
+    """
+    _numbers = itertools.count(1)   # tells the machines' RTP monitors apart
+
+    def __new__(cls, spin_cost: int = 10, paytable: Optional[MultiLinePaytable] = None) -> "MultiLineSlotMachine":
+        return object.__new__(cls)
+
+    def __init__(self, spin_cost: int = 10, paytable: Optional[MultiLinePaytable] = None) -> None:
+        """
+        Parameters:
+            spin_cost (int): The total bet per spin.
+            paytable (MultiLinePaytable): The machine's configuration (defaults to multiline.json).
+
+        Preconditions:
+            - spin_cost must be >= 0.
+        """
+        assert spin_cost >= 0, "Spin cost must be non-negative."
+        self.spin_cost: int = spin_cost
+        self.paytable: MultiLinePaytable = paytable if paytable is not None else MultiLinePaytable.load()
+        self.symbols: List[str] = list(self.paytable.symbols)
+        self.reel_sampler: ReelSampler = ReelSampler(self.paytable.weights)
+        self.messages: List["Message"] = []
+        self.strategy: SlotMachineStrategy = MultiLineStrategy(self.paytable)
+        self.rtp_monitor: RtpMonitor = RtpMonitors().register(f"{self.paytable.name or 'multi-line'} #{next(self._numbers)}", self.theoretical)
+        self.initialized = True
+
+    def get_image_name(self) -> str:
+        return "slot_machine2"
+
+    def theoretical(self) -> None:
+        """Multi-line windows are not enumerated exactly, so the monitor only tracks the statistics."""
+        return None
+
+    def progressive(self, result: SpinResult, meter: Optional[JackpotMeter]) -> SpinResult:
+        """
+        Replace the jackpot lines' fixed pay by the progressive pool, keeping the other lines' and the scatter wins.
+
+        Parameters:
+            result (SpinResult): The spin.
+            meter (JackpotMeter): The machine's jackpot meter, None for a fixed jackpot.
+        """
+        if meter is None or result.reason != BalanceChangeReason.JACKPOT:
+            return result
+        evaluation = self.paytable.evaluate([self.paytable.index[symbol] for symbol in result.reels])
+        rest = round(result.win_amount - self.spin_cost * evaluation.jackpot_pay / len(self.paytable.lines), 2)
+        amount = meter.award()
+        text = f"PROGRESSIVE JACKPOT HIT!! ${amount:.2f}"
+        if rest > 0:
+            text += f" plus ${rest:.2f} from the rest of the spin"
+        return result._replace(win_amount=round(amount + rest, 2), outcome_text=text, progressive_amount=amount)
+
+    def spin_reels(self) -> List[str]:
+        """
+        Returns:
+            List[str]: The window's symbols, reel by reel (rows symbols per reel).
+        """
+        sample = self.reel_sampler.sample
+        return [self.symbols[sample()] for _ in range(self.paytable.reels * self.paytable.rows)]
+
+    def render_spin(self, result: SpinResult, player: "HumanPlayer", sender: object) -> List["Message"]:
+        rows, reels = self.paytable.rows, self.paytable.reels
+        window = "\n".join(" ".join(result.reels[reel * rows + row] for reel in range(reels)) for row in range(rows))
+        messages: List["Message"] = [
+            SoundMessage(player, 'playing'),
+            DialogueMessage(sender, player, f"{len(self.paytable.lines)} lines:\n{window}", self.get_image_name()),
+        ]
+        if result.sound is not None:
+            messages.append(SoundMessage(player, result.sound))
+        messages.append(DialogueMessage(sender, player, result.outcome_text, self.get_image_name()))
+        return messages
+
+
+class MultiLineSlotMachineUtility(SlotMachineUtility):
+    """
+    Utility object placing a 5-reel multi-line slot machine in a room.
+    """
+    WELCOME_TEXT = "Welcome to the 5-reel slot machine!"
+
+    def __init__(self, image_name: str = 'slot_machine2', spin_cost: float = 10,
+                 paytable: Optional[MultiLinePaytable] = None) -> None:
+        """
+        Parameters:
+            image_name (str): The image identifier for the utility
+            spin_cost (float): The total bet per spin
+            paytable (MultiLinePaytable): The machine's configuration (defaults to multiline.json)
+        """
+        UtilityObject.__init__(self, image_name, passable=False)
+        self.slot_machine: MultiLineSlotMachine = MultiLineSlotMachine(spin_cost, paytable)
+        self.jackpot_meter = ProgressiveJackpot().meter()
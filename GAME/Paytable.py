@@ -0,0 +1,191 @@
+import itertools
+import json
+import os
+
+from array import array
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+
+PAYTABLE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "paytables")
+WILDCARD = "*"
+
+
+class PaytableEntry(NamedTuple):
+    """
+    One paying combination of a paytable.
+
+    Attributes:
+        symbols (Tuple[str, ...]): The pattern, one symbol per reel; "*" matches any symbol.
+        same (bool): If True, every reel must also show the same symbol.
+        multiplier (int): The payout as a multiple of the spin cost.
+        wheel (Tuple[int, ...]): Optional extra multipliers, one drawn uniformly per win.
+        reason (str): Name of the BalanceChangeReason of the win (e.g. "WIN", "JACKPOT").
+        sound (Optional[str]): Sound played on the win, if any.
+        text (str): Outcome text; "{wheel}" is replaced by the drawn wheel multiplier.
+    """
+    symbols: Tuple[str, ...]
+    same: bool
+    multiplier: int
+    wheel: Tuple[int, ...]
+    reason: str
+    sound: Optional[str]
+    text: str
+
+    def matches(self, reels: Sequence[str]) -> bool:
+        if self.same and any(symbol != reels[0] for symbol in reels):
+            return False
+        return all(pattern == WILDCARD or pattern == symbol for pattern, symbol in zip(self.symbols, reels))
+
+
+class Paytable:
+    """
+    Data-driven slot machine configuration: symbols, reel weights and paying combinations.
+
+    Paytables are defined in JSON files (see paytables/classic.json). On load, every possible
+    reel outcome is matched once against the combinations (the first matching one wins) and the
+    result is compiled into a flat table indexed by the reel stops, so evaluating a spin is a
+    single array lookup:
+
+        table[stops[0] * n ** (reels - 1) + ... + stops[-1]]  ->  entry number (0 = no win)
+
+    Attributes:
+        name (str): The paytable's name.
+        reels (int): Number of reels.
+        symbols (List[str]): The symbols, in stop order.
+        weights (List[float]): The weight of each symbol on every reel.
+        entries (List[Optional[PaytableEntry]]): The combinations; entries[0] is None (no win).
+        lose_text (str): Outcome text of a spin that pays nothing.
+    """
+    DEFAULT_FILE = "classic.json"
+    _default: Optional["Paytable"] = None
+
+    def __init__(self, symbols: Sequence[str], weights: Sequence[float], combinations: Sequence[dict],
+                 name: str = "", reels: int = 3, lose_text: str = "No win, better luck next time.") -> None:
+        """
+        Parameters:
+            symbols (Sequence[str]): The symbols, in stop order.
+            weights (Sequence[float]): The weight of each symbol on every reel.
+            combinations (Sequence[dict]): The paying combinations, in priority order, as in the JSON format.
+            name (str): The paytable's name.
+            reels (int): Number of reels.
+            lose_text (str): Outcome text of a spin that pays nothing.
+
+        Preconditions:
+            - symbols are unique and each has a non-negative weight, with a positive total.
+            - every combination has one pattern item per reel, each a symbol or "*".
+        """
+        assert len(set(symbols)) == len(symbols), "Symbols must be unique."
+        assert len(symbols) == len(weights), "Every symbol needs a weight."
+        assert all(w >= 0 for w in weights) and sum(weights) > 0, "Weights must be non-negative with a positive sum."
+        assert reels >= 1, "A paytable needs at least one reel."
+        self.name = name
+        self.reels = reels
+        self.symbols: List[str] = list(symbols)
+        self.weights: List[float] = [float(w) for w in weights]
+        self.lose_text = lose_text
+        self.index: Dict[str, int] = {symbol: i for i, symbol in enumerate(self.symbols)}
+        self.entries: List[Optional[PaytableEntry]] = [None]
+        for combination in combinations:
+            entry = PaytableEntry(
+                symbols=tuple(combination["symbols"]),
+                same=bool(combination.get("same", False)),
+                multiplier=int(combination["multiplier"]),
+                wheel=tuple(int(m) for m in combination.get("wheel", ())),
+                reason=combination.get("reason", "WIN"),
+                sound=combination.get("sound"),
+                text=combination.get("text", "YOU WIN!!"),
+            )
+            assert len(entry.symbols) == reels, "A combination needs one pattern item per reel."
+            assert all(s == WILDCARD or s in self.index for s in entry.symbols), f"Unknown symbol in {entry.symbols}."
+            assert entry.multiplier >= 0 and all(m >= 0 for m in entry.wheel), "Multipliers must be non-negative."
+            self.entries.append(entry)
+        self.table = self._compile()
+
+    # LOADING AND SAVING
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Paytable":
+        return cls(data["symbols"], data["weights"], data.get("combinations", []), name=data.get("name", ""),
+                   reels=data.get("reels", 3), lose_text=data.get("lose_text", "No win, better luck next time."))
+
+    @classmethod
+    def load(cls, path: str) -> "Paytable":
+        """
+        Load a paytable from a JSON file; a bare file name is looked up in the paytables directory.
+        """
+        if not os.path.dirname(path):
+            path = os.path.join(PAYTABLE_DIR, path)
+        with open(path, encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+    @classmethod
+    def default(cls) -> "Paytable":
+        """
+        Returns:
+            Paytable: The classic machine's paytable, loaded once.
+        """
+        if cls._default is None:
+            cls._default = cls.load(cls.DEFAULT_FILE)
+        return cls._default
+
+    def to_dict(self) -> dict:
+        combinations = []
+        for entry in self.entries[1:]:
+            combination = {"symbols": list(entry.symbols), "multiplier": entry.multiplier, "reason": entry.reason, "text": entry.text}
+            if entry.same:
+                combination["same"] = True
+            if entry.wheel:
+                combination["wheel"] = list(entry.wheel)
+            if entry.sound is not None:
+                combination["sound"] = entry.sound
+            combinations.append(combination)
+        return {"name": self.name, "reels": self.reels, "symbols": list(self.symbols), "weights": list(self.weights),
+                "lose_text": self.lose_text, "combinations": combinations}
+
+    def save(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    # EVALUATION
+
+    def flat_index(self, stops: Sequence[int]) -> int:
+        position = 0
+        for stop in stops:
+            position = position * len(self.symbols) + stop
+        return position
+
+    def lookup(self, stops: Sequence[int]) -> Optional[PaytableEntry]:
+        """
+        Returns:
+            Optional[PaytableEntry]: The combination paid by the reel stops, None if they do not pay.
+        """
+        return self.entries[self.table[self.flat_index(stops)]]
+
+    def lookup_symbols(self, reels: Sequence[str]) -> Optional[PaytableEntry]:
+        """
+        Returns:
+            Optional[PaytableEntry]: The combination paid by the reel symbols, None if they do not pay
+            (or are not symbols of this paytable).
+        """
+        index = self.index
+        if len(reels) != self.reels or any(symbol not in index for symbol in reels):
+            return None
+        return self.lookup([index[symbol] for symbol in reels])
+
+    def fingerprint(self) -> tuple:
+        """
+        Returns:
+            tuple: A hashable value identifying the configuration (used to cache evaluations).
+        """
+        return (self.reels, tuple(self.symbols), tuple(self.weights), tuple(self.entries[1:]))
+
+    def _compile(self) -> array:
+        n = len(self.symbols)
+        table = array('H', bytes(2 * n ** self.reels))
+        for stops in itertools.product(range(n), repeat=self.reels):
+            reels = [self.symbols[stop] for stop in stops]
+            for number, entry in enumerate(self.entries[1:], start=1):
+                if entry.matches(reels):
+                    table[self.flat_index(stops)] = number
+                    break
+        return table
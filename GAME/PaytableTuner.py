@@ -0,0 +1,250 @@
+import itertools
+import math
+import random
+import time
+
+from collections import Counter
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+from .Paytable import Paytable
+from .SlotEvaluator import PaytableEvaluation, evaluate_paytable
+
+
+class TuningTargets(NamedTuple):
+    """
+    What a tuned paytable must achieve; targets left as None are not constrained.
+
+    Attributes:
+        rtp (float): Return to player, e.g. 0.94.
+        hit_frequency (Optional[float]): Probability that a spin pays anything.
+        volatility (Optional[float]): Standard deviation of the payout per spin, in spin costs.
+        *_tolerance (float): Largest accepted absolute distance from each target.
+    """
+    rtp: float
+    hit_frequency: Optional[float] = None
+    volatility: Optional[float] = None
+    rtp_tolerance: float = 0.002
+    hit_frequency_tolerance: float = 0.01
+    volatility_tolerance: float = 0.25
+
+
+class TuningResult(NamedTuple):
+    """
+    Outcome of a tuning run.
+
+    Attributes:
+        paytable (Paytable): The best configuration found (save it with paytable.save()).
+        evaluation (PaytableEvaluation): Its exact evaluation.
+        met (bool): True if every target is met within its tolerance.
+        candidates (int): Number of configurations evaluated.
+        seconds (float): Duration of the search.
+    """
+    paytable: Paytable
+    evaluation: PaytableEvaluation
+    met: bool
+    candidates: int
+    seconds: float
+
+    @property
+    def candidates_per_second(self) -> float:
+        return self.candidates / self.seconds if self.seconds > 0 else float("inf")
+
+
+class PaytableTuner:
+    """
+    Searches a paytable's reel weights and multipliers for a target RTP, hit frequency and volatility.
+
+    The combinations (which outcomes pay, and in what order) stay as they are, so the paytable's
+    compiled table is reused: every outcome is grouped by its symbol counts once, and the
+    probability of each combination becomes a sum of products of the symbol probabilities. A
+    candidate configuration is then measured exactly, like SlotEvaluator does, without
+    enumerating the reels again, which makes thousands of candidates per second affordable.
+
+    The search is simulated annealing: each step rescales one symbol's weight or moves one
+    multiplier, then the top prize's multiplier is solved for the target RTP; the best
+    configuration seen is returned.
+
+    Usage:
+        result = PaytableTuner(Paytable.default(), seed=1).tune(TuningTargets(rtp=0.94, hit_frequency=0.3))
+        result.paytable.save("paytables/tuned.json")
+    """
+    def __init__(self, paytable: Paytable, tune_weights: bool = True, tune_multipliers: bool = True,
+                 min_weight: float = 0.001, max_multiplier: int = 1000, seed: Optional[int] = None) -> None:
+        """
+        Parameters:
+            paytable (Paytable): The starting configuration.
+            tune_weights (bool): Whether the reel weights may change.
+            tune_multipliers (bool): Whether the combinations' multipliers may change (paying
+                combinations keep paying at least 1).
+            min_weight (float): Smallest probability a symbol can be given.
+            max_multiplier (int): Largest multiplier a combination can be given.
+            seed (int): Optional seed, for reproducible searches.
+
+        Preconditions:
+            - at least one of tune_weights and tune_multipliers is True.
+            - 0 < min_weight < 1 / number of symbols.
+        """
+        assert tune_weights or tune_multipliers, "Nothing to tune."
+        assert 0 < min_weight < 1 / len(paytable.symbols), "The minimum weight must leave room for every symbol."
+        self.paytable = paytable
+        self.tune_weights = tune_weights
+        self.tune_multipliers = tune_multipliers
+        self.min_weight = min_weight
+        self.max_multiplier = max_multiplier
+        self.rng = random.Random(seed)
+
+        entries = paytable.entries[1:]
+        # per combination: mean wheel multiplier, mean squared wheel multiplier, chance the wheel pays
+        self._wheel_stats: List[Tuple[float, float, float]] = []
+        for entry in entries:
+            wheel = entry.wheel or (1,)
+            self._wheel_stats.append((sum(wheel) / len(wheel), sum(m * m for m in wheel) / len(wheel),
+                                      sum(1 for m in wheel if m > 0) / len(wheel)))
+        # the outcomes paying each combination, grouped by symbol counts: (number of outcomes, ((symbol, count), ...))
+        groups: List[Counter] = [Counter() for _ in entries]
+        n = len(paytable.symbols)
+        for stops in itertools.product(range(n), repeat=paytable.reels):
+            number = paytable.table[paytable.flat_index(stops)]
+            if number:
+                groups[number - 1][tuple(sorted(Counter(stops).items()))] += 1
+        monomials = sorted({counts for group in groups for counts in group})
+        column = {counts: i for i, counts in enumerate(monomials)}
+        self._monomials: List[Tuple[Tuple[int, int], ...]] = monomials
+        self._terms: List[List[Tuple[int, int]]] = [[(column[counts], k) for counts, k in group.items()] for group in groups]
+        self._paying = [i for i, entry in enumerate(entries) if entry.multiplier > 0]
+        # the top prize absorbs the RTP: after every move its multiplier is solved for the target RTP,
+        # so the search only has to explore the other targets
+        self._top = max(self._paying, key=lambda i: entries[i].multiplier) if tune_multipliers and self._paying else None
+
+    def measure(self, weights: Sequence[float], multipliers: Sequence[int]) -> Tuple[float, float, float]:
+        """
+        Exact statistics of a candidate configuration.
+
+        Parameters:
+            weights (Sequence[float]): The weight of each symbol.
+            multipliers (Sequence[int]): The multiplier of each combination, in paytable order.
+
+        Returns:
+            Tuple[float, float, float]: The RTP, hit frequency and volatility (standard deviation
+            of the payout per spin, in spin costs).
+        """
+        return self._statistics(self._probabilities(weights), multipliers)
+
+    def _probabilities(self, weights: Sequence[float]) -> List[float]:
+        """The probability of every combination paying, for the given weights."""
+        total = sum(weights)
+        p = [w / total for w in weights]
+        values = []
+        for counts in self._monomials:
+            value = 1.0
+            for symbol, k in counts:
+                value *= p[symbol] ** k
+            values.append(value)
+        probabilities = []
+        for terms in self._terms:
+            probability = 0.0
+            for i, k in terms:
+                probability += k * values[i]
+            probabilities.append(probability)
+        return probabilities
+
+    def _statistics(self, probabilities: List[float], multipliers: Sequence[int]) -> Tuple[float, float, float]:
+        rtp = second_moment = hit_frequency = 0.0
+        for probability, multiplier, (mean_wheel, mean_wheel_sq, wheel_pays) in zip(probabilities, multipliers, self._wheel_stats):
+            rtp += probability * multiplier * mean_wheel
+            second_moment += probability * multiplier * multiplier * mean_wheel_sq
+            if multiplier > 0:
+                hit_frequency += probability * wheel_pays
+        return rtp, hit_frequency, math.sqrt(max(second_moment - rtp * rtp, 0.0))
+
+    def _balance(self, probabilities: List[float], multipliers: List[int], rtp: float) -> None:
+        """Set the top prize's multiplier so the RTP is as close to the target as it can be."""
+        top = self._top
+        mean_wheel = self._wheel_stats[top][0]
+        if probabilities[top] * mean_wheel <= 0:
+            return
+        others = sum(p * m * stats[0] for i, (p, m, stats) in enumerate(zip(probabilities, multipliers, self._wheel_stats)) if i != top)
+        multipliers[top] = min(self.max_multiplier, max(1, round((rtp - others) / (probabilities[top] * mean_wheel))))
+
+    def tune(self, targets: TuningTargets, max_candidates: int = 20000, temperature: float = 0.2) -> TuningResult:
+        """
+        Search for a configuration meeting the targets.
+
+        Parameters:
+            targets (TuningTargets): The statistics to reach.
+            max_candidates (int): Number of configurations to try at most.
+            temperature (float): Initial annealing temperature; it decreases linearly to 0.
+
+        Returns:
+            TuningResult: The best configuration found, exactly evaluated; check result.met.
+        """
+        assert max_candidates >= 1, "At least one candidate is needed."
+        start = time.perf_counter()
+        total = sum(self.paytable.weights)
+        weights = [max(w / total, self.min_weight) for w in self.paytable.weights]
+        multipliers = [entry.multiplier for entry in self.paytable.entries[1:]]
+        loss, met = self._evaluate(weights, multipliers, targets)
+        best = (loss, met, list(weights), list(multipliers))
+
+        candidates = 1
+        while candidates < max_candidates and not best[1]:
+            candidate_weights, candidate_multipliers = self._neighbour(weights, multipliers)
+            candidate_loss, candidate_met = self._evaluate(candidate_weights, candidate_multipliers, targets)
+            candidates += 1
+            current_temperature = temperature * (1 - candidates / max_candidates)
+            # losses span orders of magnitude, so uphill moves are judged on their log
+            uphill = math.log1p(candidate_loss) - math.log1p(loss)
+            if uphill <= 0 or (current_temperature > 0 and self.rng.random() < math.exp(-uphill / current_temperature)):
+                weights, multipliers, loss = candidate_weights, candidate_multipliers, candidate_loss
+                if candidate_loss < best[0]:
+                    best = (candidate_loss, candidate_met, list(weights), list(multipliers))
+
+        paytable = self._build(best[2], best[3])
+        evaluation = evaluate_paytable(paytable)
+        met = self._score((evaluation.rtp, evaluation.hit_frequency, math.sqrt(evaluation.variance)), targets)[1]
+        return TuningResult(paytable, evaluation, met, candidates, time.perf_counter() - start)
+
+    def _evaluate(self, weights: List[float], multipliers: List[int], targets: TuningTargets) -> Tuple[float, bool]:
+        """Score a candidate, first balancing its top prize (in place) when multipliers are tuned."""
+        probabilities = self._probabilities(weights)
+        if self._top is not None:
+            self._balance(probabilities, multipliers, targets.rtp)
+        return self._score(self._statistics(probabilities, multipliers), targets)
+
+    def _score(self, statistics: Tuple[float, float, float], targets: TuningTargets) -> Tuple[float, bool]:
+        """Squared distance to the targets, in tolerances, and whether every target is met."""
+        rtp, hit_frequency, volatility = statistics
+        loss = 0.0
+        met = True
+        for value, target, tolerance in ((rtp, targets.rtp, targets.rtp_tolerance),
+                                         (hit_frequency, targets.hit_frequency, targets.hit_frequency_tolerance),
+                                         (volatility, targets.volatility, targets.volatility_tolerance)):
+            if target is None:
+                continue
+            distance = (value - target) / tolerance
+            loss += distance * distance
+            met = met and abs(distance) <= 1
+        return loss, met
+
+    def _neighbour(self, weights: List[float], multipliers: List[int]) -> Tuple[List[float], List[int]]:
+        rng = self.rng
+        weights = list(weights)
+        multipliers = list(multipliers)
+        if self.tune_weights and (not self.tune_multipliers or not self._paying or rng.random() < 0.75):
+            symbol = rng.randrange(len(weights))
+            weights[symbol] *= math.exp(rng.gauss(0, 0.2))
+            total = sum(weights)
+            weights = [max(w / total, self.min_weight) for w in weights]
+        else:
+            i = rng.choice([i for i in self._paying if i != self._top] or self._paying)
+            step = max(1, round(multipliers[i] * 0.1))
+            multipliers[i] = min(self.max_multiplier, max(1, multipliers[i] + rng.choice((-step, step))))
+        return weights, multipliers
+
+    def _build(self, weights: List[float], multipliers: List[int]) -> Paytable:
+        data = self.paytable.to_dict()
+        total = sum(weights)
+        data["weights"] = [round(w / total, 6) for w in weights]
+        for combination, multiplier in zip(data["combinations"], multipliers):
+            combination["multiplier"] = multiplier
+        return Paytable.from_dict(data)
@@ -0,0 +1,167 @@
+import json
+import os
+import threading
+
+from typing import List, Optional
+
+
+class ProgressiveJackpot:
+    """
+    Singleton progressive jackpot pool shared by every slot machine.
+
+    Each machine contributes CONTRIBUTION_RATE of every spin through its own JackpotMeter, which
+    only takes its own lock; the meters' pending amounts are merged into the pool every
+    MERGE_EVERY contributions and before every award, so spins on different machines never wait
+    on a common lock. Awarding empties the pool atomically and reseeds it with SEED.
+
+    Amounts are kept in integer cents. If a path is attached, the pool is saved there (atomically)
+    on every merge and award, and restored from it.
+
+    Attributes:
+        seed (float): The amount the pool restarts from after an award.
+        contribution_rate (float): Fraction of every spin added to the pool.
+    """
+    __instance = None
+    SEED = 700.0                # the classic machine's fixed jackpot for a $10 spin
+    CONTRIBUTION_RATE = 0.01
+    MERGE_EVERY = 64
+
+    def __new__(cls) -> "ProgressiveJackpot":
+        if cls.__instance is None:
+            cls.__instance = super(ProgressiveJackpot, cls).__new__(cls)
+        return cls.__instance
+
+    def __init__(self) -> None:
+        if not hasattr(self, 'initialized'):
+            self.seed: float = self.SEED
+            self.contribution_rate: float = self.CONTRIBUTION_RATE
+            self.path: Optional[str] = None
+            self._pool_cents: int = round(self.seed * 100)
+            self._lock = threading.Lock()
+            self._meters: List["JackpotMeter"] = []
+            self.initialized = True
+
+    def meter(self) -> "JackpotMeter":
+        """
+        Returns:
+            JackpotMeter: A new accumulator for one machine, registered with the pool.
+        """
+        meter = JackpotMeter(self)
+        with self._lock:
+            self._meters.append(meter)
+        return meter
+
+    def attach_file(self, path: str) -> None:
+        """
+        Restore the pool from a JSON file (if it exists) and save it there from now on.
+
+        Parameters:
+            path (str): The file holding the pool state.
+        """
+        with self._lock:
+            if os.path.exists(path):
+                with open(path, encoding="utf-8") as f:
+                    self._pool_cents = int(json.load(f)["pool_cents"])
+            self.path = path
+
+    def amount(self) -> float:
+        """
+        Returns:
+            float: The current pool, including contributions not merged yet.
+        """
+        pending = sum(meter.pending_cents for meter in list(self._meters))
+        return (self._pool_cents + pending) / 100
+
+    def award(self) -> float:
+        """
+        Empty the pool for a winner and reseed it.
+
+        Returns:
+            float: The amount won.
+        """
+        drained = sum(meter.drain() for meter in list(self._meters))
+        with self._lock:
+            won = self._pool_cents + drained
+            self._pool_cents = round(self.seed * 100)
+            self._save()
+        return won / 100
+
+    def restore(self, amount: float) -> None:
+        """
+        Put an awarded amount back (e.g. when the winning transaction could not be committed).
+
+        Parameters:
+            amount (float): The amount returned by award().
+        """
+        with self._lock:
+            self._pool_cents += round(amount * 100) - round(self.seed * 100)
+            self._save()
+
+    def reset(self) -> None:
+        """Reseed the pool and drop every pending contribution."""
+        for meter in list(self._meters):
+            meter.drain()
+        with self._lock:
+            self._pool_cents = round(self.seed * 100)
+            self._save()
+
+    def _merge(self, cents: int) -> None:
+        with self._lock:
+            self._pool_cents += cents
+            self._save()
+
+    def _save(self) -> None:
+        """Write the pool to the attached file; the caller holds the pool lock."""
+        if self.path is None:
+            return
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"pool_cents": self._pool_cents}, f)
+        os.replace(tmp_path, self.path)
+
+
+class JackpotMeter:
+    """
+    One machine's accumulator of contributions to the ProgressiveJackpot.
+
+    Copying a meter (e.g. when a SlotMachineUtility is cloned) gives the copy its own new
+    meter on the same pool.
+    """
+    def __init__(self, pool: ProgressiveJackpot) -> None:
+        self.pool = pool
+        self.pending_cents = 0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def contribute(self, spin_cost: float, spins: int = 1) -> None:
+        """
+        Add the pool's share of one or more spins.
+
+        Parameters:
+            spin_cost (float): The cost of each spin.
+            spins (int): The number of spins.
+        """
+        cents = round(spin_cost * self.pool.contribution_rate * 100) * spins
+        with self._lock:
+            self.pending_cents += cents
+            self._count += spins
+            if self._count < self.pool.MERGE_EVERY:
+                return
+            cents, self.pending_cents, self._count = self.pending_cents, 0, 0
+        self.pool._merge(cents)
+
+    def award(self) -> float:
+        """
+        Returns:
+            float: The whole progressive pool, won by this machine's player.
+        """
+        return self.pool.award()
+
+    def drain(self) -> int:
+        """Take the pending contributions out of the meter (in cents)."""
+        with self._lock:
+            cents, self.pending_cents, self._count = self.pending_cents, 0, 0
+        return cents
+
+    def __deepcopy__(self, memo) -> "JackpotMeter":
+        return self.pool.meter()
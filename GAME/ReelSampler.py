@@ -0,0 +1,108 @@
+import random
+import threading
+
+from array import array
+from typing import List, Optional, Sequence
+
+
+class ReelSampler:
+    """
+    Draws weighted reel stops in O(1) with Walker's alias method.
+
+    The weights are compiled once into two tables: column i is picked uniformly and then kept
+    with probability threshold[i] or replaced by alias[i]. A single uniform number decides both
+    the column (its integer part once scaled by n) and the coin flip (its fraction), and those
+    numbers come from a buffer refilled in bulk, so a draw allocates nothing.
+    Every thread draws from its own buffer, so one sampler can serve concurrent spins.
+
+    The sampler only knows stop indices; map them to symbols (or anything else) on the reel.
+
+    Attributes:
+        weights (List[float]): The weights the tables were compiled from.
+    """
+    BUFFER_SIZE = 4096
+
+    def __init__(self, weights: Sequence[float], rng: Optional[random.Random] = None, buffer_size: int = BUFFER_SIZE) -> None:
+        """
+        Parameters:
+            weights (Sequence[float]): Relative weight of every stop.
+            rng (random.Random): Source of the random numbers (defaults to the random module).
+            buffer_size (int): Number of random numbers generated per refill.
+
+        Preconditions:
+            - weights are non-negative with a positive sum and buffer_size >= 1.
+        """
+        assert len(weights) > 0 and all(w >= 0 for w in weights), "Weights must be non-negative."
+        assert sum(weights) > 0, "At least one weight must be positive."
+        assert buffer_size >= 1, "Buffer size must be positive."
+        self.weights: List[float] = [float(w) for w in weights]
+        self.rng = rng
+        self._n = len(self.weights)
+        self._threshold = array('d', bytes(8 * self._n))
+        self._alias = array('l', bytes(array('l').itemsize * self._n))
+        self._build()
+        self.buffer_size = buffer_size
+        self._local = threading.local()  # per-thread buffer and position, created on first draw
+
+    def sample(self) -> int:
+        """
+        Returns:
+            int: A stop index drawn with probability proportional to its weight.
+        """
+        local = self._local
+        try:
+            position = local.next
+        except AttributeError:
+            local.buffer = array('d', bytes(8 * self.buffer_size))
+            position = self.buffer_size
+        if position >= self.buffer_size:
+            self._refill(local.buffer)
+            position = 0
+        local.next = position + 1
+        scaled = local.buffer[position] * self._n
+        column = int(scaled)
+        if scaled - column < self._threshold[column]:
+            return column
+        return self._alias[column]
+
+    def sample_many(self, k: int) -> List[int]:
+        """
+        Returns:
+            List[int]: k independent stop indices.
+        """
+        sample = self.sample
+        return [sample() for _ in range(k)]
+
+    def __getstate__(self) -> dict:
+        # thread-local buffers are not copied (or pickled); the copy starts with empty ones
+        state = self.__dict__.copy()
+        del state["_local"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._local = threading.local()
+
+    def _refill(self, buffer: array) -> None:
+        draw = (self.rng or random).random
+        for i in range(len(buffer)):
+            buffer[i] = draw()
+
+    def _build(self) -> None:
+        """Vose's construction of the alias tables, O(n)."""
+        n = self._n
+        total = sum(self.weights)
+        scaled = [w * n / total for w in self.weights]
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            low = small.pop()
+            high = large.pop()
+            self._threshold[low] = scaled[low]
+            self._alias[low] = high
+            scaled[high] = scaled[high] + scaled[low] - 1.0
+            (small if scaled[high] < 1.0 else large).append(high)
+        # what is left is (up to rounding) exactly 1: always kept
+        for i in small + large:
+            self._threshold[i] = 1.0
+            self._alias[i] = i
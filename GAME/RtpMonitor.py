@@ -0,0 +1,187 @@
+import math
+import threading
+
+from collections import deque
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+
+class DriftAlert(NamedTuple):
+    """
+    Raised when a machine's observed RTP leaves the statistical bound around its theoretical RTP.
+
+    Attributes:
+        machine (str): The monitor's name.
+        spins (int): Number of spins observed.
+        observed_rtp (float): The observed mean payout per unit wagered.
+        expected_rtp (float): The theoretical RTP.
+        bound (float): The largest distance expected by chance at this number of spins.
+    """
+    machine: str
+    spins: int
+    observed_rtp: float
+    expected_rtp: float
+    bound: float
+
+
+class RtpMonitor:
+    """
+    Streaming statistics of one machine's payouts, checked against its theoretical RTP.
+
+    Each spin is recorded in O(1) time and memory: the spin and jackpot counts and Welford's
+    running mean and variance of the payout in spin costs (the net payout is that minus 1, so it
+    has the same variance). Once MIN_SPINS spins are observed, every spin checks that the mean
+    stays within Z standard errors of the theoretical RTP, using the theoretical variance; when it
+    leaves that bound an alert is sent to the listeners, once until it comes back.
+
+    Attributes:
+        name (str): The machine's name.
+        spins (int): Number of spins recorded.
+        jackpots (int): Number of jackpots recorded.
+        mean (float): Observed RTP.
+        drifting (bool): True while the observed RTP is out of bounds.
+    """
+    Z = 4.0             # about one false alert per 16000 checks of a correctly configured machine
+    MIN_SPINS = 1000
+
+    def __init__(self, name: str, theory: Optional[Callable[[], Optional[object]]] = None) -> None:
+        """
+        Parameters:
+            name (str): The machine's name.
+            theory (Callable): Returns the machine's PaytableEvaluation (with rtp and variance), or
+                None if it has none; called once, when the first check is due.
+        """
+        self.name = name
+        self._theory = theory
+        self._expected: Optional[tuple] = None
+        self._lock = threading.Lock()
+        self._listeners: List[Callable[[DriftAlert], None]] = []
+        self.reset()
+
+    def reset(self, theory: Optional[Callable[[], Optional[object]]] = None) -> None:
+        """
+        Forget every recorded spin, e.g. after the machine's configuration changed.
+
+        Parameters:
+            theory (Callable): A new source of the theoretical values, if the configuration changed.
+        """
+        with self._lock:
+            if theory is not None:
+                self._theory = theory
+                self._expected = None
+            self.spins = 0
+            self.jackpots = 0
+            self.mean = 0.0
+            self._m2 = 0.0
+            self.drifting = False
+
+    def add_alert_listener(self, listener: Callable[[DriftAlert], None]) -> None:
+        self._listeners.append(listener)
+
+    def expected(self) -> Optional[tuple]:
+        """
+        Returns:
+            Optional[tuple]: The theoretical RTP and payout variance, None if the machine has no theory.
+        """
+        if self._expected is None and self._theory is not None:
+            evaluation = self._theory()
+            self._expected = (evaluation.rtp, evaluation.variance) if evaluation is not None else ()
+        return self._expected or None
+
+    def record(self, payout: float, jackpot: bool = False) -> None:
+        """
+        Record one spin.
+
+        Parameters:
+            payout (float): The spin's payout, in spin costs.
+            jackpot (bool): Whether the spin hit the jackpot.
+        """
+        with self._lock:
+            self.spins += 1
+            if jackpot:
+                self.jackpots += 1
+            delta = payout - self.mean
+            self.mean += delta / self.spins
+            self._m2 += delta * (payout - self.mean)
+            if self.spins < self.MIN_SPINS:
+                return
+            spins, mean = self.spins, self.mean
+        expected = self._expected if self._expected is not None else self.expected()
+        if not expected:
+            return
+        expected_rtp, expected_variance = expected
+        bound = self.Z * math.sqrt(expected_variance / spins)
+        drifting = abs(mean - expected_rtp) > bound
+        if drifting == self.drifting:
+            return
+        with self._lock:
+            if drifting == self.drifting:
+                return
+            self.drifting = drifting
+        if drifting:
+            alert = DriftAlert(self.name, spins, mean, expected_rtp, bound)
+            for listener in list(self._listeners):
+                listener(alert)
+
+    @property
+    def variance(self) -> float:
+        """Observed variance of the payout per spin, in spin costs squared."""
+        return self._m2 / (self.spins - 1) if self.spins > 1 else 0.0
+
+    def summary(self) -> str:
+        """
+        Returns:
+            str: One line with the machine's observed and theoretical RTP.
+        """
+        text = f"{self.name}: {self.spins} spins, {self.jackpots} jackpots, RTP {self.mean:.4f}"
+        expected = self.expected()
+        if expected is None:
+            return text + " (no theoretical RTP)"
+        bound = self.Z * math.sqrt(expected[1] / self.spins) if self.spins else float("inf")
+        status = "DRIFTING" if self.drifting else ("ok" if self.spins >= self.MIN_SPINS else "warming up")
+        return text + f" vs {expected[0]:.4f} expected (+/- {bound:.4f}) {status}"
+
+
+class RtpMonitors:
+    """
+    Singleton registry of every machine's RtpMonitor.
+
+    Alerts of every monitor are forwarded to the registry's listeners and kept in a short
+    history, so they can be shown by the /rtp command.
+    """
+    __instance = None
+    HISTORY = 20
+
+    def __new__(cls) -> "RtpMonitors":
+        if cls.__instance is None:
+            cls.__instance = super(RtpMonitors, cls).__new__(cls)
+        return cls.__instance
+
+    def __init__(self) -> None:
+        if not hasattr(self, 'initialized'):
+            self.monitors: Dict[str, RtpMonitor] = {}
+            self.alerts: deque = deque(maxlen=self.HISTORY)
+            self._listeners: List[Callable[[DriftAlert], None]] = []
+            self._lock = threading.Lock()
+            self.initialized = True
+
+    def register(self, name: str, theory: Optional[Callable[[], Optional[object]]] = None) -> RtpMonitor:
+        """
+        Create the monitor of a machine, replacing any previous monitor of that name.
+
+        Parameters:
+            name (str): The machine's name.
+            theory (Callable): See RtpMonitor.
+        """
+        monitor = RtpMonitor(name, theory)
+        monitor.add_alert_listener(self._alert)
+        with self._lock:
+            self.monitors[name] = monitor
+        return monitor
+
+    def add_alert_listener(self, listener: Callable[[DriftAlert], None]) -> None:
+        self._listeners.append(listener)
+
+    def _alert(self, alert: DriftAlert) -> None:
+        self.alerts.append(alert)
+        for listener in list(self._listeners):
+            listener(alert)
@@ -0,0 +1,116 @@
+import itertools
+
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Optional, Tuple
+
+from .Paytable import Paytable
+from .SlotMachine import PaytableStrategy, SlotMachineStrategy
+
+
+class PaytableEvaluation:
+    """
+    Exact economics of a reel configuration and payout strategy.
+
+    Attributes:
+        spin_cost (int): The cost per spin the payouts are computed for.
+        distribution (Mapping[int, float]): Probability of every win amount (0 included).
+        rtp (float): Return to player, the expected payout per unit wagered.
+        house_edge (float): 1 - rtp.
+        hit_frequency (float): Probability that a spin pays anything.
+        variance (float): Variance of the payout per spin, in units of the spin cost squared.
+    """
+    def __init__(self, spin_cost: int, distribution: Dict[int, float]) -> None:
+        self.spin_cost = spin_cost
+        self.distribution = MappingProxyType(dict(sorted(distribution.items())))
+        mean = sum(win * p for win, p in distribution.items()) / spin_cost
+        self.rtp = mean
+        self.house_edge = 1.0 - mean
+        self.hit_frequency = sum(p for win, p in distribution.items() if win > 0)
+        self.variance = sum((win / spin_cost - mean) ** 2 * p for win, p in distribution.items())
+
+    def __repr__(self) -> str:
+        return f"PaytableEvaluation(rtp={self.rtp:.6f}, hit_frequency={self.hit_frequency:.6f}, variance={self.variance:.6f})"
+
+
+class _StrategyKey:
+    """Hashes and compares a strategy by its cache_key(), so evaluations can be cached per configuration."""
+    __slots__ = ("strategy", "key")
+
+    def __init__(self, strategy: SlotMachineStrategy) -> None:
+        self.strategy = strategy
+        self.key = strategy.cache_key()
+
+    def __hash__(self) -> int:
+        return hash(self.key)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, _StrategyKey) and self.key == other.key
+
+
+def evaluate(symbols: Optional[List[str]] = None, weights: Optional[List[float]] = None,
+             strategy: Optional[SlotMachineStrategy] = None, spin_cost: int = 1) -> PaytableEvaluation:
+    """
+    Compute the exact payout distribution by enumerating every reel outcome.
+
+    Every combination of symbols (one per reel) is weighted by its probability and paid out through the
+    strategy's payout_distribution(), so random elements such as the multiplier wheel are
+    accounted for exactly. Results are cached per configuration.
+
+    Parameters:
+        symbols (List[str]): Reel symbols (defaults to the default paytable's).
+        weights (List[float]): Weight of each symbol on every reel (defaults to the default paytable's).
+        strategy (SlotMachineStrategy): The strategy paying every spin (defaults to the default paytable's
+            PaytableStrategy, as used by SlotMachine). A PaytableStrategy sets the number of reels, others use 3.
+        spin_cost (int): The cost per spin.
+
+    Returns:
+        PaytableEvaluation: The exact RTP, payout distribution, house edge and variance.
+
+    Preconditions:
+        - symbols and weights have the same length, weights are non-negative with a positive sum.
+        - spin_cost > 0.
+    """
+    default = Paytable.default()
+    symbols = tuple(symbols if symbols is not None else default.symbols)
+    weights = tuple(float(w) for w in (weights if weights is not None else default.weights))
+    if strategy is None:
+        strategy = PaytableStrategy(default)
+    reel_count = strategy.paytable.reels if isinstance(strategy, PaytableStrategy) else 3
+    assert len(symbols) == len(weights), "Every symbol needs a weight."
+    assert all(w >= 0 for w in weights) and sum(weights) > 0, "Weights must be non-negative with a positive sum."
+    assert spin_cost > 0, "Spin cost must be positive."
+    return _evaluate(symbols, weights, _StrategyKey(strategy), spin_cost, reel_count)
+
+
+def evaluate_paytable(paytable: Paytable, spin_cost: int = 1) -> PaytableEvaluation:
+    """
+    Exact evaluation of a paytable, e.g. a new machine's configuration before it is deployed.
+
+    Parameters:
+        paytable (Paytable): The paytable to evaluate.
+        spin_cost (int): The cost per spin.
+    """
+    return evaluate(paytable.symbols, paytable.weights, PaytableStrategy(paytable), spin_cost)
+
+
+def clear_cache() -> None:
+    """Forget cached evaluations, e.g. after changing a strategy's class attributes."""
+    _evaluate.cache_clear()
+
+
+@lru_cache(maxsize=256)
+def _evaluate(symbols: Tuple[str, ...], weights: Tuple[float, ...], keyed: _StrategyKey, spin_cost: int, reel_count: int) -> PaytableEvaluation:
+    total = sum(weights)
+    probabilities = [w / total for w in weights]
+    distribution: Dict[int, float] = {}
+    for stops in itertools.product(range(len(symbols)), repeat=reel_count):
+        p_reels = 1.0
+        for stop in stops:
+            p_reels *= probabilities[stop]
+        if p_reels == 0:
+            continue
+        reels = [symbols[i] for i in stops]
+        for win, p_win in keyed.strategy.payout_distribution(spin_cost, reels):
+            distribution[win] = distribution.get(win, 0.0) + p_reels * p_win
+    return PaytableEvaluation(spin_cost, distribution)
@@ -11,14 +11,21 @@ if TYPE_CHECKING:
 
 from typing import List
 from ..BALANCE.PlayerBalance import *  
+from .Paytable import Paytable
+from .ProgressiveJackpot import JackpotMeter, ProgressiveJackpot
+from .ReelSampler import ReelSampler
+from .RtpMonitor import RtpMonitor, RtpMonitors
 import copy
-from typing import TYPE_CHECKING, List, Tuple
+from typing import TYPE_CHECKING, List, NamedTuple, Optional, Tuple
 
 
 
 
 # STRATEGY PATTERN FOR SLOT MACHINE
 class SlotMachineStrategy(ABC):
+    WIN_REASON: BalanceChangeReason = BalanceChangeReason.WIN   # reason of the balance change when the spin pays
+    SOUND: Optional[str] = None                                   # sound played when the spin pays
+
     @abstractmethod
     def calculate_payout(self, spin_cost: int, reels: List[str]) -> Tuple[int, str]:
         """
@@ -38,14 +45,52 @@ class SlotMachineStrategy(ABC):
         """
         pass
 
+    def payout_distribution(self, spin_cost: int, reels: List[str]) -> List[Tuple[int, float]]:
+        """
+        Every win amount the spin can pay with its probability, for exact evaluation.
+
+        Strategies whose payout involves chance (e.g. a multiplier wheel) must override this;
+        the default treats calculate_payout as deterministic.
+
+        Returns:
+            List[Tuple[int, float]]: (win amount, probability) pairs whose probabilities sum to 1.
+        """
+        win_amount, _ = self.calculate_payout(spin_cost, reels)
+        return [(win_amount, 1.0)]
+
+    def cache_key(self) -> tuple:
+        """
+        Returns:
+            tuple: A hashable value identifying the strategy's configuration, used to cache evaluations.
+            Strategies keep their parameters on the class by default, so the class identifies it.
+        """
+        return (type(self),)
+
+    def spin_outcome(self, spin_cost: int, reels: List[str]) -> Tuple[int, str, BalanceChangeReason, Optional[str]]:
+        """
+        Calculate the payout together with how it is recorded and shown.
+
+        Returns:
+            Tuple[int, str, BalanceChangeReason, Optional[str]]: The win amount, the outcome message,
+            the balance change reason and the sound to play (if any).
+        """
+        win_amount, outcome_text = self.calculate_payout(spin_cost, reels)
+        if win_amount > 0:
+            return (win_amount, outcome_text, self.WIN_REASON, self.SOUND)
+        return (win_amount, outcome_text, BalanceChangeReason.LOSE, None)
+
 
 class StandardStrategyWithWheel(SlotMachineStrategy):
+    SOUND = 'wheel'
+    BASE_MULTIPLIER = 10       # three of a kind pays spin_cost * BASE_MULTIPLIER ...
+    WHEEL = [1, 2, 3]          # ... times a multiplier drawn uniformly from the wheel
+
     def calculate_payout(self, spin_cost: int, reels: List[str]) -> Tuple[int, str]:
-        base_win = spin_cost * 10
+        base_win = spin_cost * self.BASE_MULTIPLIER
         # Check for standard win (all symbols match).
         if reels[0] == reels[1] == reels[2]:
             # Simulate multiplier wheel narrative.
-            multiplier = random.choice([1, 2, 3])
+            multiplier = random.choice(self.WHEEL)
             total_win = base_win * multiplier
             outcome_text = (
                 "Spinning the multiplier wheel...\n"
@@ -57,18 +102,106 @@ class StandardStrategyWithWheel(SlotMachineStrategy):
         else:
             return (0, "No win, better luck next time.")
 
+    def payout_distribution(self, spin_cost: int, reels: List[str]) -> List[Tuple[int, float]]:
+        if reels[0] == reels[1] == reels[2]:
+            return [(spin_cost * self.BASE_MULTIPLIER * m, 1 / len(self.WHEEL)) for m in self.WHEEL]
+        return [(0, 1.0)]
+
 
 class JackpotStrategy(SlotMachineStrategy):
+    WIN_REASON = BalanceChangeReason.JACKPOT
+    JACKPOT_REELS = ['(  7  )', '(  7  )', '(  7  )']
+    MULTIPLIER = 10 * 7        # 7x the standard win amount for jackpot.
+
     def calculate_payout(self, spin_cost: int, reels: List[str]) -> Tuple[int, str]:
         # Check for jackpot condition.
-        if reels == ['(  7  )', '(  7  )', '(  7  )']:
-            total_win = spin_cost * 10 * 7  # 7x win amount for jackpot.
+        if reels == self.JACKPOT_REELS:
+            total_win = spin_cost * self.MULTIPLIER
             assert total_win >= 0, "Calculated win amount must be non-negative."
             return (total_win, "JACKPOT HIT!!")
         else:
             return (0, "No win, better luck next time.")
 
 
+class PaytableStrategy(SlotMachineStrategy):
+    """
+    Pays spins from a compiled Paytable: the reels are looked up in the paytable's table and the
+    matching combination gives the multiplier, wheel, reason, sound and text. New machines are
+    new paytable files rather than new strategy subclasses.
+    """
+    def __init__(self, paytable: Paytable) -> None:
+        for entry in paytable.entries[1:]:
+            assert entry.reason in BalanceChangeReason.__members__, f"Unknown balance change reason {entry.reason}."
+        self.paytable = paytable
+
+    def calculate_payout(self, spin_cost: int, reels: List[str]) -> Tuple[int, str]:
+        return self.spin_outcome(spin_cost, reels)[:2]
+
+    def spin_outcome(self, spin_cost: int, reels: List[str]) -> Tuple[int, str, BalanceChangeReason, Optional[str]]:
+        entry = self.paytable.lookup_symbols(reels)
+        if entry is None:
+            return (0, self.paytable.lose_text, BalanceChangeReason.LOSE, None)
+        wheel = random.choice(entry.wheel) if entry.wheel else 1
+        total_win = spin_cost * entry.multiplier * wheel
+        assert total_win >= 0, "Calculated win amount must be non-negative."
+        return (total_win, entry.text.format(wheel=wheel), BalanceChangeReason[entry.reason], entry.sound)
+
+    def payout_distribution(self, spin_cost: int, reels: List[str]) -> List[Tuple[int, float]]:
+        entry = self.paytable.lookup_symbols(reels)
+        if entry is None:
+            return [(0, 1.0)]
+        wheel = entry.wheel or (1,)
+        return [(spin_cost * entry.multiplier * m, 1 / len(wheel)) for m in wheel]
+
+    def cache_key(self) -> tuple:
+        return (PaytableStrategy, self.paytable.fingerprint())
+
+
+class SpinResult(NamedTuple):
+    """
+    Immutable outcome of one spin.
+
+    Attributes:
+        reels (Tuple[str, ...]): The symbols the reels stopped on.
+        win_amount (int): The payout (0 when the spin lost).
+        outcome_text (str): The strategy's description of the outcome.
+        reason (BalanceChangeReason): WIN, JACKPOT or LOSE.
+        sound (Optional[str]): The sound to play for the outcome, if any.
+        progressive_amount (float): The part of win_amount awarded from the progressive pool.
+    """
+    reels: Tuple[str, ...]
+    win_amount: int
+    outcome_text: str
+    reason: BalanceChangeReason
+    sound: Optional[str] = None
+    progressive_amount: float = 0.0
+
+
+class AutoSpinResult(NamedTuple):
+    """
+    Summary of an auto-spin run.
+
+    Attributes:
+        spins (int): Number of spins played.
+        wins (int): Number of spins that paid.
+        jackpots (int): Number of jackpots hit.
+        wagered (float): Total spin cost charged.
+        won (float): Total payout.
+        stop_reason (Optional[str]): Why the run ended early ("jackpot", "loss limit", "insufficient funds"),
+            None if every requested spin was played.
+    """
+    spins: int
+    wins: int
+    jackpots: int
+    wagered: float
+    won: float
+    stop_reason: Optional[str]
+
+    @property
+    def net(self) -> float:
+        return self.won - self.wagered
+
+
 # SLOT MACHINE IMPLEMENTATION USING STRATEGY PATTERN
 class SlotMachine():
     """
@@ -76,20 +209,26 @@ class SlotMachine():
 
     Attributes:
         spin_cost (int): The cost per spin.
+        paytable (Paytable): The symbols, reel weights and paying combinations (classic.json by default).
         symbols (List[str]): List of symbols that can appear on the reels.
-        messages (List[Message]): List to accumulate messages during a spin.
-        strategy (SlotMachineStrategy): The current payout strategy.
+        messages (List[Message]): Messages of the last play_spin() call (play_round() returns its own).
+        strategy (SlotMachineStrategy): The payout strategy, a PaytableStrategy of the paytable by default.
+        rtp_monitor (RtpMonitor): Streaming statistics of the spins, checked against the theoretical RTP.
     """
     __instance = None
 
-    def __new__(cls, spin_cost: int = 10) -> "SlotMachine":
+    def __new__(cls, spin_cost: int = 10, paytable: Optional[Paytable] = None) -> "SlotMachine":
         if cls.__instance is None:
             cls.__instance = super(SlotMachine, cls).__new__(cls)
         return cls.__instance
 
-    def __init__(self, spin_cost: int = 10) -> None:
+    def __init__(self, spin_cost: int = 10, paytable: Optional[Paytable] = None) -> None:
         """
         Initialize the SlotMachine instance.
+
+        Parameters:
+            spin_cost (int): The cost per spin.
+            paytable (Paytable): The machine's paytable (defaults to Paytable.default()).
         
         Preconditions:
             - spin_cost must be >= 0.
@@ -99,9 +238,13 @@ class SlotMachine():
         if not hasattr(self, 'initialized'):
             assert spin_cost >= 0, "Spin cost must be non-negative."
             self.spin_cost: int = spin_cost
-            self.symbols: List[str] = ['(  <3  )', '(  :p  )', '( ~*~ )', '(  <>  )', '(  7  )']
+            self.paytable: Paytable = paytable if paytable is not None else Paytable.default()
+            self.symbols: List[str] = list(self.paytable.symbols)
+            # Alias table of the reel weights, compiled once and shared by every spin
+            self.reel_sampler: ReelSampler = ReelSampler(self.paytable.weights)
             self.messages: List["Message"] = []  # Clear message list.
-            self.strategy: SlotMachineStrategy = StandardStrategyWithWheel()
+            self.strategy: SlotMachineStrategy = PaytableStrategy(self.paytable)
+            self.rtp_monitor: RtpMonitor = RtpMonitors().register(self.paytable.name or "slot machine", self.theoretical)
             self.initialized = True
 
     def set_strategy(self, strategy: SlotMachineStrategy) -> None:
@@ -113,6 +256,15 @@ class SlotMachine():
         """
         assert isinstance(strategy, SlotMachineStrategy), "Strategy must be a SlotMachineStrategy instance."
         self.strategy = strategy
+        self.rtp_monitor.reset(self.theoretical)
+
+    def theoretical(self) -> Optional["PaytableEvaluation"]:
+        """
+        Returns:
+            Optional[PaytableEvaluation]: The exact economics of the machine's current configuration.
+        """
+        from .SlotEvaluator import evaluate  # SlotEvaluator imports this module
+        return evaluate(self.symbols, self.paytable.weights, self.strategy)
 
     def get_image_name(self) -> str:
         """
@@ -128,102 +280,214 @@ class SlotMachine():
         Spin the slot machine reels with weighted probabilities.
         
         Returns:
-            List[str]: List of 3 symbols representing the spin result.
+            List[str]: One symbol per reel representing the spin result.
         
         Postconditions:
-            - The returned list has exactly 3 symbols.
+            - The returned list has one symbol per reel of the paytable (3 for the classic machine).
         """
-        # Define weights to increase the odds of winning.
-        weights: List[float] = [0.7, 0.125, 0.125, 0.025, 0.025]
-        reels = random.choices(self.symbols, weights=weights, k=3)
-        assert len(reels) == 3, "Reels must contain exactly 3 symbols."
+        sample = self.reel_sampler.sample
+        reels = [self.symbols[sample()] for _ in range(self.paytable.reels)]
+        assert len(reels) == self.paytable.reels, "Reels must contain one symbol per reel."
         return reels
 
-    def play_spin(self, player: "HumanPlayer", sender: object = None) -> bool:
+    def spin(self) -> SpinResult:
         """
-        Play a single spin of the slot machine.
-        
+        Spin the reels and work out the payout without touching any balance or shared state.
+
+        Safe to call from several threads at once: the reel sampler keeps a buffer per thread and
+        the strategy is only read.
+
+        Returns:
+            SpinResult: The reels, the win amount, the outcome text, the balance change reason and the sound.
+        """
+        reels = self.spin_reels()
+        win_amount, outcome_text, reason, sound = self.strategy.spin_outcome(self.spin_cost, reels)
+        return SpinResult(tuple(reels), win_amount, outcome_text, reason, sound)
+
+    def monitored_spin(self) -> SpinResult:
+        """
+        Spin and record the paytable's payout in the RTP monitor (before any progressive jackpot,
+        so the monitor checks the machine's configuration, not the pool).
+        """
+        result = self.spin()
+        if self.spin_cost > 0:
+            self.rtp_monitor.record(result.win_amount / self.spin_cost, result.reason == BalanceChangeReason.JACKPOT)
+        return result
+
+    def progressive(self, result: SpinResult, meter: Optional[JackpotMeter]) -> SpinResult:
+        """
+        Replace a jackpot's fixed payout by the progressive pool when the spin was played on a metered machine.
+
+        Parameters:
+            result (SpinResult): The spin.
+            meter (JackpotMeter): The machine's jackpot meter, None for a fixed jackpot.
+        """
+        if meter is None or result.reason != BalanceChangeReason.JACKPOT:
+            return result
+        amount = meter.award()
+        return result._replace(win_amount=amount, outcome_text=f"PROGRESSIVE JACKPOT HIT!! ${amount:.2f}", progressive_amount=amount)
+
+    def play_round(self, player: "HumanPlayer", sender: object = None, meter: Optional[JackpotMeter] = None) -> Tuple[Optional[SpinResult], List["Message"]]:
+        """
+        Play a single spin for a player: charge the spin, spin, pay out and render the messages.
+
+        Every call works on its own message list, so players can spin concurrently.
+
         Parameters:
             player (HumanPlayer): The player who initiates the spin.
             sender (object): The sender of messages (defaults to self if None).
-        
+            meter (JackpotMeter): The machine's progressive jackpot meter; without one the jackpot is fixed.
+
         Returns:
-            bool: True if the spin was successful; False otherwise.
-        
-        Preconditions:
-            - player must be a valid HumanPlayer.
-        Postconditions:
-            - Messages list is populated with results.
+            Tuple[Optional[SpinResult], List[Message]]: The spin result (None if the player could not
+            afford the spin) and the messages to show them.
         """
         if sender is None:
             sender = self
-
-        # Clear previous messages.
-        self.messages = []
+        messages: List["Message"] = []
         bm = BalanceManager()
         current_balance = bm.get_balance(player=player)
-        self.messages.append(DialogueMessage(sender, player, f"Starting balance: ${current_balance:.2f}", self.get_image_name()))
+        messages.append(DialogueMessage(sender, player, f"Starting balance: ${current_balance:.2f}", self.get_image_name()))
+
+        # Deduct the spin cost, unless the player cannot afford it.
+        observer_msgs = bm.try_decrease_balance(self.spin_cost, reason=BalanceChangeReason.COST, player=player)
+        if observer_msgs is None:
+            messages.append(ServerMessage(player, "Insufficient funds to spin!"))
+            return None, messages
+        messages.extend(observer_msgs)
+        if meter is not None:
+            meter.contribute(self.spin_cost)
+
+        result = self.progressive(self.monitored_spin(), meter)
+        messages.extend(self.render_spin(result, player, sender))
+        if result.win_amount > 0:
+            observer_msgs = bm.increase_balance(result.win_amount, reason=result.reason, player=player)
+        else:
+            observer_msgs = bm.decrease_balance(0, reason=result.reason, player=player)
+        messages.extend(observer_msgs)
 
-        # Check sufficient funds.
-        if current_balance < self.spin_cost:
-            self.messages.append(ServerMessage(player, "Insufficient funds to spin!"))
-            return False
+        current_balance = bm.get_balance(player=player)
+        messages.append(ServerMessage(player, f"Current balance: ${current_balance:.2f}"))
+        messages.append(ServerMessage(player, "Game over!"))
+        return result, messages
 
-        # Deduct the spin cost.
-        observer_msgs = bm.decrease_balance(self.spin_cost, reason=BalanceChangeReason.COST, player=player)
-        self.messages.extend(observer_msgs)
+    def auto_spin(self, player: "HumanPlayer", spins: int, loss_limit: Optional[float] = None,
+                  meter: Optional[JackpotMeter] = None) -> Tuple[AutoSpinResult, List["Message"]]:
+        """
+        Play up to `spins` spins in one go and settle them as a single balance transaction.
 
-        # Display spin initiation messages.
-        self.messages.append(SoundMessage(player, 'playing'))
-        self.messages.append(DialogueMessage(sender, player, "PLAY: (  X  )   (  X  )   (  X  )", self.get_image_name()))
+        The run stops early on a jackpot, once the net loss reaches loss_limit, or when the player
+        can no longer afford a spin. Observers are notified once, with the net change.
 
-        # Spin the reels.
-        reels = self.spin_reels()
-        result_string = "  ".join(reels)
-        self.messages.append(DialogueMessage(sender, player, f"Reels: {result_string}", self.get_image_name()))
+        Parameters:
+            player (HumanPlayer): The player spinning.
+            spins (int): The maximum number of spins.
+            loss_limit (float): Optional net loss at which to stop.
+            meter (JackpotMeter): The progressive jackpot meter the spins contribute to, None for a fixed jackpot.
 
-        # Choose strategy based on reels.
-        if reels == ['(  7  )', '(  7  )', '(  7  )']:
-            self.set_strategy(JackpotStrategy())
-        else:
-            self.set_strategy(StandardStrategyWithWheel())
+        Returns:
+            Tuple[AutoSpinResult, List[Message]]: The summary and the observers' messages.
 
-        # Calculate payout.
-        win_amount, outcome_text = self.strategy.calculate_payout(self.spin_cost, reels)
-        if win_amount > 0:
-            # For jackpot, use a different reason.
-            if outcome_text == "JACKPOT HIT!!":
-                observer_msgs = bm.increase_balance(win_amount, reason=BalanceChangeReason.JACKPOT, player=player)
-            else:
-                self.messages.append(SoundMessage(player, 'wheel'))
-                observer_msgs = bm.increase_balance(win_amount, reason=BalanceChangeReason.WIN, player=player)
-            self.messages.append(DialogueMessage(sender, player, outcome_text, self.get_image_name()))
-            self.messages.extend(observer_msgs)
-        else:
-            observer_msgs = bm.decrease_balance(0, reason=BalanceChangeReason.LOSE, player=player)
-            self.messages.append(DialogueMessage(sender, player, outcome_text, self.get_image_name()))
-            self.messages.extend(observer_msgs)
+        Preconditions:
+            - spins >= 1 and loss_limit, if given, is positive.
+        """
+        assert spins >= 1, "At least one spin is required."
+        assert loss_limit is None or loss_limit > 0, "Loss limit must be positive."
+        bm = BalanceManager()
+        balance = bm.get_balance(player=player)
+        txn = bm.transaction(player)
+        played = wins = jackpots = 0
+        wagered = won = 0.0
+        stop_reason = None
+        while played < spins:
+            if balance < self.spin_cost:
+                stop_reason = "insufficient funds"
+                break
+            result = self.progressive(self.monitored_spin(), meter)
+            played += 1
+            wagered += self.spin_cost
+            txn.debit(self.spin_cost, BalanceChangeReason.COST)
+            if result.win_amount > 0:
+                wins += 1
+                won += result.win_amount
+                txn.credit(result.win_amount, result.reason)
+            balance += result.win_amount - self.spin_cost
+            if result.reason == BalanceChangeReason.JACKPOT:
+                jackpots += 1
+                stop_reason = "jackpot"
+                break
+            if loss_limit is not None and wagered - won >= loss_limit:
+                stop_reason = "loss limit"
+                break
+
+        # the coalesced reason follows the sign of the net change; a jackpot is reported in the summary
+        txn.reason = BalanceChangeReason.WIN if won > wagered else BalanceChangeReason.LOSE
+        try:
+            messages = txn.commit()
+        except InsufficientFundsError:
+            if jackpots and meter is not None:
+                meter.pool.restore(result.progressive_amount)
+            raise
+        if meter is not None and played:
+            meter.contribute(self.spin_cost, spins=played)
+        return AutoSpinResult(played, wins, jackpots, wagered, won, stop_reason), messages
+
+    def render_spin(self, result: SpinResult, player: "HumanPlayer", sender: object) -> List["Message"]:
+        """
+        Build the messages showing a spin: the reels and the outcome.
 
-        current_balance = bm.get_balance(player=player)
-        self.messages.append(ServerMessage(player, f"Current balance: ${current_balance:.2f}"))
-        self.messages.append(ServerMessage(player, "Game over!"))
-        return True
+        Parameters:
+            result (SpinResult): The spin to show.
+            player (HumanPlayer): The player the messages are for.
+            sender (object): The sender of the dialogue messages.
+
+        Returns:
+            List[Message]: The messages, in display order.
+        """
+        messages: List["Message"] = [
+            SoundMessage(player, 'playing'),
+            DialogueMessage(sender, player, "PLAY: (  X  )   (  X  )   (  X  )", self.get_image_name()),
+            DialogueMessage(sender, player, f"Reels: {'  '.join(result.reels)}", self.get_image_name()),
+        ]
+        if result.sound is not None:
+            messages.append(SoundMessage(player, result.sound))
+        messages.append(DialogueMessage(sender, player, result.outcome_text, self.get_image_name()))
+        return messages
+
+    def play_spin(self, player: "HumanPlayer", sender: object = None, meter: Optional[JackpotMeter] = None) -> bool:
+        """
+        Play a single spin of the slot machine, keeping the messages in self.messages.
+
+        Not reentrant; use play_round() when several players may spin at once.
+
+        Parameters:
+            player (HumanPlayer): The player who initiates the spin.
+            sender (object): The sender of messages (defaults to self if None).
+            meter (JackpotMeter): The machine's progressive jackpot meter; without one the jackpot is fixed.
+
+        Returns:
+            bool: True if the spin was successful; False otherwise.
+        """
+        result, self.messages = self.play_round(player, sender, meter)
+        return result is not None
 
-    def play(self, player: "HumanPlayer", sender: object = None) -> List["Message"]:
+    def play(self, player: "HumanPlayer", sender: object = None, meter: Optional[JackpotMeter] = None) -> List["Message"]:
         """
         Play the slot machine game and return the list of messages.
         
         Parameters:
             player (HumanPlayer): The player who plays.
             sender (object): The sender of messages (defaults to self if None).
+            meter (JackpotMeter): The machine's progressive jackpot meter; without one the jackpot is fixed.
         
         Returns:
             List[Message]: The messages resulting from the spin.
         """
-        if sender is None:
-            sender = self
-        self.play_spin(player, sender=sender)
-        return self.messages
+        return self.play_round(player, sender, meter)[1]
+
+    def __deepcopy__(self, memo) -> "SlotMachine":
+        # Singleton: copies of the utilities holding the machine share it.
+        return self
 
 
 # SLOT MACHINE UTILITY OBJECT
@@ -235,6 +499,8 @@ class SlotMachineUtility(UtilityObject):
     When a player interacts with this object, the slot machine game is started and
     relevant messages are returned.
     """
+    WELCOME_TEXT = "Welcome to the Slot Machine!"
+
     def __init__(self, image_name: str = 'slot_machine3', spin_cost: float = 10, player: object = None) -> None:
         """
         Initialize the SlotMachineUtility
@@ -246,6 +512,8 @@ class SlotMachineUtility(UtilityObject):
         """
         super().__init__(image_name, passable=False)
         self.slot_machine: SlotMachine = SlotMachine(spin_cost)
+        # This machine's share of the progressive jackpot (a clone gets its own meter on the same pool)
+        self.jackpot_meter: JackpotMeter = ProgressiveJackpot().meter()
 
     def player_interacted(self, player: "HumanPlayer") -> List["Message"]:
         """
@@ -257,21 +525,12 @@ class SlotMachineUtility(UtilityObject):
         @Returns:
             List[Message]: A list of messages resulting from playing the game
         """
-        bm = BalanceManager()
-        # Create observers for this interaction.
-        se_observer = SoundEffectObserver(player)
-        be_observer = BalanceEffectObserver(self, player)
-        bm.register_observer(se_observer)
-        bm.register_observer(be_observer)
-
         messages: List["Message"] = []
-        messages.append(DialogueMessage(self, player, "Welcome to the Slot Machine!", self.get_image_name()))
-        slot_messages = self.slot_machine.play(player, sender=self)
+        messages.append(DialogueMessage(self, player, self.WELCOME_TEXT, self.get_image_name()))
+        # Reuse this player's pooled observers for the spin; they are unregistered when the block ends.
+        with BalanceManager().observing(player, sender=self):
+            slot_messages = self.slot_machine.play(player, sender=self, meter=self.jackpot_meter)
         messages.extend(slot_messages)
-
-        # Unregister observers after use to prevent duplication in subsequent interactions.
-        bm.unregister_observer(se_observer)
-        bm.unregister_observer(be_observer)
         return messages
 
     def clone(self) -> "SlotMachineUtility":
@@ -0,0 +1,178 @@
+import math
+import random
+
+from collections import Counter
+from typing import Dict, Optional, Tuple
+
+from .Paytable import Paytable
+from .ReelSampler import ReelSampler
+
+try:  # NumPy is optional: without it the simulator falls back to ReelSampler batches
+    import numpy as np
+except ImportError:
+    np = None
+
+
+Z_95 = 1.959963984540054
+
+
+class SimulationReport:
+    """
+    Results of a headless slot machine simulation
+
+    Payouts are measured in multiples of the spin cost, so the figures do not depend on it.
+
+    Attributes:
+        spins (int): Number of simulated spins.
+        payout_counts (Dict[int, int]): Number of spins that paid each multiple of the spin cost.
+        jackpots (int): Number of spins that hit the jackpot.
+        rtp (float): Return to player, the mean payout per unit wagered.
+        hit_frequency (float): Fraction of spins that paid anything.
+        jackpot_frequency (float): Fraction of spins that hit the jackpot.
+        variance (float): Variance of the payout per spin, in units of the spin cost squared.
+        *_ci (Tuple[float, float]): 95% confidence interval of the statistic above.
+    """
+    def __init__(self, spins: int, payout_counts: Dict[int, int], jackpots: int) -> None:
+        assert spins > 1, "At least two spins are needed for the statistics."
+        self.spins = spins
+        self.payout_counts = dict(sorted(payout_counts.items()))
+        self.jackpots = jackpots
+
+        mean = sum(value * count for value, count in payout_counts.items()) / spins
+        m2 = sum((value - mean) ** 2 * count for value, count in payout_counts.items()) / spins
+        m4 = sum((value - mean) ** 4 * count for value, count in payout_counts.items()) / spins
+        self.rtp = mean
+        self.variance = m2 * spins / (spins - 1)
+        self.hit_frequency = (spins - payout_counts.get(0, 0)) / spins
+        self.jackpot_frequency = jackpots / spins
+
+        self.rtp_ci = self._interval(mean, math.sqrt(self.variance / spins))
+        self.variance_ci = self._interval(self.variance, math.sqrt(max(m4 - m2 * m2, 0.0) / spins))
+        self.hit_frequency_ci = self._proportion_interval(self.hit_frequency)
+        self.jackpot_frequency_ci = self._proportion_interval(self.jackpot_frequency)
+
+    @property
+    def house_edge(self) -> float:
+        return 1.0 - self.rtp
+
+    def summary(self) -> str:
+        """
+        Returns:
+            str: A human readable summary of the statistics and their confidence intervals.
+        """
+        def line(name: str, value: float, ci: Tuple[float, float]) -> str:
+            return f"{name}: {value:.6f}  (95% CI {ci[0]:.6f} .. {ci[1]:.6f})"
+        return "\n".join([
+            f"Spins: {self.spins}",
+            line("Return to player", self.rtp, self.rtp_ci),
+            line("Hit frequency", self.hit_frequency, self.hit_frequency_ci),
+            line("Jackpot frequency", self.jackpot_frequency, self.jackpot_frequency_ci),
+            line("Variance", self.variance, self.variance_ci),
+        ])
+
+    def _interval(self, value: float, standard_error: float) -> Tuple[float, float]:
+        return (value - Z_95 * standard_error, value + Z_95 * standard_error)
+
+    def _proportion_interval(self, p: float) -> Tuple[float, float]:
+        """Wilson score interval, which stays sensible for rare events such as the jackpot."""
+        n = self.spins
+        denominator = 1 + Z_95 ** 2 / n
+        centre = (p + Z_95 ** 2 / (2 * n)) / denominator
+        spread = Z_95 * math.sqrt(p * (1 - p) / n + Z_95 ** 2 / (4 * n * n)) / denominator
+        return (max(0.0, centre - spread), min(1.0, centre + spread))
+
+
+class SlotSimulator:
+    """
+    Headless Monte Carlo simulation of the slot machine's economics.
+
+    Uses a paytable's symbols, reel weights and combinations (the machine's classic paytable
+    by default), exactly as PaytableStrategy pays them, but draws the spins in batches without
+    building messages or touching any balance. Each batch is paid by looking the reel stops up
+    in the paytable's compiled table; batches are vectorised with NumPy when it is installed.
+
+    Usage:
+        report = SlotSimulator(seed=1).run(10_000_000)
+        print(report.summary())
+    """
+    def __init__(self, paytable: Optional[Paytable] = None, seed: Optional[int] = None,
+                 batch_size: int = 1_000_000, use_numpy: bool = True) -> None:
+        """
+        Parameters:
+            paytable (Paytable): The configuration to simulate (defaults to Paytable.default()).
+            seed (int): Optional seed, for reproducible runs.
+            batch_size (int): Number of spins drawn at once.
+            use_numpy (bool): Set to False to force the pure Python path.
+
+        Preconditions:
+            - batch_size >= 1.
+        """
+        assert batch_size >= 1, "Batch size must be positive."
+        self.paytable = paytable if paytable is not None else Paytable.default()
+        self.batch_size = batch_size
+        self.use_numpy = use_numpy and np is not None
+        self.seed = seed
+
+    def run(self, spins: int) -> SimulationReport:
+        """
+        Simulate the given number of spins.
+
+        Parameters:
+            spins (int): Number of spins to simulate.
+
+        Returns:
+            SimulationReport: The statistics of the run; jackpots are wins whose reason is JACKPOT.
+        """
+        assert spins > 1, "At least two spins are needed for the statistics."
+        payout_counts: Counter = Counter()
+        jackpots = 0
+        simulate = self._numpy_batch if self.use_numpy else self._python_batch
+        rng = np.random.default_rng(self.seed) if self.use_numpy else random.Random(self.seed)
+        remaining = spins
+        while remaining > 0:
+            size = min(self.batch_size, remaining)
+            batch_counts, batch_jackpots = simulate(rng, size)
+            payout_counts.update(batch_counts)
+            jackpots += batch_jackpots
+            remaining -= size
+        return SimulationReport(spins, payout_counts, jackpots)
+
+    def _numpy_batch(self, rng, size: int) -> Tuple[Dict[int, int], int]:
+        paytable = self.paytable
+        n = len(paytable.symbols)
+        p = np.asarray(paytable.weights, dtype=float)
+        stops = rng.choice(n, size=(size, paytable.reels), p=p / p.sum())
+        flat = stops @ (n ** np.arange(paytable.reels - 1, -1, -1))
+        entry_ids = np.frombuffer(paytable.table, dtype=np.uint16)[flat]
+
+        payouts = np.zeros(size, dtype=np.int64)
+        jackpots = 0
+        for number, entry in enumerate(paytable.entries[1:], start=1):
+            hits = entry_ids == number
+            count = int(hits.sum())
+            if count == 0:
+                continue
+            if entry.wheel:
+                payouts[hits] = entry.multiplier * rng.choice(np.asarray(entry.wheel), size=count)
+            else:
+                payouts[hits] = entry.multiplier
+            if entry.reason == "JACKPOT":
+                jackpots += count
+        values, counts = np.unique(payouts, return_counts=True)
+        return {int(v): int(c) for v, c in zip(values, counts)}, jackpots
+
+    def _python_batch(self, rng: random.Random, size: int) -> Tuple[Dict[int, int], int]:
+        paytable = self.paytable
+        reel_count = paytable.reels
+        stops = ReelSampler(paytable.weights, rng=rng).sample_many(reel_count * size)
+        wins: Counter = Counter()
+        jackpots = 0
+        for i in range(0, reel_count * size, reel_count):
+            entry = paytable.lookup(stops[i:i + reel_count])
+            if entry is None:
+                continue
+            wins[entry.multiplier * (rng.choice(entry.wheel) if entry.wheel else 1)] += 1
+            if entry.reason == "JACKPOT":
+                jackpots += 1
+        wins[0] += size - sum(wins.values())
+        return wins, jackpots
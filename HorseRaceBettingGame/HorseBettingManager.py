@@ -271,11 +271,6 @@ class HorseBettingManager:
         horse_number = self.horse_number
 
         bm = BalanceManager()
-        # Create observers for this interaction.
-        se_observer = SoundEffectObserver(player)
-        be_observer = BalanceEffectObserver(player, player)
-        bm.register_observer(se_observer)
-        bm.register_observer(be_observer)
 
 
         # Display the horse emote and the sound before the race results are shown
@@ -305,7 +300,9 @@ class HorseBettingManager:
                     image = "player2"
                 )
             )
-            obs = BalanceManager().increase_balance(win_amount, reason=BalanceChangeReason.WIN, player=player)
+            # the player's pooled observers are only registered while the balance changes
+            with bm.observing(player, sender=player):
+                obs = bm.increase_balance(win_amount, reason=BalanceChangeReason.WIN, player=player)
             #messages.extend(obs)
         else:
             messages.append(
@@ -317,7 +314,8 @@ class HorseBettingManager:
                 )
             )
             
-            obs = BalanceManager().decrease_balance(bet_amount, reason=BalanceChangeReason.LOSE, player=player)
+            with bm.observing(player, sender=player):
+                obs = bm.decrease_balance(bet_amount, reason=BalanceChangeReason.LOSE, player=player)
             #messages.extend(obs)
 
         
@@ -327,8 +325,6 @@ class HorseBettingManager:
             SoundMessage(recipient = player, sound_path = "horse", volume = 0.8)
         )
         messages.extend(scoreboard_msgs)
-        bm.unregister_observer(se_observer)
-        bm.unregister_observer(be_observer)
         self.set_bet(player, bet_amount=50)
         
         return messages
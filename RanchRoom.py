@@ -1,6 +1,7 @@
 from .HorseRaceBettingGame.HorseBettingManager import *
 from .COMMANDS.HorseManagerCommands import *
 from .COMMANDS.BalanceCommand import BalanceCommand
+from .COMMANDS.LeaderboardCommand import LeaderboardCommand
 from .COMMANDS.HorseBetCommand import HorseBetCommand
 
 from .NPCs.NPC_Bookmaker import HorseBookmaker
@@ -30,7 +31,7 @@ class RanchRoom(Map):
             ## HOPEFULLY THE CORRECT ONE
             # chat_commands =  [BalanceCommand],
             ## CHECK THIS ONE
-            chat_commands = [HorseBetCommand, BalanceCommand]
+            chat_commands = [HorseBetCommand, BalanceCommand, LeaderboardCommand]
         )
     
     def get_objects(self) -> list[tuple[MapObject, Coord]]:
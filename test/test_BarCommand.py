@@ -15,6 +15,7 @@ def test_execute_emote_and_balance(monkeypatch):
     bm = BalanceManager()
     bm.balances.clear()
     bm.observers.clear()
+    bm.player_observers.clear()
 
     msgs = bar.execute(None, player)
     # first message should be the emote
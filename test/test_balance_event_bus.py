@@ -0,0 +1,133 @@
+import asyncio
+import threading
+
+import pytest
+
+from ..imports import *
+from ..BALANCE.BalanceEventBus import BalanceEvent, BalanceEventBus, BackpressurePolicy
+from ..BALANCE.PlayerBalance import BalanceManager, BalanceChangeReason
+
+
+class DummyPlayer:
+    """ HumanPlayer (just needs get_name())."""
+    def __init__(self, name: str):
+        self._name = name
+
+    def get_name(self) -> str:
+        return self._name
+
+
+@pytest.fixture(autouse=True)
+def reset_balance_manager():
+    bm = BalanceManager()
+    bm.balances.clear()
+    bm.observers.clear()
+    bm.player_observers.clear()
+    yield
+    bm.detach_event_bus()
+    bm.balances.clear()
+
+
+def test_balance_changes_are_published_to_the_bus():
+    """
+    Tests that subscribers receive every change on a worker thread, after the command returned
+    """
+    bm = BalanceManager()
+    bus = BalanceEventBus()
+    received = []
+    threads = set()
+
+    def handler(event):
+        threads.add(threading.current_thread().name)
+        received.append(event)
+
+    bus.subscribe(handler)
+    bus.start()
+    bm.attach_event_bus(bus)
+
+    player = DummyPlayer("Alice")
+    bm.decrease_balance(17, BalanceChangeReason.DRINK, player=player)
+    bm.transaction(player).debit(10, BalanceChangeReason.BET).credit(25, BalanceChangeReason.WIN).commit()
+    bus.stop()
+
+    assert [(e.key, e.change, e.new_balance, e.reason) for e in received] == [
+        ("Alice", -17.0, 983.0, BalanceChangeReason.DRINK),
+        ("Alice", 15.0, 998.0, BalanceChangeReason.WIN),
+    ]
+    assert threading.current_thread().name not in threads
+
+
+def test_backpressure_policies():
+    """
+    Tests that a full queue drops the newest or the oldest event as configured and counts it
+    """
+    newest = BalanceEventBus(maxsize=2, policy=BackpressurePolicy.DROP_NEWEST)
+    oldest = BalanceEventBus(maxsize=2, policy=BackpressurePolicy.DROP_OLDEST)
+    for i in range(3):
+        newest.publish(BalanceEvent("p", i, 0))
+        oldest.publish(BalanceEvent("p", i, 0))
+
+    assert newest.dropped == 1 and oldest.dropped == 1
+    assert [e.change for e in newest._queue] == [0, 1]
+    assert [e.change for e in oldest._queue] == [1, 2]
+
+    blocking = BalanceEventBus(maxsize=1, policy=BackpressurePolicy.BLOCK, block_timeout=0.01)
+    blocking.start()
+    blocking.subscribe(lambda event: None)
+    for i in range(50):
+        blocking.publish(BalanceEvent("p", i, 0))
+    blocking.stop()
+    assert blocking.published + blocking.dropped == 50
+
+
+def test_failing_subscriber_does_not_stop_the_bus():
+    bus = BalanceEventBus()
+    received = []
+    bus.subscribe(lambda event: 1 / 0)
+    bus.subscribe(received.append)
+    bus.start()
+    bus.publish(BalanceEvent("p", 1.0, 1001.0))
+    bus.publish(BalanceEvent("p", 2.0, 1003.0))
+    bus.stop()
+    assert bus.errors == 2
+    assert len(received) == 2
+
+
+def test_stop_drains_a_bus_that_was_never_started():
+    """
+    Tests that stop(drain=True) handles queued events itself instead of waiting for workers that never ran
+    """
+    bus = BalanceEventBus()
+    received = []
+    bus.subscribe(received.append)
+    bus.subscribe(lambda event: 1 / 0)
+    bus.publish(BalanceEvent("p", 1.0, 1001.0))
+    bus.stop()
+    assert [e.change for e in received] == [1.0]
+    assert bus.errors == 1 and bus.pending() == 0
+
+
+def test_async_subscriber():
+    """
+    Tests that coroutine subscribers run as tasks on the asyncio loop
+    """
+    async def main():
+        loop = asyncio.get_running_loop()
+        done = asyncio.Event()
+        received = []
+
+        async def consume(event):
+            received.append(event.change)
+            if len(received) == 2:
+                done.set()
+
+        bus = BalanceEventBus()
+        bus.subscribe_async(loop, consume)
+        bus.start()
+        bus.publish(BalanceEvent("p", 1.0, 1001.0))
+        bus.publish(BalanceEvent("p", -1.0, 1000.0))
+        await asyncio.wait_for(done.wait(), 5)
+        bus.stop()
+        return received
+
+    assert asyncio.run(main()) == [1.0, -1.0]
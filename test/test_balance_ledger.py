@@ -0,0 +1,101 @@
+import pytest
+
+from ..imports import *
+from ..BALANCE.BalanceLedger import BalanceLedger
+from ..BALANCE.PlayerBalance import BalanceManager, BalanceChangeReason
+
+
+class DummyPlayer:
+    """ HumanPlayer (just needs get_name())."""
+    def __init__(self, name: str):
+        self._name = name
+
+    def get_name(self) -> str:
+        return self._name
+
+
+@pytest.fixture(autouse=True)
+def reset_balance_manager():
+    bm = BalanceManager()
+    bm.balances.clear()
+    bm.observers.clear()
+    bm.player_observers.clear()
+    yield
+    bm.detach_ledger()
+    bm.balances.clear()
+
+
+def test_ledger_replays_log_after_restart(tmp_path):
+    """
+    Tests that records written before close are replayed on top of the default balance
+    """
+    ledger = BalanceLedger(str(tmp_path), flush_every=1000)
+    ledger.record("Alice", -17.0, "drink")
+    ledger.record("Alice", 30.0, "win")
+    ledger.record("Bob", -10.0, "cost")
+    ledger.close()
+
+    restored = BalanceLedger(str(tmp_path)).load()
+    assert restored == {"Alice": 1013.0, "Bob": 990.0}
+
+
+def test_idle_batch_is_flushed_after_interval(tmp_path):
+    """
+    Tests that a buffered record is written once flush_interval passes, without another record() call
+    """
+    import time
+    ledger = BalanceLedger(str(tmp_path), flush_every=1000, flush_interval=0.05)
+    ledger.record("Alice", -17.0, "drink")
+    log = tmp_path / BalanceLedger.LOG_NAME
+    deadline = time.monotonic() + 5
+    while log.read_text() == "" and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert '"Alice"' in log.read_text()
+    ledger.close()
+    assert not ledger._flusher.is_alive()
+
+
+def test_snapshot_compacts_log_and_only_tail_is_replayed(tmp_path):
+    """
+    Tests that a snapshot truncates the log and later records are replayed on top of it
+    """
+    ledger = BalanceLedger(str(tmp_path), snapshot_every=2)
+    assert not ledger.record("Alice", -5.0, "cost")
+    assert ledger.record("Alice", -5.0, "cost")
+    ledger.snapshot({"Alice": 990.0})
+    assert (tmp_path / BalanceLedger.LOG_NAME).read_text() == ""
+
+    ledger.record("Alice", 100.0, "win")
+    ledger.close()
+    assert BalanceLedger(str(tmp_path)).load() == {"Alice": 1090.0}
+
+
+def test_torn_tail_is_ignored(tmp_path):
+    """
+    Tests that a partially written last line does not break recovery
+    """
+    ledger = BalanceLedger(str(tmp_path))
+    ledger.record("Alice", -10.0, "cost")
+    ledger.close()
+    with open(tmp_path / BalanceLedger.LOG_NAME, "a") as f:
+        f.write('[2,"Alice",-99')
+
+    restored = BalanceLedger(str(tmp_path))
+    assert restored.load() == {"Alice": 990.0}
+    assert restored.seq == 1
+
+
+def test_balance_manager_recovers_from_ledger(tmp_path):
+    """
+    Tests that balances survive a restart of the BalanceManager through its ledger
+    """
+    bm = BalanceManager()
+    p = DummyPlayer("Carol")
+    bm.attach_ledger(BalanceLedger(str(tmp_path)))
+    bm.decrease_balance(17.0, BalanceChangeReason.DRINK, player=p)
+    bm.increase_balance(50.0, BalanceChangeReason.WIN, player=p)
+    bm.detach_ledger()
+
+    bm.balances.clear()
+    bm.attach_ledger(BalanceLedger(str(tmp_path)))
+    assert bm.get_balance(player=p) == 1033.0
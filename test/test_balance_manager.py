@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from coord import Coord
     from Player import HumanPlayer
-from ..BALANCE.PlayerBalance import BalanceManager, BalanceObserver, BalanceChangeReason
+from ..BALANCE.PlayerBalance import BalanceManager, BalanceObserver, BalanceChangeReason, InsufficientFundsError
 from typing import List, Optional
 
 
@@ -47,6 +47,7 @@ def reset_balance_manager():
     bm = BalanceManager()
     bm.balances.clear()
     bm.observers.clear()
+    bm.player_observers.clear()
 
 
 def test_get_balance_initializes_and_returns_default():
@@ -129,3 +130,196 @@ def test_notify_observers_without_changing_balance():
     assert any("Notified:" in m for m in msgs)
 
     bm.unregister_observer(obs)
+
+
+def test_player_observer_only_sees_own_player():
+    """
+    Tests that an observer registered for one player is not notified about another player's balance
+    """
+    bm = BalanceManager()
+    alice = DummyPlayer("Alice")
+    bob = DummyPlayer("Bob")
+    obs = DummyObserver()
+    bm.register_observer(obs, player=alice)
+
+    bm.increase_balance(amount=10, reason=BalanceChangeReason.WIN, player=bob)
+    assert obs.notifications == []
+
+    bm.increase_balance(amount=10, reason=BalanceChangeReason.WIN, player=alice)
+    assert obs.notifications == [(1010.0, 10, BalanceChangeReason.WIN)]
+
+    bm.unregister_observer(obs, player=alice)
+    assert bm.player_observers == {}
+
+
+def test_player_observer_filtered_by_reason():
+    """
+    Tests that a reason-specific observer only hears about changes with that reason
+    """
+    bm = BalanceManager()
+    p = DummyPlayer("Erin")
+    obs = DummyObserver()
+    bm.register_observer(obs, player=p, reason=BalanceChangeReason.DRINK)
+
+    bm.decrease_balance(amount=5, reason=BalanceChangeReason.COST, player=p)
+    assert obs.notifications == []
+
+    bm.decrease_balance(amount=17, reason=BalanceChangeReason.DRINK, player=p)
+    assert obs.notifications == [(978.0, -17, BalanceChangeReason.DRINK)]
+
+    bm.unregister_observer(obs, player=p, reason=BalanceChangeReason.DRINK)
+
+
+def test_transaction_applies_legs_with_one_notification():
+    """
+    Tests that a multi-leg transaction applies the net change and notifies observers once
+    """
+    bm = BalanceManager()
+    p = DummyPlayer("Frank")
+    obs = DummyObserver()
+    bm.register_observer(obs, player=p)
+
+    with bm.transaction(p) as txn:
+        txn.debit(10, BalanceChangeReason.BET)
+        txn.credit(40, BalanceChangeReason.WIN)
+
+    assert bm.get_balance(player=p) == 1030.0
+    assert obs.notifications == [(1030.0, 30, BalanceChangeReason.WIN)]
+    assert len(txn.messages) == 1
+
+    bm.unregister_observer(obs, player=p)
+
+
+def test_transaction_default_reason_follows_net_change():
+    """
+    Tests that a mixed transaction is not reported as a WIN when it nets a loss
+    """
+    bm = BalanceManager()
+    p = DummyPlayer("Ivy")
+    obs = DummyObserver()
+    bm.register_observer(obs, player=p)
+
+    bm.transaction(p).debit(20, BalanceChangeReason.BET).credit(5, BalanceChangeReason.WIN).commit()
+    bm.transaction(p).debit(3, BalanceChangeReason.COST).debit(2, BalanceChangeReason.DRINK).commit()
+    assert obs.notifications == [(985.0, -15, BalanceChangeReason.LOSE), (980.0, -5, BalanceChangeReason.DRINK)]
+
+    bm.unregister_observer(obs, player=p)
+
+
+def test_transaction_rejects_insufficient_funds():
+    """
+    Tests that a transaction overdrawing the balance is rejected without applying any leg
+    """
+    bm = BalanceManager()
+    p = DummyPlayer("Gina")
+    bm.balances[p.get_name()] = 5.0
+    obs = DummyObserver()
+    bm.register_observer(obs, player=p)
+
+    txn = bm.transaction(p).debit(10, BalanceChangeReason.BET).credit(100, BalanceChangeReason.WIN)
+    with pytest.raises(InsufficientFundsError):
+        txn.commit()
+
+    assert bm.get_balance(player=p) == 5.0
+    assert obs.notifications == []
+
+    bm.unregister_observer(obs, player=p)
+
+
+def test_try_decrease_balance_fails_cleanly():
+    """
+    Tests that the compare-and-set debit leaves the balance untouched when it is too low
+    """
+    bm = BalanceManager()
+    p = DummyPlayer("Hank")
+    bm.balances[p.get_name()] = 5.0
+
+    assert bm.try_decrease_balance(10, BalanceChangeReason.BET, player=p) is None
+    assert bm.get_balance(player=p) == 5.0
+    assert bm.try_decrease_balance(5, BalanceChangeReason.BET, player=p) == []
+    assert bm.get_balance(player=p) == 0.0
+
+
+def test_concurrent_updates_are_not_lost():
+    """
+    Tests that balance updates from several threads on the same players all apply
+    """
+    import threading
+    bm = BalanceManager()
+    players = [DummyPlayer(f"T{i}") for i in range(4)]
+
+    def work():
+        for _ in range(500):
+            for p in players:
+                bm.increase_balance(1, BalanceChangeReason.WIN, player=p)
+                bm.try_decrease_balance(1, BalanceChangeReason.COST, player=p)
+                bm.increase_balance(1, BalanceChangeReason.WIN, player=p)
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    for p in players:
+        assert bm.get_balance(player=p) == 1000.0 + 4 * 500
+
+
+def test_history_keeps_recent_changes_and_stats():
+    """
+    Tests that the bounded history returns the newest changes first and tracks session statistics
+    """
+    bm = BalanceManager()
+    bm.histories.clear()
+    p = DummyPlayer("Ivy")
+
+    bm.decrease_balance(10, BalanceChangeReason.COST, player=p)
+    bm.increase_balance(30, BalanceChangeReason.WIN, player=p)
+    bm.decrease_balance(17, BalanceChangeReason.DRINK, player=p)
+    bm.decrease_balance(20, BalanceChangeReason.BET, player=p)
+
+    recent = bm.get_recent_changes(player=p, n=2)
+    assert [(amount, reason) for amount, reason, _ in recent] == [(-20.0, BalanceChangeReason.BET), (-17.0, BalanceChangeReason.DRINK)]
+
+    stats = bm.get_session_stats(player=p)
+    assert stats["net"] == -17.0
+    # peak +20 after the win, then down to -17
+    assert stats["max_drawdown"] == 37.0
+    assert stats["wins"] == {BalanceChangeReason.WIN: 1}
+    assert stats["losses"][BalanceChangeReason.DRINK] == 1
+
+
+def test_history_is_bounded():
+    bm = BalanceManager()
+    bm.histories.clear()
+    p = DummyPlayer("Jay")
+    for i in range(BalanceManager.HISTORY_SIZE + 10):
+        bm.increase_balance(i, BalanceChangeReason.WIN, player=p)
+
+    recent = bm.get_recent_changes(player=p, n=1000)
+    assert len(recent) == BalanceManager.HISTORY_SIZE
+    assert recent[0][0] == BalanceManager.HISTORY_SIZE + 9
+    assert bm.get_session_stats(player=p)["changes"] == BalanceManager.HISTORY_SIZE + 10
+
+
+def test_observing_reuses_pooled_observers_and_cleans_up():
+    """
+    Tests that the scoped subscription registers cached observers and always unregisters them
+    """
+    bm = BalanceManager()
+    p = DummyPlayer("Kim")
+    sender = object()
+
+    with bm.observing(p, sender=sender):
+        first = list(bm.player_observers[p.get_name()][None])
+        # nested scopes share the registration
+        with bm.observing(p, sender=sender):
+            pass
+        assert list(bm.player_observers[p.get_name()][None]) == first
+    assert p.get_name() not in bm.player_observers
+
+    with pytest.raises(RuntimeError):
+        with bm.observing(p, sender=sender):
+            assert list(bm.player_observers[p.get_name()][None]) == first
+            raise RuntimeError("early exit")
+    assert p.get_name() not in bm.player_observers
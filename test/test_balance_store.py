@@ -0,0 +1,119 @@
+import pytest
+
+from ..imports import *
+from ..BALANCE.BalanceStore import BalanceStore, to_cents
+from ..BALANCE.PlayerBalance import BalanceManager, BalanceChangeReason
+
+
+class DummyPlayer:
+    """ HumanPlayer (just needs get_name())."""
+    def __init__(self, name: str):
+        self._name = name
+
+    def get_name(self) -> str:
+        return self._name
+
+
+def test_store_keeps_exact_cents():
+    """
+    Tests that repeated $17.00 debits do not drift like float arithmetic would
+    """
+    store = BalanceStore(capacity=1)
+    store["Alice"] = 1000.0
+    for _ in range(50):
+        store.add_cents("Alice", -to_cents(17.0))
+    assert store["Alice"] == 150.0
+    assert store.get_cents("Alice") == 15000
+
+
+def test_store_grows_and_reuses_slots():
+    """
+    Tests that the buffer grows past its capacity and deleted slots are reused
+    """
+    store = BalanceStore(capacity=2)
+    for i in range(5):
+        store[f"p{i}"] = i
+    assert len(store) == 5
+    assert store.total_cents() == to_cents(0 + 1 + 2 + 3 + 4)
+
+    slot = store.slot_of("p3")
+    del store["p3"]
+    assert "p3" not in store
+    store["new"] = 1.0
+    assert store.slot_of("new") == slot
+
+
+def test_store_credit_all():
+    store = BalanceStore()
+    store["a"] = 1.0
+    store["b"] = 2.0
+    del store["b"]
+    store.credit_all(to_cents(5.0))
+    assert dict(store) == {"a": 6.0}
+    assert store.total_cents() == 600
+
+
+def test_store_credit_all_races_with_add_cents():
+    """
+    Tests that credit_all and add_cents on other threads do not lose updates
+    """
+    import threading
+    store = BalanceStore()
+    store["a"] = 0.0
+
+    def add():
+        for _ in range(2000):
+            store.add_cents("a", 1)
+
+    threads = [threading.Thread(target=add) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for _ in range(200):
+        store.credit_all(1)
+    for thread in threads:
+        thread.join()
+    assert store.get_cents("a") == 4 * 2000 + 200
+
+
+def test_memory_mapped_store_persists(tmp_path):
+    """
+    Tests that a memory-mapped store reopens with the same keys and balances
+    """
+    path = str(tmp_path / "balances.bin")
+    store = BalanceStore(path=path, capacity=1)
+    store["Alice"] = 983.0
+    store["Bob"] = 12.5
+    store.close()
+
+    reopened = BalanceStore(path=path)
+    assert dict(reopened) == {"Alice": 983.0, "Bob": 12.5}
+    reopened.close()
+
+
+def test_memory_mapped_store_logs_new_keys(tmp_path):
+    """
+    Tests that slots assigned or freed after the last flush() survive a store that is never flushed again
+    """
+    path = str(tmp_path / "balances.bin")
+    store = BalanceStore(path=path, capacity=1)
+    store["Alice"] = 983.0
+    store.flush()
+    store["Bob"] = 12.5
+    store["Carol"] = 7.0
+    del store["Alice"]
+
+    # opened next to the live store, as after a crash: nothing was flushed since Alice
+    recovered = BalanceStore(path=path)
+    assert dict(recovered) == {"Bob": 12.5, "Carol": 7.0}
+    recovered.close()
+    store.close()
+
+
+def test_balance_manager_uses_cents():
+    bm = BalanceManager()
+    bm.balances.clear()
+    p = DummyPlayer("Dave")
+    for _ in range(10):
+        bm.decrease_balance(0.1, BalanceChangeReason.COST, player=p)
+    assert bm.get_balance(player=p) == 999.0
+    bm.balances.clear()
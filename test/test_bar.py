@@ -34,6 +34,7 @@ def reset_balance_manager():
     bm = BalanceManager()
     bm.balances.clear()
     bm.observers.clear()
+    bm.player_observers.clear()
 
 
 def test_bar_menu_computer_options():
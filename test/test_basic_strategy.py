@@ -0,0 +1,68 @@
+import random
+
+import pytest
+
+from ..imports import *
+from ..Cards.BasicStrategy import BasicStrategy, HIT, STAND
+from ..Cards.Blackjack import BlackjackGame
+from ..Cards.BlackjackBot import BlackjackBot
+from ..Cards.Card import Card, Suit, Rank
+from .test_balance_manager import DummyPlayer
+
+
+class TestBasicStrategy:
+    def test_obvious_decisions(self):
+        strategy = BasicStrategy.generate(1)
+        for upcard in range(1, 11):
+            assert strategy.action(11, False, upcard) == HIT
+            assert strategy.action(20, False, upcard) == STAND
+            assert strategy.action(21, True, upcard) == STAND
+            assert strategy.action(13, True, upcard) == HIT
+        # the dealer busts most from 5 and 6
+        assert strategy.action(13, False, 6) == STAND
+        assert strategy.action(13, False, 10) == HIT
+
+    def test_shipped_tables_are_current(self):
+        for decks in range(1, 9):
+            assert BasicStrategy.load(decks).to_dict() == BasicStrategy.generate(decks).to_dict()
+
+    def test_custom_path_round_trip(self, tmp_path):
+        path = str(tmp_path / "strategy.json")
+        generated = BasicStrategy.load(2, path=path)
+        assert BasicStrategy.load(2, path=path).to_dict() == generated.to_dict()
+        with open(path, encoding="utf-8") as f:
+            assert '"decks": 2' in f.read()
+        # only tables from the default locations are kept in memory
+        assert BasicStrategy.load(2) is not generated
+        assert BasicStrategy.load(2) is BasicStrategy.load(2)
+
+    def test_bot_beats_hitting_to_17(self):
+        rounds = 20000
+        bot = BlackjackBot(BlackjackGame(rng=random.Random(5))).play(rounds)
+        assert bot.rounds == rounds == bot.wins + bot.pushes + bot.losses
+
+        game = BlackjackGame(rng=random.Random(5))
+        wins = 0
+        for _ in range(rounds):
+            game.start_new_round()
+            while game.get_player_total() < 17:
+                game.player_hit()
+            if not game.is_busted():
+                game.dealer_turn()
+            wins += game.determine_winner() == "Player"
+        assert bot.net_antes > 2 * wins - rounds
+
+    def test_hint_command(self):
+        from ..Cards.BlackjackComputer import BlackjackComputer
+        computer = BlackjackComputer()
+        player = DummyPlayer("Hinted")
+        game = computer.get_or_create_game(player)
+        game.start_new_round()
+        game.player_hand.clear_hand()
+        game.player_hand.add_card(Card(Suit.HEARTS, Rank.TEN))
+        game.player_hand.add_card(Card(Suit.CLUBS, Rank.KING))
+
+        msgs = computer.get_menu_options()["Hint"].execute(None, player)
+        text = msgs[0]._get_data().get("dialogue_text", "")
+        assert text.startswith("Hint: Stand on 20")
+        assert "dealer busts" in text
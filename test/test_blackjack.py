@@ -1,9 +1,12 @@
+import random
+
 import pytest
 
 from ..imports import *
 from ..Cards.Card import Card, Suit, Rank
 from ..Cards.Hand import Hand, Deck
 from ..Cards.Blackjack import BlackjackGame
+from ..Cards.Shoe import Shoe
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
@@ -24,6 +27,22 @@ class TestBlackjack:
         h.add_card(Card(Suit.DIAMONDS, Rank.TWO))
         assert h.is_busted_blackjack()
 
+    def test_hand_totals_are_incremental(self):
+        rng = random.Random(7)
+        deck = Deck()
+        for _ in range(500):
+            h = Hand()
+            for card in rng.sample(deck.cards, rng.randint(1, 6)):
+                h.add_card(card)
+                hard = sum(1 if c.rank == Rank.ACE else min(10, c.base_value()) for c in h.cards)
+                has_ace = any(c.rank == Rank.ACE for c in h.cards)
+                best = hard + 10 if has_ace and hard + 10 <= 21 else hard
+                assert h.total_blackjack() == best
+                assert h.is_soft_blackjack() == (best != hard)
+                assert h.is_busted_blackjack() == (best > 21)
+        h.clear_hand()
+        assert (h.total_blackjack(), h.aces, h.soft) == (0, 0, False)
+
     def test_blackjack_start_new_round(self):
         game = BlackjackGame()
         game.start_new_round()
@@ -49,3 +68,72 @@ class TestBlackjack:
         winner = game.determine_winner()
         assert winner == "Player"
 
+
+    def test_blackjack_rounds_share_the_shoe(self):
+        game = BlackjackGame(decks=2, penetration=0.5)
+        shoe = game.deck
+        reshuffles = 0
+        for _ in range(30):
+            game.start_new_round()
+            assert game.deck is shoe
+            if len(shoe) == 104 - 4:
+                reshuffles += 1
+            assert len(shoe) >= 104 - shoe.cut - 4
+        # 30 rounds use at least 120 cards, more than the 52 before the cut card
+        assert reshuffles >= 2
+
+    def test_table_keeps_its_shoe_between_games(self):
+        from ..Cards.BlackjackComputer import BlackjackComputer
+        computer = BlackjackComputer(decks=6, penetration=0.8)
+        player = object()
+        game = computer.get_or_create_game(player)
+        game.start_new_round()
+        left = len(computer.shoe)
+        computer.remove_game(player)
+
+        next_game = computer.get_or_create_game(player)
+        assert next_game is not game and next_game.deck is computer.shoe
+        assert computer.shoe.decks == 6 and computer.shoe.penetration == 0.8
+        next_game.start_new_round()
+        assert len(computer.shoe) == left - 4
+
+    def test_games_sharing_a_shoe_never_hold_the_same_card(self):
+        shoe = Shoe(decks=1, penetration=0.75, rng=random.Random(3))
+        first, second = BlackjackGame(shoe=shoe), BlackjackGame(shoe=shoe)
+        for _ in range(2000):
+            # each round is dealt while the other game's round is still on the table
+            for game, other in ((first, second), (second, first)):
+                game.start_new_round()
+                while game.player_hand.blackjack_total < 17:
+                    game.player_hit()
+                game.dealer_turn()
+                held = [c.index for g in (game, other) for h in (g.player_hand, g.dealer_hand) for c in h.cards]
+                assert len(held) == len(set(held))
+                assert not set(held) & {c.index for c in shoe.cards}
+                assert shoe.rank_counts == tuple(sum(1 for c in shoe.cards if c.rank == rank) for rank in Rank)
+
+class TestShoe:
+    def test_shoe_counts_and_cut_card(self):
+        shoe = Shoe(decks=6, penetration=0.75, rng=random.Random(1))
+        assert len(shoe) == 312
+        assert shoe.cut == 234
+        assert sorted(c.index for c in shoe.cards) == sorted(list(range(52)) * 6)
+
+        seen = [shoe.deal_card() for _ in range(234)]
+        counts = shoe.rank_counts
+        for rank_number, rank in enumerate(Rank):
+            assert counts[rank_number] == 24 - sum(1 for c in seen if c.rank == rank)
+        assert shoe.start_round()
+        assert len(shoe) == 312
+        assert shoe.rank_counts == (24,) * 13
+
+    def test_shoe_running_dry_keeps_cards_in_play(self):
+        shoe = Shoe(decks=1, penetration=1.0, rng=random.Random(2))
+        for _ in range(50):
+            shoe.deal_card()
+        shoe.start_round()
+        in_play = [shoe.deal_card() for _ in range(2)]
+        # the shoe is empty: the next cards come from the 50 discards only
+        rest = [shoe.deal_card() for _ in range(50)]
+        assert sorted(c.index for c in in_play + rest) == list(range(52))
+        assert len(shoe) == 0
@@ -1,3 +1,6 @@
+import copy
+import pickle
+
 import pytest
 
 from ..imports import *
@@ -57,3 +60,26 @@ class TestHand:
 
         assert Rank.TWO.short_str() == "2"
         assert Rank.TEN.short_str() == "10"
+
+class TestFlyweightCards:
+    def test_cards_are_interned(self):
+        card = Card(Suit.HEARTS, Rank.ACE)
+        assert card is Card(Suit.HEARTS, Rank.ACE)
+        assert Card.from_index(card.index) is card
+        assert Card.copy(card) is card
+        assert copy.deepcopy([card])[0] is card
+        assert pickle.loads(pickle.dumps(card)) is card
+
+    def test_indices_and_tables(self):
+        d = Deck()
+        assert [c.index for c in d.cards] == list(range(52))
+        assert len({id(c) for c in d.cards}) == 52
+        for c in d.cards:
+            assert c.base_value() == c.rank.numeric_value()
+            assert c.blackjack_value == (1 if c.rank == Rank.ACE else min(10, c.rank.numeric_value()))
+            assert str(c) == f"{c.rank.value} of {c.suit}"
+            assert c.short_str() == f"{c.rank.short_str()}{c.suit.short_str()}"
+
+    def test_cards_are_immutable(self):
+        with pytest.raises(AttributeError):
+            Card(Suit.CLUBS, Rank.TWO).rank = Rank.ACE
@@ -0,0 +1,59 @@
+import random
+
+import pytest
+
+from ..imports import *
+from ..Cards.Card import Card, Suit, Rank
+from ..Cards.Blackjack import BlackjackGame
+from ..Cards.DealerOdds import BUST, OUTCOMES, dealer_distribution, dealer_odds, value_counts, _distribution
+from ..Cards.Hand import Hand
+
+
+def value_list(counts):
+    return [value for value in range(1, 11) for _ in range(counts[value - 1])]
+
+
+class TestDealerOdds:
+    def test_small_composition_by_hand(self):
+        # upcard 6, left: two tens and an ace
+        # 10 -> 16 then 10 (bust) or A (17); A -> soft 17
+        dist = dealer_distribution(6, (1, 0, 0, 0, 0, 0, 0, 0, 0, 2))
+        assert dist[OUTCOMES.index(17)] == pytest.approx(2 / 3)
+        assert dist[OUTCOMES.index(BUST)] == pytest.approx(1 / 3)
+
+    def test_matches_simulated_dealer(self):
+        counts = value_counts([24] * 13)   # a six deck shoe
+        counts = tuple(c - (1 if value == 5 else 0) for value, c in enumerate(counts, start=1))
+        dist = dealer_distribution(Card(Suit.CLUBS, Rank.FIVE), counts)
+        assert sum(dist) == pytest.approx(1)
+
+        rng = random.Random(3)
+        cards = value_list(counts)
+        tally = dict.fromkeys(OUTCOMES, 0)
+        trials = 20000
+        for _ in range(trials):
+            drawn = rng.sample(cards, 10)
+            hard, aces = 5, 0
+            while True:
+                total = hard + 10 if aces and hard <= 11 else hard
+                if total >= 17:
+                    break
+                card = drawn.pop()
+                hard += card
+                aces += card == 1
+            tally[min(total, BUST)] += 1
+        for i, outcome in enumerate(OUTCOMES):
+            assert tally[outcome] / trials == pytest.approx(dist[i], abs=0.015)
+
+    def test_repeated_queries_are_memoized(self):
+        counts = [4] * 13
+        dealer_distribution(10, counts)
+        hits = _distribution.cache_info().hits
+        dealer_distribution(10, counts)
+        assert _distribution.cache_info().hits == hits + 1
+
+    def test_game_odds(self):
+        game = BlackjackGame(decks=6)
+        game.start_new_round()
+        dist = dealer_odds(game)
+        assert sum(dist) == pytest.approx(1)
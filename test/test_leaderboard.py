@@ -0,0 +1,76 @@
+import pytest
+
+from ..imports import *
+from ..BALANCE.Leaderboard import BalanceLeaderboard
+from ..BALANCE.PlayerBalance import BalanceManager, BalanceChangeReason
+from ..COMMANDS.LeaderboardCommand import LeaderboardCommand
+
+
+class DummyPlayer:
+    """ HumanPlayer (just needs get_name())."""
+    def __init__(self, name: str):
+        self._name = name
+
+    def get_name(self) -> str:
+        return self._name
+
+
+@pytest.fixture(autouse=True)
+def reset_balance_manager():
+    bm = BalanceManager()
+    bm.balances.clear()
+    bm.observers.clear()
+    bm.player_observers.clear()
+    yield
+    bm.balances.clear()
+
+
+def test_leaderboard_orders_and_ranks():
+    lb = BalanceLeaderboard()
+    lb.update("a", 500)
+    lb.update("b", 900)
+    lb.update("c", 700)
+    assert lb.top(2) == [("b", 900), ("c", 700)]
+    assert lb.rank_of("a") == 3
+
+    # moving an entry re-ranks it
+    lb.update("a", 1000)
+    assert lb.rank_of("a") == 1
+    assert lb.rank_of("b") == 2
+
+    lb.remove("b")
+    assert lb.top(5) == [("a", 1000), ("c", 700)]
+    assert lb.rank_of("b") is None
+    assert len(lb) == 2
+
+
+def test_balance_manager_keeps_leaderboard_current():
+    """
+    Tests that every balance change is reflected in the leaderboard without sorting
+    """
+    bm = BalanceManager()
+    alice = DummyPlayer("Alice")
+    bob = DummyPlayer("Bob")
+    bm.increase_balance(100, BalanceChangeReason.WIN, player=alice)
+    bm.decrease_balance(17, BalanceChangeReason.DRINK, player=bob)
+
+    assert bm.get_top_balances(2) == [("Alice", 1100.0), ("Bob", 983.0)]
+    assert bm.get_rank(player=bob) == 2
+
+    bm.increase_balance(200, BalanceChangeReason.JACKPOT, player=bob)
+    assert bm.get_rank(player=bob) == 1
+
+
+def test_leaderboard_command():
+    assert LeaderboardCommand.matches("leaderboard")
+    assert LeaderboardCommand.matches("leaderboard/3")
+    assert not LeaderboardCommand.matches("leaderboard/x")
+
+    bm = BalanceManager()
+    player = DummyPlayer("Carl")
+    bm.increase_balance(5, BalanceChangeReason.WIN, player=player)
+    msgs = LeaderboardCommand().execute("leaderboard/3", None, player)
+    assert len(msgs) == 1
+    text = msgs[0]._get_data().get("text", "")
+    assert "1. Carl: $1005.00" in text
+    assert "You are #1 of 1" in text
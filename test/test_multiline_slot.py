@@ -0,0 +1,169 @@
+import random
+import time
+
+import pytest
+
+from ..imports import *
+from ..BALANCE.PlayerBalance import BalanceManager, BalanceChangeReason
+from ..GAME.MultiLinePaytable import MultiLinePaytable
+from ..GAME.MultiLineSlotMachine import *
+from ..GAME.ProgressiveJackpot import ProgressiveJackpot
+from ..GAME.SlotMachine import SlotMachine
+
+
+class DummyPlayer:
+    """ HumanPlayer (just needs get_name()) """
+    def __init__(self, name: str):
+        self._name = name
+
+    def get_name(self) -> str:
+        return self._name
+
+
+@pytest.fixture(autouse=True)
+def reset_singletons():
+    SlotMachine._SlotMachine__instance = None
+    ProgressiveJackpot._ProgressiveJackpot__instance = None
+    bm = BalanceManager()
+    bm.balances.clear()
+    bm.observers.clear()
+    bm.player_observers.clear()
+    yield
+
+
+def naive_line_pay(paytable, window):
+    '''
+    Reference evaluation: walks every line, symbol by symbol
+    '''
+    total = 0
+    winning = 0
+    for line in paytable.lines:
+        cells = [window[reel * paytable.rows + row] for reel, row in enumerate(line)]
+        best = 0
+        for symbol, pays in paytable.pays.items():
+            target = paytable.index[symbol]
+            k = 0
+            while k < len(cells) and cells[k] in (target, paytable.wild):
+                k += 1
+            if k >= MultiLinePaytable.MIN_MATCH:
+                best = max(best, pays[k - MultiLinePaytable.MIN_MATCH])
+        total += best
+        winning += best > 0
+    return total, winning
+
+
+def test_bitmask_evaluation_matches_every_line():
+    paytable = MultiLinePaytable.load()
+    rng = random.Random(5)
+    cells = paytable.reels * paytable.rows
+    for _ in range(3000):
+        window = rng.choices(range(len(paytable.symbols)), weights=paytable.weights, k=cells)
+        result = paytable.evaluate(window)
+        assert (result.line_pay, result.winning_lines) == naive_line_pay(paytable, window)
+        assert result.scatters == window.count(paytable.scatter)
+
+
+def test_wild_and_scatter():
+    paytable = MultiLinePaytable.load()
+    heart, wild, scatter, seven = (paytable.index[s] for s in ("(  <3  )", "( WILD )", "(  $$  )", "(  7  )"))
+    # middle row: wild, wild, heart, heart, scatter; the rest is scatter-free filler
+    window = [paytable.index["(  :p  )"], wild, paytable.index["( ~*~ )"]] * 5
+    for reel, symbol in enumerate((wild, wild, heart, heart, seven)):
+        window[reel * 3 + 1] = symbol
+    result = paytable.evaluate(window)
+    # hearts on 4 reels beat 2 wilds, which pay nothing
+    assert result.line_pay >= paytable.pays["(  <3  )"][1]
+    assert not result.jackpot
+
+    window = [scatter] * 3 + [seven] * 12
+    result = paytable.evaluate(window)
+    assert result.scatters == 3
+    assert result.scatter_pay == paytable.scatter_pays[3]
+    # every line shows the jackpot symbol on reels 2-5 only: no line pays
+    assert result.line_pay == 0
+
+    # wilds pay the 7s' line pay but do not complete the jackpot
+    result = paytable.evaluate([wild] * 3 + [seven] * 12)
+    assert not result.jackpot
+    assert result.winning_lines == len(paytable.lines)
+    assert not paytable.evaluate([wild] * 15).jackpot
+
+    result = paytable.evaluate([seven] * 15)
+    assert result.jackpot
+    assert result.jackpot_pay == len(paytable.lines) * paytable.pays["(  7  )"][2]
+
+    wild_jackpots = MultiLinePaytable(paytable.symbols, paytable.weights, paytable.lines, paytable.pays,
+                                      wild="( WILD )", scatter="(  $$  )", jackpot="(  7  )", jackpot_wilds=True)
+    assert wild_jackpots.evaluate([wild] * 3 + [seven] * 12).jackpot
+
+
+def test_fifty_lines_under_a_millisecond():
+    base = MultiLinePaytable.load()
+    rng = random.Random(9)
+    lines = [[rng.randrange(3) for _ in range(5)] for _ in range(50)]
+    paytable = MultiLinePaytable(base.symbols, base.weights, lines, base.pays, wild="( WILD )",
+                                 scatter="(  $$  )", scatter_pays=base.scatter_pays, jackpot="(  7  )")
+    windows = [rng.choices(range(len(base.symbols)), weights=base.weights, k=15) for _ in range(2000)]
+    start = time.perf_counter()
+    for window in windows:
+        paytable.evaluate(window)
+    assert (time.perf_counter() - start) / len(windows) < 1e-3
+
+
+def test_machine_is_not_the_classic_singleton():
+    classic = SlotMachine()
+    machine = MultiLineSlotMachine()
+    assert machine is not classic
+    assert MultiLineSlotMachine() is not machine
+    assert len(machine.spin_reels()) == 15
+
+
+def test_play_round_pays_lines(monkeypatch):
+    util = MultiLineSlotMachineUtility()
+    machine = util.slot_machine
+    window = ["(  <3  )"] * 15
+    monkeypatch.setattr(machine, "spin_reels", lambda: list(window))
+    player = DummyPlayer("Liner")
+
+    result, msgs = machine.play_round(player, meter=util.jackpot_meter)
+    # every line pays 5 hearts, in line bets of 10 / 20
+    expected = round(10 * machine.paytable.pays["(  <3  )"][2], 2)
+    assert result.win_amount == pytest.approx(expected)
+    assert result.reason == BalanceChangeReason.WIN
+    assert BalanceManager().get_balance(player=player) == pytest.approx(1000 - 10 + expected)
+
+
+def test_play_round_losing_window(monkeypatch):
+    util = MultiLineSlotMachineUtility()
+    machine = util.slot_machine
+    # no symbol reaches reel 3 on any line
+    window = ["(  <3  )"] * 3 + ["(  :p  )"] * 3 + ["( ~*~ )"] * 9
+    monkeypatch.setattr(machine, "spin_reels", lambda: list(window))
+
+    result, msgs = machine.play_round(DummyPlayer("Unlucky"))
+    assert result.win_amount == 0
+    assert result.reason == BalanceChangeReason.LOSE
+    assert BalanceManager().get_balance(player=DummyPlayer("Unlucky")) == pytest.approx(990)
+
+
+def test_progressive_jackpot_keeps_the_other_wins(monkeypatch):
+    util = MultiLineSlotMachineUtility()
+    machine = util.slot_machine
+    paytable = machine.paytable
+    seven, heart, scatter = "(  7  )", "(  <3  )", "(  $$  )"
+    # top row of 7s (line 2 only), 3 scatters on the bottom row, hearts elsewhere
+    window = [seven, heart, scatter] * 3 + [seven, heart, heart] * 2
+    monkeypatch.setattr(machine, "spin_reels", lambda: list(window))
+    fixed = machine.spin()
+    assert fixed.reason == BalanceChangeReason.JACKPOT
+
+    evaluation = paytable.evaluate([paytable.index[symbol] for symbol in window])
+    rest = round(fixed.win_amount - 10 * evaluation.jackpot_pay / len(paytable.lines), 2)
+    assert rest >= 10 * paytable.scatter_pays[3]
+    player = DummyPlayer("Progressive")
+
+    result, msgs = machine.play_round(player, meter=util.jackpot_meter)
+    pool = result.progressive_amount
+    assert pool >= ProgressiveJackpot().seed
+    assert result.win_amount == pytest.approx(pool + rest)
+    assert BalanceManager().get_balance(player=player) == pytest.approx(1000 - 10 + pool + rest)
@@ -18,3 +18,34 @@ class TestPoker:
         game.start_new_round()
         # Each player should have 1 card if we have enough cards (3 total).
         assert len(game.deck) == 3
+
+    def test_bet_is_taken_before_the_ai_acts(self):
+        from ..BALANCE.PlayerBalance import BalanceManager, BalanceChangeReason
+        from ..Cards.OneCardPokerComputer import OneCardPokerComputer
+        from .test_balance_manager import DummyPlayer
+        bm = BalanceManager()
+        computer = OneCardPokerComputer(strategy=EasyPokerStrategy())
+        player = DummyPlayer("Broke")
+        computer.get_menu_options()["Deal"].execute(None, player)
+        game = computer.get_or_create_game(player)
+        pot, bets = game.pot, game.strategy.num_bets
+
+        # a balance that cannot cover the bet leaves the round untouched
+        bm.balances[player.get_name()] = game.bet_amount - 1
+        msgs = computer.get_menu_options()["Bet"].execute(None, player)
+        assert "You need at least" in msgs[0]._get_data().get("text", "")
+        assert game.pot == pot and game.active_round and game.strategy.num_bets == bets
+        assert bm.get_balance(player=player) == game.bet_amount - 1
+
+        # the bet is already off the balance when the AI decides
+        bm.balances[player.get_name()] = game.bet_amount
+        seen = []
+        def ai_folds():
+            seen.append(bm.get_balance(player=player))
+            return False
+        game.ai_decides_call = ai_folds
+        computer.get_menu_options()["Bet"].execute(None, player)
+        assert seen == [0]
+        assert not game.active_round and game.strategy.num_bets == bets + 1
+        assert bm.get_balance(player=player) == game.pot
+        bm.balances.clear()
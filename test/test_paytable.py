@@ -0,0 +1,61 @@
+import random
+
+import pytest
+
+from ..imports import *
+from ..GAME.Paytable import Paytable
+from ..GAME.SlotEvaluator import evaluate, evaluate_paytable
+from ..GAME.SlotMachine import PaytableStrategy, StandardStrategyWithWheel, JackpotStrategy
+from ..BALANCE.PlayerBalance import BalanceChangeReason
+
+
+FRUIT = {
+    "name": "fruit",
+    "symbols": ["cherry", "lemon", "bar"],
+    "weights": [2, 1, 1],
+    "combinations": [
+        {"symbols": ["bar", "bar", "bar"], "multiplier": 50, "reason": "JACKPOT", "text": "BAR BAR BAR!"},
+        {"symbols": ["cherry", "cherry", "*"], "multiplier": 2, "text": "Two cherries"},
+        {"symbols": ["*", "*", "*"], "same": True, "multiplier": 5, "wheel": [1, 4], "sound": "wheel", "text": "x{wheel}"},
+    ],
+}
+
+
+def test_paytable_compiles_to_lookup_table():
+    paytable = Paytable.from_dict(FRUIT)
+    assert len(paytable.table) == 27
+    assert paytable.lookup_symbols(["bar", "bar", "bar"]).multiplier == 50
+    # the first matching combination wins
+    assert paytable.lookup_symbols(["cherry", "cherry", "cherry"]).text == "Two cherries"
+    assert paytable.lookup_symbols(["lemon", "lemon", "lemon"]).wheel == (1, 4)
+    assert paytable.lookup_symbols(["lemon", "bar", "bar"]) is None
+    assert paytable.lookup_symbols(["A", "B", "C"]) is None
+    assert Paytable.from_dict(paytable.to_dict()).fingerprint() == paytable.fingerprint()
+
+
+def test_paytable_strategy(monkeypatch):
+    strategy = PaytableStrategy(Paytable.from_dict(FRUIT))
+    monkeypatch.setattr(random, "choice", lambda seq: 4)
+    assert strategy.spin_outcome(10, ["lemon"] * 3) == (200, "x4", BalanceChangeReason.WIN, "wheel")
+    assert strategy.spin_outcome(10, ["bar"] * 3) == (500, "BAR BAR BAR!", BalanceChangeReason.JACKPOT, None)
+    assert strategy.calculate_payout(10, ["bar", "lemon", "bar"]) == (0, "No win, better luck next time.")
+
+
+def test_classic_paytable_matches_the_original_strategies():
+    """
+    Tests that the classic paytable pays exactly what the jackpot and wheel strategies paid
+    """
+    classic = evaluate_paytable(Paytable.default(), spin_cost=10)
+    for reels in [["(  7  )"] * 3, ["(  <3  )"] * 3, ["(  <3  )", "(  7  )", "(  7  )"]]:
+        legacy = JackpotStrategy() if reels == JackpotStrategy.JACKPOT_REELS else StandardStrategyWithWheel()
+        assert PaytableStrategy(Paytable.default()).payout_distribution(10, reels) == legacy.payout_distribution(10, reels)
+    assert classic.rtp == pytest.approx(evaluate().rtp)
+
+
+def test_new_machine_evaluated_from_data():
+    result = evaluate_paytable(Paytable.from_dict(FRUIT))
+    p_cherry, p_other = 0.5, 0.25
+    expected = (p_other ** 3 * 50                      # bar bar bar
+                + p_cherry ** 2 * 2                    # cherry cherry *
+                + p_other ** 3 * 5 * 2.5)              # lemon lemon lemon, wheel averages 2.5
+    assert result.rtp == pytest.approx(expected)
@@ -0,0 +1,64 @@
+import math
+import random
+
+import pytest
+
+from ..GAME.Paytable import Paytable
+from ..GAME.PaytableTuner import PaytableTuner, TuningTargets
+from ..GAME.SlotEvaluator import evaluate_paytable
+
+
+def test_measure_matches_exact_evaluator():
+    '''
+    Tests that the tuner's fast statistics equal SlotEvaluator's for random configurations
+    '''
+    paytable = Paytable.default()
+    tuner = PaytableTuner(paytable)
+    rng = random.Random(3)
+    for _ in range(5):
+        data = paytable.to_dict()
+        data["weights"] = [rng.uniform(0.01, 1) for _ in paytable.symbols]
+        for combination in data["combinations"]:
+            combination["multiplier"] = rng.randint(1, 100)
+        candidate = Paytable.from_dict(data)
+        rtp, hit_frequency, volatility = tuner.measure(candidate.weights, [e.multiplier for e in candidate.entries[1:]])
+        exact = evaluate_paytable(candidate)
+        assert rtp == pytest.approx(exact.rtp)
+        assert hit_frequency == pytest.approx(exact.hit_frequency)
+        assert volatility == pytest.approx(math.sqrt(exact.variance))
+
+
+def test_tune_meets_targets(tmp_path):
+    targets = TuningTargets(rtp=0.94, hit_frequency=0.30)
+    result = PaytableTuner(Paytable.default(), seed=0).tune(targets)
+    assert result.met
+    assert abs(result.evaluation.rtp - 0.94) <= targets.rtp_tolerance
+    assert abs(result.evaluation.hit_frequency - 0.30) <= targets.hit_frequency_tolerance
+
+    # the emitted config is a regular paytable file
+    path = str(tmp_path / "tuned.json")
+    result.paytable.save(path)
+    assert evaluate_paytable(Paytable.load(path)).rtp == pytest.approx(result.evaluation.rtp)
+
+
+def test_tune_with_fixed_multipliers():
+    paytable = Paytable.default()
+    result = PaytableTuner(paytable, tune_multipliers=False, seed=1).tune(TuningTargets(rtp=1.2, rtp_tolerance=0.005))
+    assert result.met
+    assert [e.multiplier for e in result.paytable.entries[1:]] == [e.multiplier for e in paytable.entries[1:]]
+
+
+def test_tune_meets_volatility_target():
+    targets = TuningTargets(rtp=0.94, hit_frequency=0.22, volatility=5.0)
+    result = PaytableTuner(Paytable.default(), seed=0).tune(targets)
+    assert result.met
+    assert abs(math.sqrt(result.evaluation.variance) - 5.0) <= targets.volatility_tolerance
+    assert abs(result.evaluation.rtp - 0.94) <= targets.rtp_tolerance
+
+
+def test_candidate_budget():
+    # impossible targets, so every candidate is tried (speed is reported, not asserted: it depends on the machine)
+    result = PaytableTuner(Paytable.default(), seed=2).tune(TuningTargets(rtp=0.9, hit_frequency=0.9), max_candidates=5000)
+    assert not result.met
+    assert result.candidates == 5000
+    assert result.candidates_per_second > 0
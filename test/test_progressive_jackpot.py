@@ -0,0 +1,83 @@
+import threading
+
+import pytest
+
+from ..imports import *
+from ..BALANCE.PlayerBalance import BalanceManager
+from ..GAME.ProgressiveJackpot import ProgressiveJackpot
+from ..GAME.SlotMachine import *
+
+
+class DummyPlayer:
+    """ HumanPlayer (just needs get_name()) """
+    def __init__(self, name: str):
+        self._name = name
+
+    def get_name(self) -> str:
+        return self._name
+
+
+@pytest.fixture(autouse=True)
+def reset_singletons():
+    SlotMachine._SlotMachine__instance = None
+    ProgressiveJackpot._ProgressiveJackpot__instance = None
+    bm = BalanceManager()
+    bm.balances.clear()
+    bm.observers.clear()
+    bm.player_observers.clear()
+    yield
+    ProgressiveJackpot._ProgressiveJackpot__instance = None
+
+
+def test_contributions_from_all_machines_and_clones():
+    '''
+    Tests that concurrent contributions from several machines (and clones) all reach the pool
+    '''
+    util = SlotMachineUtility()
+    clone = util.clone()
+    assert clone.jackpot_meter is not util.jackpot_meter
+    assert clone.jackpot_meter.pool is util.jackpot_meter.pool
+
+    meters = [util.jackpot_meter, clone.jackpot_meter, ProgressiveJackpot().meter()]
+
+    def spin_many(meter):
+        for _ in range(1000):
+            meter.contribute(10)
+
+    threads = [threading.Thread(target=spin_many, args=(meter,)) for meter in meters for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    pool = ProgressiveJackpot()
+    # 6000 spins of $10 at 1%
+    assert pool.amount() == pytest.approx(700 + 600)
+    assert pool.award() == pytest.approx(1300)
+    assert pool.amount() == pytest.approx(700)
+
+
+def test_jackpot_pays_the_pool(monkeypatch):
+    util = SlotMachineUtility()
+    monkeypatch.setattr(util.slot_machine, "spin_reels", lambda: ['(  7  )']*3)
+    pool = ProgressiveJackpot()
+    pool._merge(5000)  # $50 already contributed
+
+    result, msgs = util.slot_machine.play_round(DummyPlayer("Lucky"), meter=util.jackpot_meter)
+    assert result.win_amount == pytest.approx(750.10)
+    assert "PROGRESSIVE JACKPOT" in result.outcome_text
+    assert BalanceManager().get_balance(player=DummyPlayer("Lucky")) == pytest.approx(1000 - 10 + 750.10)
+    assert pool.amount() == 700
+
+
+def test_pool_is_persisted(tmp_path):
+    path = str(tmp_path / "jackpot.json")
+    pool = ProgressiveJackpot()
+    pool.attach_file(path)
+    meter = pool.meter()
+    meter.contribute(10, spins=ProgressiveJackpot.MERGE_EVERY)
+
+    ProgressiveJackpot._ProgressiveJackpot__instance = None
+    restored = ProgressiveJackpot()
+    restored.attach_file(path)
+    assert restored.amount() == pytest.approx(700 + 0.1 * ProgressiveJackpot.MERGE_EVERY)
@@ -0,0 +1,32 @@
+import random
+
+from ..imports import *
+from ..GAME.ReelSampler import ReelSampler
+
+import pytest
+
+
+def test_alias_table_reproduces_weights():
+    weights = [0.7, 0.125, 0.125, 0.025, 0.025]
+    sampler = ReelSampler(weights, rng=random.Random(3), buffer_size=1000)
+    draws = sampler.sample_many(200_000)
+    for stop, weight in enumerate(weights):
+        assert draws.count(stop) / len(draws) == pytest.approx(weight, abs=0.005)
+
+
+def test_alias_table_is_exact():
+    """
+    Tests that the probability encoded in the tables equals each normalised weight
+    """
+    weights = [3, 0, 1, 4]
+    sampler = ReelSampler(weights)
+    n = len(weights)
+    probability = [0.0] * n
+    for column in range(n):
+        probability[column] += sampler._threshold[column] / n
+        probability[sampler._alias[column]] += (1 - sampler._threshold[column]) / n
+    assert probability == pytest.approx([w / sum(weights) for w in weights])
+
+
+def test_single_stop():
+    assert ReelSampler([2.0]).sample_many(5) == [0] * 5
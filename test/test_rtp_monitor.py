@@ -0,0 +1,112 @@
+import random
+import statistics
+
+import pytest
+
+from ..imports import *
+from ..BALANCE.PlayerBalance import BalanceManager
+from ..GAME.ProgressiveJackpot import ProgressiveJackpot
+from ..GAME.RtpMonitor import RtpMonitor, RtpMonitors
+from ..GAME.SlotEvaluator import evaluate_paytable
+from ..GAME.SlotMachine import *
+
+
+class DummyPlayer:
+    """ HumanPlayer (needs get_name() and get_state()) """
+    def __init__(self, name: str, roles=None):
+        self._name = name
+        self._state = {"roles": roles} if roles else {}
+
+    def get_name(self) -> str:
+        return self._name
+
+    def get_state(self, key: str):
+        return self._state.get(key)
+
+
+class Theory:
+    def __init__(self, rtp: float, variance: float):
+        self.rtp = rtp
+        self.variance = variance
+
+
+@pytest.fixture(autouse=True)
+def reset_singletons():
+    SlotMachine._SlotMachine__instance = None
+    ProgressiveJackpot._ProgressiveJackpot__instance = None
+    RtpMonitors._RtpMonitors__instance = None
+    bm = BalanceManager()
+    bm.balances.clear()
+    bm.observers.clear()
+    bm.player_observers.clear()
+    yield
+
+
+def test_welford_statistics():
+    rng = random.Random(4)
+    payouts = [rng.choice([0, 0, 0, 2, 10]) for _ in range(500)]
+    monitor = RtpMonitor("test")
+    for payout in payouts:
+        monitor.record(payout, jackpot=payout == 10)
+    assert monitor.spins == 500
+    assert monitor.jackpots == payouts.count(10)
+    assert monitor.mean == pytest.approx(statistics.mean(payouts))
+    assert monitor.variance == pytest.approx(statistics.variance(payouts))
+
+
+def test_alert_on_drift_only_once():
+    alerts = []
+    monitor = RtpMonitors().register("broken", lambda: Theory(0.95, 4.0))
+    RtpMonitors().add_alert_listener(alerts.append)
+    # a machine paying 1.2 on average, with the theoretical spread
+    rng = random.Random(1)
+    for _ in range(5000):
+        monitor.record(rng.choice([0.0, 2.4]))
+    assert monitor.drifting
+    assert len(alerts) == 1
+    assert alerts[0].machine == "broken"
+    assert alerts[0].spins >= RtpMonitor.MIN_SPINS
+    assert abs(alerts[0].observed_rtp - 0.95) > alerts[0].bound
+    assert list(RtpMonitors().alerts) == alerts
+
+
+def test_no_alert_for_correct_machine():
+    sm = SlotMachine(spin_cost=10)
+    theory = evaluate_paytable(sm.paytable)
+    alerts = []
+    sm.rtp_monitor.add_alert_listener(alerts.append)
+    for _ in range(20000):
+        sm.monitored_spin()
+    assert sm.rtp_monitor.spins == 20000
+    assert sm.rtp_monitor.expected() == (pytest.approx(theory.rtp), pytest.approx(theory.variance))
+    assert not alerts
+
+
+def test_play_round_and_auto_spin_are_monitored(monkeypatch):
+    sm = SlotMachine(spin_cost=10)
+    monkeypatch.setattr(sm, "spin_reels", lambda: ['(  7  )']*3)
+    meter = ProgressiveJackpot().meter()
+    sm.play_round(DummyPlayer("Mon"), meter=meter)
+    sm.auto_spin(DummyPlayer("Mon"), 5)
+    # the paytable's 70x is recorded, not the progressive pool
+    assert sm.rtp_monitor.spins == 2
+    assert sm.rtp_monitor.jackpots == 2
+    assert sm.rtp_monitor.mean == pytest.approx(70)
+
+
+def test_rtp_command_is_admin_only():
+    from ..COMMANDS.RtpCommand import RtpCommand
+    assert RtpCommand.matches("rtp")
+    sm = SlotMachine(spin_cost=10)
+    sm.monitored_spin()
+
+    msgs = RtpCommand().execute("rtp", None, DummyPlayer("Guest"))
+    assert "Only admins" in msgs[0]._get_data().get("text", "")
+    # a player who merely calls themselves admin has no role
+    msgs = RtpCommand().execute("rtp", None, DummyPlayer("admin"))
+    assert "Only admins" in msgs[0]._get_data().get("text", "")
+
+    msgs = RtpCommand().execute("rtp", None, DummyPlayer("Operator", roles=["casino_admin"]))
+    text = msgs[0]._get_data().get("text", "")
+    assert "classic: 1 spins" in text
+    assert "warming up" in text
@@ -0,0 +1,29 @@
+from ..imports import *
+from ..GAME.SlotEvaluator import evaluate
+from ..GAME.SlotMachine import StandardStrategyWithWheel, JackpotStrategy
+
+import pytest
+
+
+P_TRIPLE = 0.7 ** 3 + 2 * 0.125 ** 3 + 2 * 0.025 ** 3
+P_JACKPOT = 0.025 ** 3
+
+
+def test_default_machine_is_evaluated_exactly():
+    result = evaluate(spin_cost=10)
+    # three of a kind pays 10x the cost times x1/x2/x3, except 7-7-7 which pays 70x
+    assert result.distribution[100] == pytest.approx((P_TRIPLE - P_JACKPOT) / 3)
+    assert result.distribution[700] == pytest.approx(P_JACKPOT)
+    assert sum(result.distribution.values()) == pytest.approx(1.0)
+    assert result.rtp == pytest.approx((P_TRIPLE - P_JACKPOT) * 20 + P_JACKPOT * 70)
+    assert result.house_edge == pytest.approx(1 - result.rtp)
+    assert result.hit_frequency == pytest.approx(P_TRIPLE)
+
+
+def test_single_strategy_and_cache():
+    uniform = [1, 1, 1, 1, 1]
+    jackpot_only = evaluate(weights=uniform, strategy=JackpotStrategy())
+    assert jackpot_only.rtp == pytest.approx(70 / 125)
+    assert jackpot_only.variance == pytest.approx(70 ** 2 / 125 - (70 / 125) ** 2)
+
+    assert evaluate(weights=uniform, strategy=StandardStrategyWithWheel()) is evaluate(weights=uniform, strategy=StandardStrategyWithWheel())
@@ -0,0 +1,34 @@
+from ..imports import *
+from ..GAME.SlotSimulator import SlotSimulator, SimulationReport
+
+import pytest
+
+
+# exact figures for the default reels: P(three of a kind) and P(jackpot)
+P_TRIPLE = 0.7 ** 3 + 2 * 0.125 ** 3 + 2 * 0.025 ** 3
+P_JACKPOT = 0.025 ** 3
+EXACT_RTP = (P_TRIPLE - P_JACKPOT) * 10 * 2 + P_JACKPOT * 70
+
+
+def test_report_statistics():
+    report = SimulationReport(4, {0: 2, 10: 1, 70: 1}, jackpots=1)
+    assert report.rtp == 20
+    assert report.hit_frequency == 0.5
+    assert report.jackpot_frequency == 0.25
+    assert report.variance == pytest.approx(sum((x - 20) ** 2 for x in [0, 0, 10, 70]) / 3)
+    assert "Return to player" in report.summary()
+
+
+def test_python_simulation_matches_exact_odds():
+    report = SlotSimulator(seed=7, batch_size=50_000, use_numpy=False).run(200_000)
+    assert report.spins == sum(report.payout_counts.values()) == 200_000
+    assert report.rtp_ci[0] < EXACT_RTP < report.rtp_ci[1]
+    assert report.hit_frequency_ci[0] < P_TRIPLE < report.hit_frequency_ci[1]
+    assert set(report.payout_counts) <= {0, 10, 20, 30, 70}
+
+
+def test_numpy_simulation_matches_exact_odds():
+    pytest.importorskip("numpy")
+    report = SlotSimulator(seed=7).run(2_000_000)
+    assert report.rtp_ci[0] < EXACT_RTP < report.rtp_ci[1]
+    assert report.jackpot_frequency_ci[0] < P_JACKPOT < report.jackpot_frequency_ci[1]
@@ -6,6 +6,7 @@ from ..DJbooth.DJ import DJ
 #from CasinoRoyale.CasinoRoom import CasinoRoom
 from ..BALANCE.PlayerBalance import BalanceManager, BalanceChangeReason
 from ..GAME.SlotMachine import *
+from ..GAME.ProgressiveJackpot import ProgressiveJackpot
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from coord import Coord
@@ -25,10 +26,12 @@ class DummyPlayer:
 def reset_singletons():
     # Reset SlotMachine singleton
     SlotMachine._SlotMachine__instance = None
+    ProgressiveJackpot._ProgressiveJackpot__instance = None
     # Reset BalanceManager state
     bm = BalanceManager()
     bm.balances.clear()
     bm.observers.clear()
+    bm.player_observers.clear()
     yield
 
 
@@ -135,3 +138,132 @@ def test_slotmachine_utility_clone():
     assert clone is not util
     # but same spin_cost on their slot_machine
     assert clone.slot_machine.spin_cost == util.slot_machine.spin_cost
+
+
+def test_spin_is_pure(monkeypatch):
+    '''
+    Tests that spin() returns an immutable result and leaves balances and the machine untouched
+    '''
+    sm = SlotMachine(spin_cost=10)
+    monkeypatch.setattr(sm, "spin_reels", lambda: ['(  7  )']*3)
+    strategy = sm.strategy
+    result = sm.spin()
+    assert result == SpinResult(('(  7  )',)*3, 700, "JACKPOT HIT!!", BalanceChangeReason.JACKPOT)
+    with pytest.raises(AttributeError):
+        result.win_amount = 0
+    assert sm.strategy is strategy
+    assert BalanceManager().balances.get("P") is None
+
+
+def test_play_round_is_reentrant():
+    '''
+    Tests that concurrent rounds for different players keep their messages and balances apart
+    '''
+    from concurrent.futures import ThreadPoolExecutor
+    sm = SlotMachine(spin_cost=10)
+    players = [DummyPlayer(f"T{i}") for i in range(8)]
+
+    def play(player):
+        results = [sm.play_round(player) for _ in range(50)]
+        return player, results
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        outcomes = list(pool.map(play, players))
+
+    bm = BalanceManager()
+    for player, results in outcomes:
+        expected = 1000
+        for result, msgs in results:
+            assert result is not None
+            expected += result.win_amount - 10
+            assert any("Reels: " + "  ".join(result.reels) in m._get_data().get("dialogue_text", "") for m in msgs)
+        assert bm.get_balance(player=player) == expected
+
+
+def test_slotmachine_utility_clone_shares_machine():
+    util = SlotMachineUtility(spin_cost=7)
+    assert util.clone().slot_machine is util.slot_machine
+
+
+def test_auto_spin_settles_once(monkeypatch):
+    '''
+    Tests that an autospin run is settled as one net change with one observer notification
+    '''
+    sm = SlotMachine(spin_cost=10)
+    p = DummyPlayer("Auto")
+    spins = iter([['(  <3  )', '(  :p  )', '( ~*~ )']] * 3 + [['(  <3  )']*3])
+    monkeypatch.setattr(sm, "spin_reels", lambda: next(spins))
+    monkeypatch.setattr(random, "choice", lambda seq: 1)
+    notifications = []
+
+    class Counter(BalanceObserver):
+        def update_balance(self, new_balance, change, reason=None):
+            notifications.append((change, reason))
+            return []
+
+    bm = BalanceManager()
+    bm.register_observer(Counter())
+    result, msgs = sm.auto_spin(p, 4)
+    assert (result.spins, result.wins, result.wagered, result.won, result.stop_reason) == (4, 1, 40, 100, None)
+    assert notifications == [(60.0, BalanceChangeReason.WIN)]
+    assert bm.get_balance(player=p) == 1060.0
+
+
+def test_auto_spin_stops_on_loss_limit_and_funds():
+    sm = SlotMachine(spin_cost=10)
+    sm_reels = ['(  <3  )', '(  :p  )', '( ~*~ )']
+    sm.spin_reels = lambda: list(sm_reels)
+    p = DummyPlayer("Limit")
+    result, _ = sm.auto_spin(p, 100, loss_limit=35)
+    assert (result.spins, result.stop_reason) == (4, "loss limit")
+
+    BalanceManager().balances["Broke"] = 25.0
+    result, _ = sm.auto_spin(DummyPlayer("Broke"), 100)
+    assert (result.spins, result.stop_reason) == (2, "insufficient funds")
+    assert BalanceManager().get_balance(player=DummyPlayer("Broke")) == 5.0
+    del sm.spin_reels
+
+
+def test_autospin_command(monkeypatch):
+    from ..COMMANDS.AutoSpinCommand import AutoSpinCommand
+    assert AutoSpinCommand.matches("autospin/50")
+    assert AutoSpinCommand.matches("autospin/50/200")
+    assert not AutoSpinCommand.matches("autospin")
+    assert not AutoSpinCommand.matches("autospin/x")
+
+    sm = SlotMachine(spin_cost=10)
+    monkeypatch.setattr(sm, "spin_reels", lambda: ['(  7  )']*3)
+    class CommandPlayer(DummyPlayer):
+        # the command's dialogue messages are sent by the player, as for BarCommand
+        def get_image_name(self) -> str:
+            return "player"
+
+    msgs = AutoSpinCommand().execute("autospin/20", None, CommandPlayer("Cmd"))
+    text = msgs[-1]._get_data().get("text", "")
+    assert "Autospin: 1 spins, 1 wins, 1 jackpots" in text
+    assert "Stopped early: jackpot" in text
+    assert "Current balance: $1690.00" in text
+
+
+def test_autospin_late_jackpot_with_net_loss(monkeypatch):
+    '''
+    Tests that a jackpot after a long losing streak settles as a net loss and still reports the jackpot
+    '''
+    from ..COMMANDS.AutoSpinCommand import AutoSpinCommand
+    sm = SlotMachine(spin_cost=10)
+    spins = iter([['(  <3  )', '(  :p  )', '( ~*~ )']] * 80 + [['(  7  )'] * 3])
+    monkeypatch.setattr(sm, "spin_reels", lambda: next(spins))
+    class CommandPlayer(DummyPlayer):
+        def get_image_name(self) -> str:
+            return "player"
+    player = CommandPlayer("Late")
+    pool = ProgressiveJackpot().amount()
+
+    msgs = AutoSpinCommand().execute("autospin/100", None, player)
+    text = msgs[-1]._get_data().get("text", "")
+    assert "Autospin: 81 spins, 1 wins, 1 jackpots" in text
+    assert "JACKPOT HIT!!" in text and "net -$" in text
+    assert BalanceManager().get_balance(player=player) < 1000
+    # the run's contributions reached the pool after it was awarded and reseeded
+    assert ProgressiveJackpot().amount() > ProgressiveJackpot().seed
+    assert pool >= ProgressiveJackpot().seed
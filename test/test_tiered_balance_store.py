@@ -0,0 +1,83 @@
+import pytest
+
+from ..imports import *
+from ..BALANCE.BalanceStore import BalanceStore
+from ..BALANCE.PlayerBalance import BalanceManager, BalanceChangeReason
+from ..BALANCE.TieredBalanceStore import TieredBalanceStore
+
+
+class DummyPlayer:
+    """ HumanPlayer (just needs get_name())."""
+    def __init__(self, name: str):
+        self._name = name
+
+    def get_name(self) -> str:
+        return self._name
+
+
+@pytest.fixture(autouse=True)
+def reset_balance_manager():
+    bm = BalanceManager()
+    bm.balances.clear()
+    bm.observers.clear()
+    bm.player_observers.clear()
+    yield
+    bm.balances.clear()
+    bm.use_store(BalanceStore())
+
+
+def test_cold_players_spill_and_reload(tmp_path):
+    """
+    Tests that only hot_capacity players stay in memory and cold ones are reloaded on access
+    """
+    store = TieredBalanceStore(str(tmp_path / "balances.db"), hot_capacity=2)
+    for i in range(5):
+        store[f"p{i}"] = 100.0 + i
+    store.add_cents("p4", 50)
+
+    assert len(store.hot) == 2
+    assert len(store) == 5
+    assert "p0" in store and "nobody" not in store
+    assert [store[f"p{i}"] for i in range(5)] == [100.0, 101.0, 102.0, 103.0, 104.5]
+    assert len(store.hot) == 2
+    assert store.total_cents() == 51050
+
+    del store["p1"]
+    assert "p1" not in store
+    assert sorted(store) == ["p0", "p2", "p3", "p4"]
+    store.close()
+
+    reopened = TieredBalanceStore(str(tmp_path / "balances.db"), hot_capacity=2)
+    assert reopened["p4"] == 104.5
+    reopened.close()
+
+
+def test_balance_manager_on_tiered_store(tmp_path):
+    """
+    Tests that balances, the leaderboard and histories work with players moving between tiers
+    """
+    bm = BalanceManager()
+    bm.increase_balance(5, BalanceChangeReason.WIN, player=DummyPlayer("Early"))
+    store = TieredBalanceStore(str(tmp_path / "balances.db"), hot_capacity=3)
+    bm.use_store(store)
+
+    players = [DummyPlayer(f"Player{i}") for i in range(10)]
+    for i, player in enumerate(players):
+        bm.increase_balance(i, BalanceChangeReason.WIN, player=player)
+
+    assert len(store.hot) == 3
+    assert sum(key.startswith("Player") for key in bm.histories) <= 3
+    assert bm.get_balance(player=DummyPlayer("Early")) == 1005.0
+    assert bm.get_balance(player=players[0]) == 1000.0
+    assert bm.get_top_balances(2) == [("Player9", 1009.0), ("Player8", 1008.0)]
+    assert bm.get_rank(player=DummyPlayer("Early")) == 5
+
+    # the ranking is read from SQLite: no per-player leaderboard entries are kept in memory
+    assert bm.leaderboard is store and not store._indexes
+    assert len(bm.leaderboard) == 11
+    assert store.top(1) == [("Player9", 100900)]
+    assert store.rank_of("nobody") is None
+
+    bm.use_store(BalanceStore())
+    assert bm.get_top_balances(1) == [("Player9", 1009.0)]
+    store.close()